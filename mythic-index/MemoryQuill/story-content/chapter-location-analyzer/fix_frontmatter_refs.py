@@ -18,6 +18,7 @@ Usage:
 """
 
 import re
+import sys
 from pathlib import Path
 
 import typer
@@ -33,6 +34,8 @@ STORY_CONTENT_DIR = SCRIPT_DIR.parent
 CHAPTERS_DIR = STORY_CONTENT_DIR / "chapters"
 CHARACTERS_DIR = STORY_CONTENT_DIR / "characters"
 LOCATIONS_DIR = STORY_CONTENT_DIR / "locations"
+# mythic-index/tools, for the storylint helpers shared by the maintenance scripts
+TOOLS_DIR = STORY_CONTENT_DIR.resolve().parents[1] / "tools"
 
 # Known corrections: partial/wrong slug -> correct full slug
 CHARACTER_CORRECTIONS = {
@@ -301,11 +304,33 @@ def main(
         show_unmapped_refs(chapters, existing_characters, existing_locations)
 
 
+def open_scene_index():
+    """storylint's SQLite scene index for STORY_CONTENT_DIR, or None if storylint_adk can't be imported."""
+    if str(TOOLS_DIR) not in sys.path:
+        sys.path.insert(0, str(TOOLS_DIR))
+    from storylint_helpers import open_scene_index as open_index
+
+    return open_index(STORY_CONTENT_DIR)
+
+
 def show_unmapped_refs(chapters: list[Path], existing_characters: set, existing_locations: set):
     """Show references that couldn't be mapped to existing entities."""
     unmapped_chars = set()
     unmapped_locs = set()
 
+    index = open_scene_index()
+    if index is not None:
+        # Frontmatter refs are indexed per chapter; the refresh picks up files written above.
+        names = {chapter_path.name for chapter_path in chapters}
+        for kind, corrections, existing, unmapped in (
+            ("character", CHARACTER_CORRECTIONS, existing_characters, unmapped_chars),
+            ("location", LOCATION_CORRECTIONS, existing_locations, unmapped_locs),
+        ):
+            for ref, ref_chapters in index.frontmatter_refs(kind, top_level=True).items():
+                if names.intersection(ref_chapters) and corrections.get(ref, ref) not in existing:
+                    unmapped.add(ref)
+        chapters = []
+
     for chapter_path in chapters:
         content_file = chapter_path / "content.md"
         if not content_file.exists():
@@ -47,6 +47,9 @@ from loguru import logger
 SCRIPT_DIR = Path(__file__).parent
 DEFAULT_STORY_CONTENT_DIR = SCRIPT_DIR.parent
 
+# libyaml's loader when PyYAML was built with it (same documents, ~10x faster)
+YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 
 class Stage(str, Enum):
     ANALYST = "analyst"
@@ -141,7 +144,7 @@ def parse_frontmatter(content: str) -> tuple[dict, str]:
 
     if match:
         try:
-            frontmatter = yaml.safe_load(match.group(1)) or {}
+            frontmatter = yaml.load(match.group(1), Loader=YAML_LOADER) or {}
             body = match.group(2)
         except yaml.YAMLError as e:
             logger.warning(f"Failed to parse frontmatter: {e}")
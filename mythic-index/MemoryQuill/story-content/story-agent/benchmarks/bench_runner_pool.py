@@ -0,0 +1,69 @@
+"""Micro-benchmark: per-call ADK setup overhead with and without the runner pool.
+
+Measures only what run_agent_prompt does around the model call (session service,
+session and Runner construction), so it needs google-adk but no API key.
+
+    python benchmarks/bench_runner_pool.py --calls 500
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+from uuid import uuid4
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from google.adk.runners import Runner  # noqa: E402
+from google.adk.sessions import InMemorySessionService  # noqa: E402
+
+from storylint_adk.agents.chapter_auditor import build_chapter_audit_agent  # noqa: E402
+from storylint_adk.runtime.adk_client import AgentRunnerPool  # noqa: E402
+
+USER_ID = "storylint"
+
+
+async def _per_call_setup(calls: int, model: str) -> None:
+    agent = build_chapter_audit_agent(model)
+    for _ in range(calls):
+        session_service = InMemorySessionService()
+        session_id = uuid4().hex
+        await session_service.create_session(app_name=agent.name, user_id=USER_ID, session_id=session_id)
+        Runner(agent=agent, app_name=agent.name, session_service=session_service)
+
+
+async def _pooled_setup(calls: int, model: str) -> None:
+    pool = AgentRunnerPool()
+    for _ in range(calls):
+        agent = pool.agent(build_chapter_audit_agent, model)
+        pooled = pool.runner_for(agent)
+        session_id = uuid4().hex
+        await pooled.session_service.create_session(app_name=agent.name, user_id=USER_ID, session_id=session_id)
+        await pooled.session_service.delete_session(app_name=agent.name, user_id=USER_ID, session_id=session_id)
+
+
+def _measure(label: str, fn, calls: int, model: str) -> None:
+    tracemalloc.start()
+    started = time.perf_counter()
+    asyncio.run(fn(calls, model))
+    elapsed = time.perf_counter() - started
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    per_call_us = elapsed / calls * 1e6
+    print(f"{label:<10} {calls:>6} calls  {per_call_us:>9.1f} us/call  peak {peak / 1024:>8.1f} KiB")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--calls", type=int, default=500)
+    parser.add_argument("--model", default="gemini-3-flash-preview")
+    args = parser.parse_args()
+    _measure("per-call", _per_call_setup, args.calls, args.model)
+    _measure("pooled", _pooled_setup, args.calls, args.model)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+"""pytest-benchmark suite for chapter parsing.
+
+    pytest benchmarks/test_parser_bench.py --benchmark-group-by=group
+
+Compares the single-pass parser with the line-by-line reference on the real
+manuscript (when present) and on synthetic corpora from ``CorpusSpec.scaled``.
+The ``prepare`` groups time parsing plus validation with 1..8 worker processes;
+read the speedup curve off the group's relative column.
+"""
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+from storylint_adk.config import StorylintConfig  # noqa: E402
+from storylint_adk.parser.linewise import parse_chapter_linewise, parse_scene_meta_linewise  # noqa: E402
+from storylint_adk.parser.scene_parser import parse_chapter, parse_scene_meta  # noqa: E402
+from storylint_adk.runtime.prepare import prepare_chapters  # noqa: E402
+from storylint_adk.tools.synthetic import CorpusSpec  # noqa: E402
+
+STORY_CONTENT = Path(__file__).resolve().parents[2]
+PARSERS = {"single-pass": parse_chapter, "linewise": parse_chapter_linewise}
+
+
+def _config(root: Path) -> StorylintConfig:
+    return StorylintConfig(project_root=root, chapters_dir=root, characters_dir=root, locations_dir=root)
+
+
+def _parse_all(parser, paths, cfg):
+    return [parser(path, cfg) for path in paths]
+
+
+@pytest.mark.parametrize("parser", sorted(PARSERS))
+def test_real_manuscript(benchmark, parser: str) -> None:
+    paths = sorted(STORY_CONTENT.glob("chapters/*/content.md"))
+    if not paths:
+        pytest.skip("manuscript chapters are not part of this checkout")
+    benchmark.group = "real manuscript"
+    benchmark(_parse_all, PARSERS[parser], paths, _config(STORY_CONTENT))
+
+
+@pytest.mark.parametrize("scale", [1, 10])
+@pytest.mark.parametrize("parser", sorted(PARSERS))
+def test_synthetic_corpus(benchmark, synthetic_corpus, parser: str, scale: int) -> None:
+    root = synthetic_corpus(CorpusSpec.scaled(scale, images_per_character=0, images_per_location=0)).root
+    paths = sorted(root.glob("chapters/*/content.md"))
+    benchmark.group = f"synthetic x{scale}"
+    benchmark.pedantic(_parse_all, args=(PARSERS[parser], paths, _config(root)), rounds=3, iterations=1)
+
+
+@pytest.mark.parametrize("scale", [1, 10])
+@pytest.mark.parametrize("workers", [1, 2, 4, 8])
+def test_prepare_workers(benchmark, synthetic_corpus, workers: int, scale: int) -> None:
+    root = synthetic_corpus(CorpusSpec.scaled(scale, images_per_character=0, images_per_location=0)).root
+    cfg = StorylintConfig(
+        project_root=root,
+        chapters_dir=Path("chapters"),
+        characters_dir=Path("characters"),
+        locations_dir=Path("locations"),
+    )
+    cfg.cache.persist_chapters = False
+    paths = sorted(root.glob("chapters/*/content.md"))
+    benchmark.group = f"prepare x{scale}"
+    benchmark.extra_info["workers"] = workers
+    benchmark.pedantic(prepare_chapters, args=(paths, cfg, workers), rounds=3, iterations=1)
+
+
+@pytest.mark.parametrize("keys", [10, 1000])
+@pytest.mark.parametrize("parser", ["single-pass", "linewise"])
+def test_scene_metadata(benchmark, parser: str, keys: int) -> None:
+    meta = "<!-- SCENE-START id:scn-01-01\n" + "".join(f' note{i}:"value {i}" list{i}:["a","b"]\n' for i in range(keys)) + "-->"
+    benchmark.group = f"metadata {keys} keys"
+    benchmark({"single-pass": parse_scene_meta, "linewise": parse_scene_meta_linewise}[parser], meta)
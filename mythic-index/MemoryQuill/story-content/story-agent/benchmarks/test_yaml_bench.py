@@ -0,0 +1,93 @@
+"""pytest-benchmark suite for imagery YAML loading.
+
+    pytest benchmarks/test_yaml_bench.py --benchmark-group-by=group
+
+Times the pure-Python ``SafeLoader``, libyaml's ``CSafeLoader`` and a warm
+``YamlCache`` on the largest imagery files in story-content (when present) and
+on a generated imagery document of the same shape.
+"""
+from __future__ import annotations
+
+from pathlib import Path
+from typing import List
+
+import pytest
+import yaml
+
+pytest.importorskip("pytest_benchmark")
+
+from storylint_adk.parser.yaml_cache import SafeLoader, YamlCache  # noqa: E402
+
+STORY_CONTENT = Path(__file__).resolve().parents[2]
+LARGEST_FILES = 8
+LOADERS = ["python", "libyaml", "cached"]
+
+
+def _largest_imagery_files() -> List[Path]:
+    paths = [
+        path
+        for folder in ("chapters", "characters", "locations")
+        for path in (STORY_CONTENT / folder).glob("*/*imagery*.yaml")
+    ]
+    return sorted(paths, key=lambda path: path.stat().st_size, reverse=True)[:LARGEST_FILES]
+
+
+def _imagery_document(images: int) -> dict:
+    return {
+        "entity_type": "character",
+        "slug": "bench-subject",
+        "generated_images": [
+            {
+                "custom_id": f"bench-subject-{i:04d}",
+                "file_name": f"image-{i:04d}.png",
+                "file_path": f"images/image-{i:04d}.png",
+                "prompt_used": "Portrait in warm lantern light, weathered leather, " * 6,
+                "provider": "imagen",
+                "size": "1024x1024",
+                "provider_metadata": {"seed": i, "steps": 30, "tags": ["portrait", "lantern", "ward"]},
+            }
+            for i in range(images)
+        ],
+    }
+
+
+def _loader(name: str, cache_root: Path):
+    if name == "cached":
+        cache = YamlCache(cache_root)
+        return cache.load
+    loader = yaml.SafeLoader if name == "python" else SafeLoader
+    return lambda path: yaml.load(path.read_bytes(), Loader=loader)
+
+
+def _load_all(load, paths: List[Path]) -> list:
+    return [load(path) for path in paths]
+
+
+@pytest.mark.parametrize("loader", LOADERS)
+def test_largest_imagery_files(benchmark, tmp_path: Path, loader: str) -> None:
+    paths = [path for path in _largest_imagery_files() if _parses(path)]
+    if not paths:
+        pytest.skip("imagery files are not part of this checkout")
+    load = _loader(loader, tmp_path)
+    _load_all(load, paths)  # fills the cache, and the OS page cache for every loader
+    benchmark.group = f"largest {len(paths)} imagery files"
+    benchmark.extra_info["bytes"] = sum(path.stat().st_size for path in paths)
+    benchmark.pedantic(_load_all, args=(load, paths), rounds=3, iterations=1)
+
+
+@pytest.mark.parametrize("loader", LOADERS)
+def test_generated_imagery_file(benchmark, tmp_path: Path, loader: str) -> None:
+    path = tmp_path / "imagery.yaml"
+    path.write_text(yaml.safe_dump(_imagery_document(500), sort_keys=False))
+    load = _loader(loader, tmp_path / "cache")
+    assert load(path) == _imagery_document(500)
+    benchmark.group = "generated imagery file"
+    benchmark(load, path)
+
+
+def _parses(path: Path) -> bool:
+    try:
+        yaml.load(path.read_bytes(), Loader=SafeLoader)
+    except yaml.YAMLError:
+        return False
+    return True
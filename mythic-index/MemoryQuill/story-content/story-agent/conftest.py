@@ -0,0 +1,21 @@
+from dataclasses import astuple
+from typing import Callable, Dict, Tuple
+
+import pytest
+
+from storylint_adk.tools.synthetic import CorpusSpec, CorpusStats, generate_corpus
+
+
+@pytest.fixture(scope="session")
+def synthetic_corpus(tmp_path_factory) -> Callable[[CorpusSpec], CorpusStats]:
+    """Generate (once per session and spec) a synthetic story-content tree; shared by tests/ and benchmarks/."""
+    built: Dict[Tuple, CorpusStats] = {}
+
+    def build(spec: CorpusSpec) -> CorpusStats:
+        key = astuple(spec)
+        if key not in built:
+            built[key] = generate_corpus(tmp_path_factory.mktemp("corpus"), spec)
+        return built[key]
+
+    return build
+
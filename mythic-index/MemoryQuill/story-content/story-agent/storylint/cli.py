@@ -7,11 +7,13 @@ from typing import Any, Dict
 
 import typer
 
+from storylint_adk.runtime.ratelimit import configure_rate_limits
+
 from .canon import load_character_snapshots, load_location_snapshots
 from .config import load_config
 from .llm import LLMSettings, generate_with_retries, get_client
 from .models import ChapterReport
-from .parser import Chapter, parse_chapter
+from .parser import Chapter, load_chapter
 from .render import render_markdown, render_prompt
 from .storage import build_index, create_run_dir, new_run_id, write_json, write_text
 from .utils import truncate_text
@@ -32,7 +34,7 @@ def audit(
     cfg = load_config(config, start_dir=Path.cwd())
     chapter_path = chapter.resolve()
 
-    parsed = parse_chapter(chapter_path, cfg)
+    parsed = load_chapter(chapter_path, cfg)
     index = build_index(parsed)
 
     character_slugs = index["slugs"]["characters"]
@@ -53,6 +55,7 @@ def audit(
         },
     )
 
+    configure_rate_limits(cfg.rate_limits)
     settings = LLMSettings(provider=llm, model=model)
     client = get_client(settings)
     raw = generate_with_retries(client, prompt, settings)
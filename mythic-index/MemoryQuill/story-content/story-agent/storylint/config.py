@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Optional
 
 import yaml
 from pydantic import BaseModel, Field, model_validator
@@ -12,6 +12,11 @@ class PromptConfig(BaseModel):
     max_paragraphs: int = 40
 
 
+class RateLimitConfig(BaseModel):
+    rpm: Optional[int] = None
+    tpm: Optional[int] = None
+
+
 class StoryLintConfig(BaseModel):
     config_path: Optional[Path] = Field(default=None, exclude=True)
 
@@ -29,6 +34,7 @@ class StoryLintConfig(BaseModel):
     output_dir: Path = Path("runs")
     canon_snapshot_chars: int = 1200
     prompt: PromptConfig = Field(default_factory=PromptConfig)
+    rate_limits: Dict[str, RateLimitConfig] = Field(default_factory=dict)
 
     @model_validator(mode="after")
     def _resolve_paths(self) -> "StoryLintConfig":
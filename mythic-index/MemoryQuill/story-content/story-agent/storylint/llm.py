@@ -8,6 +8,8 @@ from typing import Protocol
 
 import httpx
 
+from storylint_adk.runtime.ratelimit import TokenUsage, estimate_tokens, get_rate_limiter
+
 
 class LLMError(RuntimeError):
     pass
@@ -28,6 +30,8 @@ class LLMSettings:
 
 
 class MockLLMClient:
+    last_usage: TokenUsage | None = None
+
     def generate(self, prompt: str) -> str:
         response = {
             "overall_quality": 3,
@@ -49,8 +53,11 @@ class OpenAIChatClient:
         self._api_key = api_key
         self._model = model
         self._timeout = timeout_sec
+        self.last_usage: TokenUsage | None = None
 
     def generate(self, prompt: str) -> str:
+        # Cleared first, so a failed request never reports the previous call's usage.
+        self.last_usage = None
         headers = {
             "Authorization": f"Bearer {self._api_key}",
             "Content-Type": "application/json",
@@ -71,6 +78,12 @@ class OpenAIChatClient:
             )
         response.raise_for_status()
         data = response.json()
+        usage = data.get("usage") or {}
+        self.last_usage = TokenUsage(
+            prompt_tokens=usage.get("prompt_tokens", 0),
+            output_tokens=usage.get("completion_tokens", 0),
+            total_tokens=usage.get("total_tokens", 0),
+        )
         try:
             return data["choices"][0]["message"]["content"]
         except (KeyError, IndexError) as exc:
@@ -86,10 +99,21 @@ def get_client(settings: LLMSettings) -> LLMClient:
 
 
 def generate_with_retries(client: LLMClient, prompt: str, settings: LLMSettings) -> str:
+    limiter = get_rate_limiter(settings.model)
+    estimated_tokens = estimate_tokens(prompt)
     last_error: Exception | None = None
     for attempt in range(settings.max_retries + 1):
         try:
-            return client.generate(prompt)
+            if limiter:
+                limiter.acquire_sync(estimated_tokens)
+            previous = getattr(client, "last_usage", None)
+            try:
+                return client.generate(prompt)
+            finally:
+                # Reconcile only with usage this attempt reported, never a stale value.
+                usage = getattr(client, "last_usage", None)
+                if limiter and usage is not None and usage is not previous:
+                    limiter.reconcile(estimated_tokens, usage.total_tokens)
         except (httpx.HTTPError, LLMError) as exc:
             last_error = exc
             if attempt >= settings.max_retries:
@@ -6,8 +6,13 @@ import json
 import re
 from typing import Any, Dict, List, Optional, Tuple
 
+from storylint_adk.parser.chapter_cache import ChapterCache, ChapterTypes
+
 from .config import StoryLintConfig
 
+# Same directory as storylint_adk's default cache.dir, so both CLIs reuse each other's entries.
+CACHE_DIRNAME = ".storylint-cache"
+
 
 @dataclass
 class Paragraph:
@@ -49,6 +54,12 @@ class Chapter:
     scenes: List[Scene]
 
 
+def load_chapter(path: Path, config: StoryLintConfig) -> Chapter:
+    cache = ChapterCache(config.project_root / CACHE_DIRNAME)
+    types = ChapterTypes(chapter=Chapter, scene=Scene, meta=SceneMeta, paragraph=Paragraph)
+    return cache.load(path, (config.scene_start, config.scene_end), lambda source: parse_chapter(source, config), types)
+
+
 def parse_chapter(path: Path, config: StoryLintConfig) -> Chapter:
     lines = path.read_text().splitlines()
     slug = path.parent.name
@@ -1 +1,11 @@
 """Agent builders for Storylint ADK."""
+from __future__ import annotations
+
+
+def llm_agent_class() -> type:
+    """ADK's ``LlmAgent``, imported on first use so the builders load without google-adk."""
+    try:
+        from google.adk.agents import LlmAgent
+    except ImportError:  # pragma: no cover
+        from google.adk.agents.llm_agent import LlmAgent
+    return LlmAgent
@@ -1,15 +1,16 @@
 from __future__ import annotations
 
-try:
-    from google.adk.agents import LlmAgent
-except ImportError:  # pragma: no cover
-    from google.adk.agents.llm_agent import LlmAgent
+from typing import TYPE_CHECKING, Optional
 
 from ..models import AdjacentReport
+from . import llm_agent_class
+
+if TYPE_CHECKING:
+    from google.adk.agents import LlmAgent
 
 
-def build_adjacent_flow_agent(model: str) -> LlmAgent:
-    return LlmAgent(
+def build_adjacent_flow_agent(model: str, agent_cls: Optional[type] = None) -> LlmAgent:
+    return (agent_cls or llm_agent_class())(
         name="AdjacentFlowAgent",
         model=model,
         description="Audits narrative flow between adjacent chapters.",
@@ -1,32 +1,27 @@
 from __future__ import annotations
 
-import asyncio
+import json
 import subprocess
 import sys
+import time
+from dataclasses import asdict
 from pathlib import Path
-from typing import Optional
+from typing import List, Optional
 
 import typer
 
-try:  # optional; no-op if missing
-    from dotenv import load_dotenv
-except ImportError:  # pragma: no cover
-    load_dotenv = None
-
-try:  # optional interactive prompts
-    import questionary
-except ImportError:  # pragma: no cover
-    questionary = None
-
-if load_dotenv:
-    load_dotenv()
-
-from .config import StorylintConfig, load_config, write_config
-from .runtime.runner import run_pipeline_sync, run_chapter_audit
+# Only modules every command needs are imported here. The agent stack (runner, ADK, genai),
+# dotenv, questionary and rich are imported by the commands and prompts that use them, so
+# offline commands such as `check`, `doctor` and `init` start quickly.
+from .config import CacheConfig, StorylintConfig, load_config, write_config
+from .runtime.check import FAIL_ON, check_json, check_sarif, check_text, run_check
 from .runtime.doctor import run_doctor
+from .runtime.telemetry import TELEMETRY_NAME, load_records, summarize, summary_table
 from .store.artifacts import ensure_run_dir, new_run_id, write_json, build_index
-from .parser.scene_parser import parse_chapter
+from .store.scene_index import SceneIndex
+from .parser.scene_parser import load_chapter
 from .tools.repo_tools import discover_repo_map, discover_chapters
+from .tools.synthetic import CorpusSpec, generate_corpus
 
 app = typer.Typer(add_completion=False)
 DEFAULT_AGENT_DIR = Path(__file__).resolve().parents[1] / "adk_project"
@@ -52,8 +47,11 @@ def main(ctx: typer.Context) -> None:
 def init(
     root: Path = typer.Option(Path.cwd(), "--root", help="Repository root to scan"),
     output: Path = typer.Option(Path("storylint.yaml"), "--output", help="Path to write storylint.yaml"),
+    rescan: bool = typer.Option(False, "--rescan", help="Ignore the saved scan of the repository"),
 ) -> None:
-    repo_map = discover_repo_map(root)
+    # The scan is saved in the cache of the config being written: the existing one's, or next to it.
+    cache = load_config(output).cache if output.exists() else CacheConfig(dir=output.resolve().parent / CacheConfig().dir)
+    repo_map = discover_repo_map(root, cache_dir=cache.dir if cache.enabled else None, refresh=rescan)
     chapters_dir = repo_map.chapters_dir or (root / "chapters")
     characters_dir = repo_map.characters_dir or (root / "characters")
     locations_dir = repo_map.locations_dir or (root / "locations")
@@ -71,6 +69,7 @@ def init(
         locations_dir=_rel(locations_dir),
         images_dir=_rel(chapters_dir),
         runs_dir=Path("runs"),
+        cache=cache,
     )
 
     write_config(cfg, output)
@@ -92,20 +91,34 @@ def audit(
     run_id: Optional[str] = typer.Option(None, "--run-id", help="Override run id"),
     model: Optional[str] = typer.Option(None, "--model", help="Override model for this audit"),
     force: bool = typer.Option(False, "--force"),
+    no_cache: bool = typer.Option(False, "--no-cache", help="Bypass the persistent response cache"),
 ) -> None:
+    _load_env()
+    import asyncio
+
+    from .runtime.context import build_run_context
+    from .runtime.runner import run_chapter_audit
+
     cfg = _resolve_config(config)
     chapter_path = chapter.resolve() if chapter else _prompt_chapter(cfg)
-    parsed = parse_chapter(chapter_path, cfg)
+    parsed = load_chapter(chapter_path, cfg)
 
     run_id = run_id or new_run_id()
     run_dir = ensure_run_dir(cfg.runs_dir, run_id)
 
     write_json(run_dir / "config.json", cfg.model_dump(mode="json", exclude={"config_path"}))
-    write_json(run_dir / "index.json", build_index([parsed]))
+    index = build_index([parsed])
+    write_json(run_dir / "index.json", index)
 
     chapter_model = model or cfg.models.chapter_audit
+    ctx = build_run_context(cfg, use_cache=not no_cache, force=force)
     try:
-        asyncio.run(run_chapter_audit(parsed, cfg, run_dir, model=chapter_model, force=force))
+        asyncio.run(run_chapter_audit(parsed, cfg, run_dir, model=chapter_model, force=force, ctx=ctx))
+        if ctx.canon is not None:
+            ctx.canon.save()
+        if ctx.prompt_cuts:
+            index["prompt_cuts"] = ctx.prompt_cuts
+            write_json(run_dir / "index.json", index)
         typer.echo(f"Report written to {run_dir}")
     except RuntimeError as exc:
         typer.echo(f"Audit completed with errors: {exc}")
@@ -122,7 +135,14 @@ def run(
     force: bool = typer.Option(False, "--force"),
     config: Optional[Path] = typer.Option(None, "--config"),
     model: Optional[str] = typer.Option(None, "--model", help="Override model for all tasks"),
+    no_cache: bool = typer.Option(False, "--no-cache", help="Bypass the persistent response cache"),
+    incremental: bool = typer.Option(
+        False, "--incremental", help="Reuse reports from the previous run whose inputs are unchanged"
+    ),
 ) -> None:
+    _load_env()
+    from .runtime.runner import run_pipeline_sync
+
     if start is None or end is None:
         start, end, mode, window, force = _prompt_run_options(start, end, mode, window, force, config)
     try:
@@ -135,6 +155,8 @@ def run(
             force=force,
             config_path=str(config) if config else None,
             model=model,
+            use_cache=not no_cache,
+            incremental=incremental,
         )
         typer.echo(f"Run completed: {run_dir}")
     except RuntimeError as exc:
@@ -142,13 +164,225 @@ def run(
         raise typer.Exit(code=1)
 
 
+@app.command()
+def resume(
+    run_id: str = typer.Argument(..., help="Run id (folder name under runs_dir) to finish"),
+    config: Optional[Path] = typer.Option(None, "--config"),
+    no_cache: bool = typer.Option(False, "--no-cache", help="Bypass the persistent response cache"),
+) -> None:
+    """Reschedule only the tasks an interrupted run never completed, using its journal."""
+    _load_env()
+    from .runtime.runner import resume_pipeline_sync
+
+    try:
+        run_dir = resume_pipeline_sync(
+            run_id,
+            config_path=str(config) if config else None,
+            use_cache=not no_cache,
+        )
+        typer.echo(f"Run completed: {run_dir}")
+    except RuntimeError as exc:
+        typer.echo(f"Run completed with errors: {exc}")
+        raise typer.Exit(code=1)
+
+
+@app.command()
+def telemetry(
+    run_id: str = typer.Argument(..., help="Run id (folder name under runs_dir)"),
+    config: Optional[Path] = typer.Option(None, "--config"),
+) -> None:
+    """Summarize a run's per-call telemetry: p50/p95 latency and throughput per stage."""
+    cfg = _resolve_config(config)
+    ledger_path = cfg.runs_dir / run_id / "final" / TELEMETRY_NAME
+    if not ledger_path.exists():
+        typer.echo(f"No telemetry found at {ledger_path}")
+        raise typer.Exit(code=1)
+    table = summary_table(summarize(load_records(ledger_path)))
+    try:  # optional rich output
+        from rich.console import Console
+    except ImportError:  # pragma: no cover
+        typer.echo(table)
+    else:
+        Console().print(table)
+
+
+@app.command()
+def index(
+    config: Optional[Path] = typer.Option(None, "--config"),
+    character: Optional[str] = typer.Option(None, "--character", help="List scenes featuring this character slug"),
+    location: Optional[str] = typer.Option(None, "--location", help="List scenes set at this location slug"),
+    rebuild: bool = typer.Option(False, "--rebuild", help="Drop the index and re-parse every chapter"),
+) -> None:
+    """Refresh the SQLite scene index; with --character/--location, list the matching scenes."""
+    cfg = _resolve_config(config)
+    with SceneIndex.from_config(cfg) as scene_index:
+        if rebuild:
+            scene_index.clear()
+        started = time.perf_counter()
+        stats = scene_index.refresh()
+        elapsed = (time.perf_counter() - started) * 1000
+        typer.echo(
+            f"{stats.chapters} chapters: {stats.indexed} indexed, {stats.unchanged} unchanged, "
+            f"{stats.removed} removed in {elapsed:.0f} ms ({scene_index.db_path})"
+        )
+        if stats.errors:
+            typer.echo(f"{stats.errors} chapters failed to parse; see the error column of the chapters table")
+        if character or location:
+            if character and location:
+                scenes = [
+                    scene
+                    for scene in scene_index.scenes_with_character(character)
+                    if scene.location == location
+                ]
+            elif character:
+                scenes = scene_index.scenes_with_character(character)
+            else:
+                scenes = scene_index.scenes_at_location(location)
+            for scene in scenes:
+                typer.echo(f"{scene.anchor}  {scene.title}  (lines {scene.start_line}-{scene.end_line})")
+            typer.echo(f"{len(scenes)} scenes")
+
+
+@app.command()
+def bench(
+    chapters: int = typer.Option(20, "--chapters", help="Synthetic chapters to generate"),
+    window: int = typer.Option(3, "--window"),
+    median_ms: float = typer.Option(800.0, "--median-ms", help="Median simulated model latency"),
+    p95_ms: float = typer.Option(2500.0, "--p95-ms", help="95th percentile simulated model latency"),
+    error_rate: float = typer.Option(0.0, "--error-rate", help="Fraction of calls that fail"),
+    burst_rate: float = typer.Option(0.0, "--burst-rate", help="Per-call chance of starting a 429 burst"),
+    burst_sec: float = typer.Option(5.0, "--burst-sec", help="Length of each 429 burst"),
+    repeat: int = typer.Option(1, "--repeat", help="Runs over the same corpus (later runs hit a warm cache)"),
+    cache: bool = typer.Option(False, "--cache/--no-cache", help="Use a response cache local to the bench corpus"),
+    adaptive: bool = typer.Option(False, "--adaptive/--fixed", help="Adaptive or fixed stage concurrency"),
+    seed: int = typer.Option(0, "--seed"),
+    json_out: Optional[Path] = typer.Option(None, "--json", help="Also write results as JSON"),
+    keep: bool = typer.Option(False, "--keep", help="Keep the generated corpus and runs"),
+) -> None:
+    """Benchmark the full pipeline offline against a simulated model backend."""
+    from .runtime.bench import run_bench
+    from .runtime.simulated import SimulationProfile
+
+    results = run_bench(
+        CorpusSpec(chapters=chapters, seed=seed),
+        SimulationProfile(
+            median_sec=median_ms / 1000,
+            p95_sec=p95_ms / 1000,
+            error_rate=error_rate,
+            burst_rate=burst_rate,
+            burst_sec=burst_sec,
+            seed=seed,
+        ),
+        window=window,
+        repeat=repeat,
+        use_cache=cache,
+        adaptive=adaptive,
+        keep=keep,
+    )
+    for item in results:
+        typer.echo(
+            f"{item.label}: {item.chapters} chapters, {item.calls} calls ({item.cache_hits} cached, "
+            f"{item.failed_calls} failed, {item.overloads} simulated 429s)\n"
+            f"  wall {item.wall_sec:.2f}s  model busy {item.model_busy_sec:.2f}s  "
+            f"avg in flight {item.avg_in_flight:.1f}/{item.capacity}  utilization {item.utilization:.0%}\n"
+            f"  cpu {item.cpu_sec:.2f}s ({item.cpu_ms_per_call:.1f} ms/call)"
+        )
+    if json_out:
+        write_json(
+            json_out,
+            [
+                {
+                    **asdict(item),
+                    "avg_in_flight": item.avg_in_flight,
+                    "utilization": item.utilization,
+                    "cpu_ms_per_call": item.cpu_ms_per_call,
+                }
+                for item in results
+            ],
+        )
+
+
+@app.command()
+def synth(
+    output: Path = typer.Argument(..., help="Directory to write the synthetic story-content tree into"),
+    scale: float = typer.Option(1.0, "--scale", help="Multiple of the real corpus (45 chapters, 58 characters, 33 locations)"),
+    chapters: Optional[int] = typer.Option(None, "--chapters", help="Override the scaled chapter count"),
+    characters: Optional[int] = typer.Option(None, "--characters", help="Override the scaled character count"),
+    locations: Optional[int] = typer.Option(None, "--locations", help="Override the scaled location count"),
+    scenes: int = typer.Option(6, "--scenes", help="Scenes per chapter"),
+    paragraphs: int = typer.Option(22, "--paragraphs", help="Paragraphs per scene"),
+    words: int = typer.Option(32, "--words", help="Words per paragraph"),
+    images_per_scene: int = typer.Option(1, "--images-per-scene"),
+    image_bytes: int = typer.Option(2048, "--image-bytes", help="Approximate size of each placeholder PNG"),
+    missing_image_rate: float = typer.Option(0.0, "--missing-image-rate", help="Fraction of scene images left unwritten"),
+    seed: int = typer.Option(0, "--seed"),
+) -> None:
+    """Generate a structurally valid story-content tree for scale testing."""
+    overrides = {
+        key: value
+        for key, value in {"chapters": chapters, "characters": characters, "locations": locations}.items()
+        if value is not None
+    }
+    spec = CorpusSpec.scaled(
+        scale,
+        scenes_per_chapter=scenes,
+        paragraphs_per_scene=paragraphs,
+        words_per_paragraph=words,
+        images_per_scene=images_per_scene,
+        image_bytes=image_bytes,
+        missing_image_rate=missing_image_rate,
+        seed=seed,
+        **overrides,
+    )
+    stats = generate_corpus(output, spec)
+    typer.echo(
+        f"Wrote {stats.chapters} chapters ({stats.scenes} scenes), {stats.characters} characters, "
+        f"{stats.locations} locations, {stats.imagery_files} imagery files and {stats.images} images "
+        f"({stats.bytes_written / 1_000_000:.1f} MB) to {output}"
+    )
+    if stats.missing_images:
+        typer.echo(f"{stats.missing_images} scene image references point at missing files")
+
+
 @app.command()
 def web(
     agent_dir: Path = typer.Option(DEFAULT_AGENT_DIR, "--agent-dir"),
 ) -> None:
+    _load_env()
     subprocess.run(["adk", "web"], cwd=agent_dir, check=False)
 
 
+@app.command()
+def check(
+    chapters: Optional[List[Path]] = typer.Argument(None, help="Chapter files to check (default: all chapters)"),
+    config: Optional[Path] = typer.Option(None, "--config"),
+    output_format: str = typer.Option("text", "--format", help="text, json or sarif"),
+    output: Optional[Path] = typer.Option(None, "--output", "-o", help="Write the report here instead of stdout"),
+    fail_on: str = typer.Option("major", "--fail-on", help="Lowest severity that fails: minor, moderate, major or never"),
+    workers: Optional[int] = typer.Option(None, "--workers", help="Worker processes (default: concurrency.parse_workers)"),
+) -> None:
+    """Run the slug and imagery validators over every chapter without calling any model.
+
+    Exits 0 when clean, 1 when a finding is at or above --fail-on, 2 when a chapter cannot be parsed.
+    """
+    if output_format not in {"text", "json", "sarif"} or fail_on not in FAIL_ON:
+        typer.echo("--format must be text, json or sarif; --fail-on one of " + ", ".join(FAIL_ON), err=True)
+        raise typer.Exit(code=2)
+    cfg = _resolve_config(config, interactive=sys.stdin.isatty())
+    result = run_check(cfg, [path.resolve() for path in chapters] if chapters else None, workers=workers)
+    if output_format == "text":
+        report = "\n".join(check_text(result)) + "\n"
+    else:
+        data = check_json(result) if output_format == "json" else check_sarif(result)
+        report = json.dumps(data, indent=2) + "\n"
+    if output:
+        output.parent.mkdir(parents=True, exist_ok=True)
+        output.write_text(report)
+    else:
+        typer.echo(report, nl=False)
+    raise typer.Exit(code=result.exit_code(fail_on))
+
+
 @app.command()
 def doctor(
     config: Optional[Path] = typer.Option(None, "--config"),
@@ -167,7 +401,7 @@ def doctor(
         raise typer.Exit(code=1)
 
 
-def _resolve_config(config: Optional[Path]) -> StorylintConfig:
+def _resolve_config(config: Optional[Path], interactive: bool = True) -> StorylintConfig:
     if config:
         return load_config(config, start_dir=Path.cwd())
     try:
@@ -176,11 +410,33 @@ def _resolve_config(config: Optional[Path]) -> StorylintConfig:
         for candidate in FALLBACK_CONFIG_PATHS:
             if candidate.exists():
                 return load_config(candidate, start_dir=Path.cwd())
+        if not interactive:
+            typer.echo("No storylint.yaml found; pass --config.", err=True)
+            raise typer.Exit(code=2)
         return _prompt_config_path()
 
 
+def _load_env() -> None:
+    """Load ``.env`` (API keys) for commands that call models or start the ADK tools."""
+    try:  # optional; no-op if missing
+        from dotenv import load_dotenv
+    except ImportError:  # pragma: no cover
+        return
+    load_dotenv()
+
+
+def _questionary():
+    """questionary for arrow-key prompts, or None to fall back to plain typer prompts."""
+    try:  # optional interactive prompts
+        import questionary
+    except ImportError:  # pragma: no cover
+        return None
+    return questionary
+
+
 def _prompt_config_path() -> StorylintConfig:
     prompt_text = "Enter path to storylint.yaml"
+    questionary = _questionary()
     if questionary:
         value = questionary.text(prompt_text).ask()
     else:
@@ -196,6 +452,7 @@ def _prompt_chapter(cfg: StorylintConfig) -> Path:
     if not chapters:
         raise typer.BadParameter("No chapters found. Check storylint.yaml paths.")
     choices = [path.parent.name for path in chapters]
+    questionary = _questionary()
     if questionary:
         selection = questionary.select("Select a chapter", choices=choices).ask()
         if not selection:
@@ -235,6 +492,7 @@ def _prompt_run_options(
     start_slug = start
     end_slug = end
 
+    questionary = _questionary()
     if questionary:
         start_choice = questionary.select(
             "Select start chapter",
@@ -290,6 +548,7 @@ def _interactive_menu() -> None:
         ("Open ADK web UI", "web", "interactive agent debugging UI"),
         ("Exit", "exit", "quit Storylint"),
     ]
+    questionary = _questionary()
     if questionary:
         selection = questionary.select(
             "Storylint — choose an action",
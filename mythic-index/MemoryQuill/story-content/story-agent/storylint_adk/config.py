@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Optional
 
 import yaml
 from pydantic import BaseModel, Field, model_validator
@@ -10,12 +10,43 @@ from pydantic import BaseModel, Field, model_validator
 class PromptConfig(BaseModel):
     max_scene_chars: int = 4000
     max_paragraphs: int = 60
+    # Estimated prompt tokens per model name; "default" covers unlisted models, 0 disables packing.
+    token_budgets: Dict[str, int] = Field(default_factory=lambda: {"default": 100_000})
 
 
 class ConcurrencyConfig(BaseModel):
     chapter_audit: int = 6
     adjacent: int = 6
     arc: int = 3
+    synthesis: int = 4
+    adaptive: bool = True
+    min_limit: int = 1
+    max_limit: int = 24
+    increase: float = 1.0
+    decrease: float = 0.5
+    cooldown_sec: float = 5.0
+    # Processes for parsing and validating chapters before a run; 0 = one per CPU, 1 = serial.
+    parse_workers: int = 0
+
+
+class SynthesisConfig(BaseModel):
+    # Chapters or plans per synthesis call in tree mode; 0 keeps one flat synthesis call.
+    fan_in: int = 0
+
+
+class CacheConfig(BaseModel):
+    enabled: bool = True
+    dir: Path = Path(".storylint-cache")
+    max_bytes: int = 512 * 1024 * 1024
+    max_age_days: float = 30.0
+    persist_canon: bool = True
+    persist_chapters: bool = True
+    persist_yaml: bool = True
+
+
+class RateLimitConfig(BaseModel):
+    rpm: Optional[int] = None
+    tpm: Optional[int] = None
 
 
 class ModelConfig(BaseModel):
@@ -42,9 +73,13 @@ class StorylintConfig(BaseModel):
     imagery_filenames: list[str] = Field(default_factory=lambda: ["imagery.yaml", "chapter-imagery.yaml"])
 
     canon_snapshot_chars: int = 1200
+    dashboard_interval_sec: float = 30.0
     prompt: PromptConfig = Field(default_factory=PromptConfig)
     concurrency: ConcurrencyConfig = Field(default_factory=ConcurrencyConfig)
+    synthesis: SynthesisConfig = Field(default_factory=SynthesisConfig)
+    cache: CacheConfig = Field(default_factory=CacheConfig)
     models: ModelConfig = Field(default_factory=ModelConfig)
+    rate_limits: Dict[str, RateLimitConfig] = Field(default_factory=dict)
 
     @model_validator(mode="after")
     def _resolve_paths(self) -> "StorylintConfig":
@@ -62,6 +97,7 @@ class StorylintConfig(BaseModel):
         if self.images_dir is not None:
             self.images_dir = _resolve_path(self.images_dir, self.project_root)
         self.runs_dir = _resolve_path(self.runs_dir, self.project_root)
+        self.cache.dir = _resolve_path(self.cache.dir, self.project_root)
         return self
 
 
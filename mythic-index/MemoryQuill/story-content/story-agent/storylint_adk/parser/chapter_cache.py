@@ -0,0 +1,225 @@
+"""On-disk cache of parsed chapters, shared by ``storylint_adk`` and the legacy ``storylint`` parser.
+
+Only the standard library is imported here so the legacy package can use it without
+pulling in the ADK configuration.
+"""
+from __future__ import annotations
+
+import hashlib
+import marshal
+import os
+import sys
+from array import array
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Optional, Tuple
+
+# Bump when parser output for the same file changes; older entries are then ignored.
+FORMAT_VERSION = 2
+# Integers per paragraph in a packed scene: start offset, end offset, first line, last line.
+PARAGRAPH_SPAN = 4
+_RUNTIME = f"py{sys.version_info[0]}.{sys.version_info[1]}-marshal{marshal.version}"
+
+
+@dataclass(frozen=True)
+class ChapterTypes:
+    """The dataclasses a cached chapter is rebuilt into; each parser module passes its own."""
+
+    chapter: type
+    scene: type
+    meta: type
+    paragraph: type
+
+
+@dataclass
+class ChapterCacheStats:
+    hits: int = 0
+    rehashed: int = 0
+    misses: int = 0
+    writes: int = 0
+
+
+class ChapterCache:
+    """Stores each parsed chapter as a marshalled tuple in ``<root>/chapters/<path hash>.bin``.
+
+    An entry is used without reading the chapter while its size and mtime are unchanged.
+    If only the stat changed (checkout, touch) the file is hashed and the entry is kept
+    when the content hash still matches; otherwise the chapter is parsed again. The scene
+    markers are part of the entry, so configs with different markers never share results.
+    """
+
+    def __init__(self, root: Path) -> None:
+        self.root = root / "chapters"
+        self.stats = ChapterCacheStats()
+
+    def load(
+        self,
+        path: Path,
+        markers: Tuple[str, str],
+        parse: Callable[[Path], Any],
+        types: ChapterTypes,
+    ) -> Any:
+        stat = path.stat()
+        signature = (stat.st_size, stat.st_mtime_ns)
+        entry_path = self._entry_path(path)
+        entry = self._read(entry_path)
+        valid = entry is not None and entry[1] == str(path) and tuple(entry[4:6]) == markers
+        if valid and tuple(entry[2]) == signature:
+            self.stats.hits += 1
+            touch_entry(entry_path)
+            return decode_chapter(entry[6], path, types)
+
+        digest = _digest(path)
+        if valid and entry[3] == digest:
+            self.stats.rehashed += 1
+            self._write(entry_path, (FORMAT_VERSION, str(path), signature, digest, *markers, entry[6]))
+            return decode_chapter(entry[6], path, types)
+
+        self.stats.misses += 1
+        chapter = parse(path)
+        self._write(entry_path, (FORMAT_VERSION, str(path), signature, digest, *markers, encode_chapter(chapter)))
+        return chapter
+
+    def _entry_path(self, path: Path) -> Path:
+        name = hashlib.blake2b(f"{_RUNTIME}:{path}".encode("utf-8"), digest_size=16).hexdigest()
+        return self.root / f"{name}.bin"
+
+    def _read(self, entry_path: Path) -> Optional[tuple]:
+        try:
+            entry = marshal.loads(entry_path.read_bytes())
+        except (OSError, EOFError, ValueError, TypeError):
+            return None
+        if not isinstance(entry, tuple) or len(entry) != 7 or entry[0] != FORMAT_VERSION:
+            return None
+        return entry
+
+    def _write(self, entry_path: Path, entry: tuple) -> None:
+        try:
+            entry_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = entry_path.with_suffix(f".{os.getpid()}.tmp")
+            tmp.write_bytes(marshal.dumps(entry))
+            tmp.replace(entry_path)
+        except OSError:
+            return
+        self.stats.writes += 1
+
+
+def encode_chapter(chapter: Any) -> tuple:
+    """Reduce a parsed chapter to nested tuples of builtins; slug and path come from the file.
+
+    Chapters whose records all point into one UTF-8 buffer (see ``scene_parser``) are stored
+    as that buffer plus offsets; anything else is stored as its strings.
+    """
+    buffer = _shared_buffer(chapter)
+    if buffer is not None:
+        return (
+            "span",
+            chapter.title,
+            buffer,
+            tuple(
+                (
+                    _meta_fields(scene.meta),
+                    scene.meta.source_span[1:],
+                    scene.source_span[1:],
+                    tuple(scene.paragraph_spans),
+                    scene.start_line,
+                    scene.end_line,
+                    scene.meta_start_line,
+                    scene.meta_end_line,
+                )
+                for scene in chapter.scenes
+            ),
+        )
+    return (
+        "text",
+        chapter.title,
+        tuple(
+            (
+                (*_meta_fields(scene.meta), scene.meta.raw_text),
+                scene.text,
+                tuple((p.idx, p.text, p.start_line, p.end_line) for p in scene.paragraphs),
+                scene.start_line,
+                scene.end_line,
+                scene.meta_start_line,
+                scene.meta_end_line,
+            )
+            for scene in chapter.scenes
+        ),
+    )
+
+
+def decode_chapter(data: tuple, path: Path, types: ChapterTypes) -> Any:
+    if data[0] == "span":
+        title, scenes = data[1], _decode_spans(data[2], data[3], types)
+    else:
+        title, scenes = data[1], [
+            types.scene(
+                types.meta(*meta),
+                text,
+                [types.paragraph(*paragraph) for paragraph in paragraphs],
+                *lines,
+            )
+            for meta, text, paragraphs, *lines in data[2]
+        ]
+    return types.chapter(slug=path.parent.name, title=title, path=path, scenes=scenes)
+
+
+def _decode_spans(buffer: bytes, scenes: tuple, types: ChapterTypes) -> list:
+    if hasattr(types.scene, "from_span"):
+        return [
+            types.scene.from_span(
+                buffer,
+                *text_span,
+                types.meta.from_span(buffer, *meta_span, *meta),
+                array("q", paragraphs),
+                *lines,
+            )
+            for meta, meta_span, text_span, paragraphs, *lines in scenes
+        ]
+
+    # Record types that hold plain strings (the legacy parser) get the slices decoded.
+    def text(start: int, end: int) -> str:
+        return buffer[start:end].decode("utf-8")
+
+    return [
+        types.scene(
+            types.meta(*meta, text(*meta_span)),
+            text(*text_span),
+            [
+                types.paragraph(idx, text(*paragraphs[pos : pos + 2]), *paragraphs[pos + 2 : pos + PARAGRAPH_SPAN])
+                for idx, pos in enumerate(range(0, len(paragraphs), PARAGRAPH_SPAN), start=1)
+            ],
+            *lines,
+        )
+        for meta, meta_span, text_span, paragraphs, *lines in scenes
+    ]
+
+
+def _shared_buffer(chapter: Any) -> Optional[bytes]:
+    buffer = None
+    for scene in chapter.scenes:
+        if getattr(scene, "paragraph_spans", None) is None:
+            return None
+        source = scene.source_span[0]
+        if not isinstance(source, bytes) or scene.meta.source_span[0] is not source:
+            return None
+        if buffer is not None and source is not buffer:
+            return None
+        buffer = source
+    return buffer
+
+
+def _meta_fields(meta: Any) -> tuple:
+    return (meta.id, meta.title, meta.when, meta.location, meta.characters, meta.tags, meta.images, meta.raw)
+
+
+def _digest(path: Path) -> str:
+    return hashlib.blake2b(path.read_bytes(), digest_size=16).hexdigest()
+
+
+def touch_entry(entry_path: Path) -> None:
+    """Mark an entry as recently used for ``ResponseCache.prune``."""
+    try:
+        os.utime(entry_path)
+    except OSError:
+        pass
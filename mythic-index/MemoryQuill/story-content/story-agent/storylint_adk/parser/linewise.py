@@ -0,0 +1,170 @@
+"""Line-by-line chapter parser, kept as the reference the single-pass parser is tested against."""
+from __future__ import annotations
+
+import json
+import re
+from pathlib import Path
+from typing import Any, Dict, List, Tuple
+
+from ..config import StorylintConfig
+from .scene_parser import Chapter, Paragraph, Scene, _build_scene_meta
+
+
+def parse_chapter_linewise(path: Path, config: StorylintConfig) -> Chapter:
+    lines = path.read_text().splitlines()
+    slug = path.parent.name
+    title = _extract_title(lines)
+    scenes: List[Scene] = []
+
+    i = 0
+    while i < len(lines):
+        line = lines[i]
+        if config.scene_start in line:
+            meta_start_line = i + 1
+            meta_lines = [line]
+            i += 1
+            while i < len(lines) and "-->" not in lines[i]:
+                meta_lines.append(lines[i])
+                i += 1
+            if i < len(lines):
+                meta_lines.append(lines[i])
+            meta_end_line = i + 1
+            meta_block = "\n".join(meta_lines)
+            meta_dict = parse_scene_meta_linewise(meta_block)
+
+            scene_lines: List[Tuple[int, str]] = []
+            i += 1
+            scene_start_line = i + 1
+            while i < len(lines) and config.scene_end not in lines[i]:
+                scene_lines.append((i + 1, lines[i]))
+                i += 1
+            if i >= len(lines):
+                raise ValueError(f"Missing SCENE-END for scene starting at line {meta_start_line} in {path}")
+            if scene_lines:
+                scene_end_line = scene_lines[-1][0]
+            else:
+                scene_end_line = scene_start_line
+
+            scene_text = "\n".join([line_text for _, line_text in scene_lines]).strip()
+            paragraphs = _split_paragraphs(scene_lines)
+
+            scene = Scene(
+                meta=_build_scene_meta(meta_dict, meta_block),
+                text=scene_text,
+                paragraphs=paragraphs,
+                start_line=scene_start_line,
+                end_line=scene_end_line,
+                meta_start_line=meta_start_line,
+                meta_end_line=meta_end_line,
+            )
+            scenes.append(scene)
+        i += 1
+
+    return Chapter(slug=slug, title=title, path=path, scenes=scenes)
+
+
+def parse_scene_meta_linewise(meta_block: str) -> Dict[str, Any]:
+    content = meta_block.replace("<!--", "").replace("-->", "")
+    content = content.replace("SCENE-START", "")
+    content = re.sub(r"\s+", " ", content).strip()
+
+    result: Dict[str, Any] = {}
+    i = 0
+    while i < len(content):
+        if content[i].isspace():
+            i += 1
+            continue
+        key_match = re.match(r"[A-Za-z_][A-Za-z0-9_-]*", content[i:])
+        if not key_match:
+            i += 1
+            continue
+        key = key_match.group(0)
+        i += len(key)
+        if i >= len(content) or content[i] != ":":
+            i += 1
+            continue
+        i += 1
+        while i < len(content) and content[i].isspace():
+            i += 1
+        if i >= len(content):
+            break
+        value, i = _parse_value(content, i)
+        result[key] = value
+    return result
+
+
+def _parse_value(content: str, start: int) -> Tuple[Any, int]:
+    if content[start] == '"':
+        end = start + 1
+        while end < len(content) and content[end] != '"':
+            end += 1
+        value = content[start + 1 : end]
+        return value, end + 1
+    if content[start] == '[':
+        end = start + 1
+        depth = 1
+        while end < len(content) and depth > 0:
+            if content[end] == '[':
+                depth += 1
+            elif content[end] == ']':
+                depth -= 1
+            end += 1
+        raw = content[start:end]
+        try:
+            value = json.loads(raw)
+        except json.JSONDecodeError:
+            value = raw
+        return value, end
+
+    end = start
+    while end < len(content) and not content[end].isspace():
+        end += 1
+    return content[start:end], end
+
+
+def _split_paragraphs(scene_lines: List[Tuple[int, str]]) -> List[Paragraph]:
+    paragraphs: List[Paragraph] = []
+    buffer: List[str] = []
+    start_line = None
+    last_line = None
+    idx = 1
+
+    for line_no, line_text in scene_lines:
+        if line_text.strip() == "":
+            if buffer:
+                paragraphs.append(
+                    Paragraph(
+                        idx=idx,
+                        text="\n".join(buffer).strip(),
+                        start_line=start_line or line_no,
+                        end_line=last_line or line_no,
+                    )
+                )
+                idx += 1
+                buffer = []
+                start_line = None
+                last_line = None
+            continue
+        if start_line is None:
+            start_line = line_no
+        buffer.append(line_text)
+        last_line = line_no
+
+    if buffer:
+        paragraphs.append(
+            Paragraph(
+                idx=idx,
+                text="\n".join(buffer).strip(),
+                start_line=start_line or (last_line or 1),
+                end_line=last_line or (start_line or 1),
+            )
+        )
+
+    return paragraphs
+
+
+def _extract_title(lines: List[str]) -> str:
+    for line in lines:
+        if line.startswith("# "):
+            return line[2:].strip()
+    return ""
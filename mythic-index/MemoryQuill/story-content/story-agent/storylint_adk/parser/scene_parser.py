@@ -1,167 +1,395 @@
 from __future__ import annotations
 
+from array import array
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 import json
 import re
-from typing import Any, Dict, List, Optional, Tuple
+import sys
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 
 from ..config import StorylintConfig
+from .chapter_cache import PARAGRAPH_SPAN, ChapterCache, ChapterTypes
+
+# Line breaks str.splitlines() honours besides "\n" (read_text already folds "\r\n" and "\r").
+_EXTRA_LINE_BREAKS = "\x0b\x0c\x1c\x1d\x1e\x85\u2028\u2029"
+_TITLE = re.compile(r"^# (.*)$", re.MULTILINE)
+# A run of consecutive lines that each contain something other than whitespace, from its
+# first to its last non-whitespace character.
+_PARAGRAPH = re.compile(r"\S(?:[^\n]*\S)?(?:[^\S\n]*\n[^\n]*\S)*")
+_WHITESPACE = re.compile(r"\s+")
+# One "key:value" pair; the leftmost match is the pair the old character scan would find next.
+_META_PAIR = re.compile(
+    r'([A-Za-z_][A-Za-z0-9_-]*): ?'
+    r'(?:"([^"]*)"?'  # quoted; an unterminated quote runs to the end of the block
+    r'|(\["[^"\\\[\]\x00-\x1f]*"(?:,"[^"\\\[\]\x00-\x1f]*")*\])'  # list of plain strings, split without json
+    r'|(\[)'  # any other list: matched by bracket depth, decoded with json
+    r'|([^ ]+))?'
+)
+_BRACKET = re.compile(r"[\[\]]")
+
+
+class _Spanned:
+    """A record whose text is a slice of its chapter's UTF-8 buffer, decoded when read.
+
+    ``parse_chapter`` keeps one ``bytes`` copy of each chapter and points every scene, meta
+    block and paragraph into it. Records built from a plain string (the line parser, tests)
+    hold that string instead and behave the same.
+    """
+
+    __slots__ = ("_source", "_start", "_end")
+    _fields: Tuple[str, ...] = ()
+
+    def _set_text(self, text: str) -> None:
+        self._source = text
+        self._start = 0
+        self._end = len(text)
+
+    def _slice(self) -> str:
+        value = self._source[self._start : self._end]
+        return value.decode("utf-8") if isinstance(value, bytes) else value
+
+    @property
+    def source_span(self) -> Tuple[Union[bytes, str], int, int]:
+        """The shared buffer and the ``[start, end)`` offsets of this record's text in it."""
+        return self._source, self._start, self._end
+
+    @classmethod
+    def _from_span(cls, source: Union[bytes, str], start: int, end: int):
+        record = cls.__new__(cls)
+        record._source = source
+        record._start = start
+        record._end = end
+        return record
+
+    def __eq__(self, other: object) -> bool:
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return all(self._field(name) == other._field(name) for name in self._fields)
+
+    __hash__ = None  # mutable, like the dataclasses these replace
+
+    def __repr__(self) -> str:
+        fields = ", ".join(f"{name}={self._field(name)!r}" for name in self._fields)
+        return f"{self.__class__.__name__}({fields})"
+
+    def _field(self, name: str) -> Any:
+        return getattr(self, name)
+
+
+class Paragraph(_Spanned):
+    __slots__ = ("idx", "start_line", "end_line")
+    _fields = ("idx", "text", "start_line", "end_line")
+
+    def __init__(self, idx: int, text: str, start_line: int, end_line: int) -> None:
+        self.idx = idx
+        self._set_text(text)
+        self.start_line = start_line
+        self.end_line = end_line
+
+    @classmethod
+    def from_span(cls, source: Union[bytes, str], start: int, end: int, idx: int, start_line: int, end_line: int) -> "Paragraph":
+        record = cls._from_span(source, start, end)
+        record.idx = idx
+        record.start_line = start_line
+        record.end_line = end_line
+        return record
+
+    @property
+    def text(self) -> str:
+        return self._slice()
+
+
+class SceneMeta(_Spanned):
+    __slots__ = ("id", "title", "when", "location", "characters", "tags", "images", "raw")
+    _fields = ("id", "title", "when", "location", "characters", "tags", "images", "raw", "raw_text")
+
+    def __init__(
+        self,
+        id: str,
+        title: str,
+        when: Optional[str],
+        location: Optional[str],
+        characters: List[str],
+        tags: List[str],
+        images: List[str],
+        raw: Dict[str, Any],
+        raw_text: str,
+    ) -> None:
+        self._set_fields(id, title, when, location, characters, tags, images, raw)
+        self._set_text(raw_text)
+
+    @classmethod
+    def from_span(cls, source: Union[bytes, str], start: int, end: int, *fields: Any) -> "SceneMeta":
+        """``fields`` are ``id`` through ``raw`` in constructor order."""
+        record = cls._from_span(source, start, end)
+        record._set_fields(*fields)
+        return record
+
+    def _set_fields(self, id, title, when, location, characters, tags, images, raw) -> None:
+        self.id = id
+        self.title = title
+        self.when = when
+        self.location = location
+        self.characters = characters
+        self.tags = tags
+        self.images = images
+        self.raw = raw
+
+    @property
+    def raw_text(self) -> str:
+        return self._slice()
+
+
+class Scene(_Spanned):
+    """A scene; ``paragraphs`` may be kept as packed spans until they are first read.
+
+    ``parse_chapter`` stores each paragraph as four integers (start and end offsets, first
+    and last line) in one ``array`` per scene, so a loaded corpus carries no per-paragraph
+    objects until a caller asks for them. The first read of ``paragraphs`` builds the
+    records once and keeps the list, so appending to it or editing an element sticks.
+    ``paragraph_count`` and ``paragraph_lines`` read the spans without building records.
+    """
+
+    __slots__ = ("meta", "_paragraphs", "start_line", "end_line", "meta_start_line", "meta_end_line")
+    _fields = ("meta", "text", "paragraphs", "start_line", "end_line", "meta_start_line", "meta_end_line")
+
+    def __init__(
+        self,
+        meta: SceneMeta,
+        text: str,
+        paragraphs: List[Paragraph],
+        start_line: int,
+        end_line: int,
+        meta_start_line: int,
+        meta_end_line: int,
+    ) -> None:
+        self._set_text(text)
+        self._set_fields(meta, paragraphs, start_line, end_line, meta_start_line, meta_end_line)
+
+    @classmethod
+    def from_span(cls, source: Union[bytes, str], start: int, end: int, *fields: Any) -> "Scene":
+        """``fields`` are ``meta``, ``paragraphs`` and the four line numbers in constructor order.
+
+        ``paragraphs`` is a list of records or an ``array`` of ``PARAGRAPH_SPAN`` integer
+        groups with offsets into ``source``.
+        """
+        record = cls._from_span(source, start, end)
+        record._set_fields(*fields)
+        return record
+
+    def _set_fields(self, meta, paragraphs, start_line, end_line, meta_start_line, meta_end_line) -> None:
+        self.meta = meta
+        self._paragraphs = paragraphs
+        self.start_line = start_line
+        self.end_line = end_line
+        self.meta_start_line = meta_start_line
+        self.meta_end_line = meta_end_line
+
+    @property
+    def text(self) -> str:
+        return self._slice()
+
+    @property
+    def paragraphs(self) -> List[Paragraph]:
+        spans = self._paragraphs
+        if isinstance(spans, list):
+            return spans
+        self._paragraphs = self._build_paragraphs(spans)
+        return self._paragraphs
+
+    @paragraphs.setter
+    def paragraphs(self, paragraphs: List[Paragraph]) -> None:
+        self._paragraphs = paragraphs
+
+    @property
+    def paragraph_spans(self) -> Optional[array]:
+        """The packed paragraph spans, or None once the paragraphs are held as records."""
+        spans = self._paragraphs
+        return None if isinstance(spans, list) else spans
+
+    @property
+    def paragraph_count(self) -> int:
+        spans = self._paragraphs
+        return len(spans) if isinstance(spans, list) else len(spans) // PARAGRAPH_SPAN
+
+    def _build_paragraphs(self, spans: array) -> List[Paragraph]:
+        source = self._source
+        return [
+            Paragraph.from_span(source, spans[pos], spans[pos + 1], idx, spans[pos + 2], spans[pos + 3])
+            for idx, pos in enumerate(range(0, len(spans), PARAGRAPH_SPAN), start=1)
+        ]
+
+    def _field(self, name: str) -> Any:
+        # Comparing or printing a scene leaves packed paragraphs packed.
+        spans = self._paragraphs
+        if name == "paragraphs" and not isinstance(spans, list):
+            return self._build_paragraphs(spans)
+        return getattr(self, name)
+
+    def paragraph_lines(self) -> List[Tuple[int, int, int]]:
+        """``(idx, start_line, end_line)`` for each paragraph."""
+        spans = self._paragraphs
+        if isinstance(spans, list):
+            return [(paragraph.idx, paragraph.start_line, paragraph.end_line) for paragraph in spans]
+        return [
+            (idx, spans[pos + 2], spans[pos + 3])
+            for idx, pos in enumerate(range(0, len(spans), PARAGRAPH_SPAN), start=1)
+        ]
 
 
 @dataclass
-class Paragraph:
-    idx: int
-    text: str
-    start_line: int
-    end_line: int
+class Chapter:
+    slug: str
+    title: str
+    path: Path
+    scenes: List[Scene]
 
 
-@dataclass
-class SceneMeta:
-    id: str
-    title: str
-    when: Optional[str]
-    location: Optional[str]
-    characters: List[str]
-    tags: List[str]
-    images: List[str]
-    raw: Dict[str, Any]
-    raw_text: str
+CHAPTER_TYPES = ChapterTypes(chapter=Chapter, scene=Scene, meta=SceneMeta, paragraph=Paragraph)
 
 
-@dataclass
-class Scene:
-    meta: SceneMeta
-    text: str
-    paragraphs: List[Paragraph]
-    start_line: int
-    end_line: int
-    meta_start_line: int
-    meta_end_line: int
+def load_chapter(path: Path, config: StorylintConfig) -> Chapter:
+    """``parse_chapter`` through the persistent parsed-chapter cache when it is enabled."""
+    if not (config.cache.enabled and config.cache.persist_chapters):
+        return parse_chapter(path, config)
+    return chapter_cache(config.cache.dir).load(
+        path,
+        (config.scene_start, config.scene_end),
+        lambda source: parse_chapter(source, config),
+        CHAPTER_TYPES,
+    )
 
 
-@dataclass
-class Chapter:
-    slug: str
-    title: str
-    path: Path
-    scenes: List[Scene]
+@lru_cache(maxsize=None)
+def chapter_cache(root: Path) -> ChapterCache:
+    return ChapterCache(root)
 
 
 def parse_chapter(path: Path, config: StorylintConfig) -> Chapter:
-    lines = path.read_text().splitlines()
+    """Parse a chapter in one pass over its text.
+
+    Scene fences are located with ``str.find`` over the whole file and paragraphs with one
+    compiled regex per scene; line numbers come from counting newlines between matches.
+    Scenes, meta blocks and paragraphs keep offsets into one UTF-8 copy of the file
+    rather than their own strings.
+    The result is identical to ``parser.linewise.parse_chapter_linewise``.
+    """
+    text = path.read_text()
+    if any(char in text for char in _EXTRA_LINE_BREAKS):
+        text = "\n".join(text.splitlines())
     slug = path.parent.name
-    title = _extract_title(lines)
+    title_match = _TITLE.search(text)
+    title = title_match.group(1).strip() if title_match else ""
     scenes: List[Scene] = []
 
-    i = 0
-    while i < len(lines):
-        line = lines[i]
-        if config.scene_start in line:
-            meta_start_line = i + 1
-            meta_lines = [line]
-            i += 1
-            while i < len(lines) and "-->" not in lines[i]:
-                meta_lines.append(lines[i])
-                i += 1
-            if i < len(lines):
-                meta_lines.append(lines[i])
-            meta_end_line = i + 1
-            meta_block = "\n".join(meta_lines)
-            meta_dict = parse_scene_meta(meta_block)
-
-            scene_lines: List[Tuple[int, str]] = []
-            i += 1
-            scene_start_line = i + 1
-            while i < len(lines) and config.scene_end not in lines[i]:
-                scene_lines.append((i + 1, lines[i]))
-                i += 1
-            if i >= len(lines):
-                raise ValueError(f"Missing SCENE-END for scene starting at line {meta_start_line} in {path}")
-            if scene_lines:
-                scene_end_line = scene_lines[-1][0]
-            else:
-                scene_end_line = scene_start_line
-
-            scene_text = "\n".join([line_text for _, line_text in scene_lines]).strip()
-            paragraphs = _split_paragraphs(scene_lines)
-
-            scene = Scene(
-                meta=_build_scene_meta(meta_dict, meta_block),
-                text=scene_text,
-                paragraphs=paragraphs,
-                start_line=scene_start_line,
-                end_line=scene_end_line,
-                meta_start_line=meta_start_line,
-                meta_end_line=meta_end_line,
+    buffer = text.encode("utf-8")
+    ascii = len(buffer) == len(text)
+    offset = _byte_offsets(text, ascii)
+    size = len(text)
+    line = 1
+    cursor = 0
+    pos = 0
+    while True:
+        marker = text.find(config.scene_start, pos)
+        if marker < 0:
+            break
+        meta_start = text.rfind("\n", 0, marker) + 1
+        line += text.count("\n", cursor, meta_start)
+        cursor = meta_start
+        meta_start_line = line
+
+        # The comment close is looked for from the line after SCENE-START, as the line parser does.
+        first_break = text.find("\n", marker)
+        close = text.find("-->", first_break) if first_break >= 0 else -1
+        meta_stop = _line_end(text, close) if close >= 0 else size
+        body_start = meta_stop + 1
+        scene_close = text.find(config.scene_end, body_start) if body_start < size else -1
+        if scene_close < 0:
+            raise ValueError(f"Missing SCENE-END for scene starting at line {meta_start_line} in {path}")
+
+        meta_block = text[meta_start:meta_stop]
+        meta_end_line = meta_start_line + meta_block.count("\n")
+        meta = _build_scene_meta(parse_scene_meta(meta_block), buffer, offset(meta_start), offset(meta_stop))
+        scene_start_line = meta_end_line + 1
+        body_stop = text.rfind("\n", 0, scene_close) + 1
+        paragraphs = _paragraph_spans(text, body_start, body_stop, offset(body_start), scene_start_line, ascii)
+        # The stripped scene body runs from the first paragraph's first character to the last one's end.
+        text_span = (paragraphs[0], paragraphs[-3]) if paragraphs else (0, 0)
+        line = scene_start_line + text.count("\n", body_start, body_stop)
+        cursor = body_stop
+
+        scenes.append(
+            Scene.from_span(
+                buffer,
+                *text_span,
+                meta,
+                paragraphs,
+                scene_start_line,
+                line - 1 if body_stop > body_start else scene_start_line,
+                meta_start_line,
+                meta_end_line,
             )
-            scenes.append(scene)
-        i += 1
+        )
+        pos = _line_end(text, scene_close) + 1
+        if pos >= size:
+            break
 
     return Chapter(slug=slug, title=title, path=path, scenes=scenes)
 
 
 def parse_scene_meta(meta_block: str) -> Dict[str, Any]:
+    """Parse ``key:value`` pairs from a SCENE-START comment in time linear in its length."""
     content = meta_block.replace("<!--", "").replace("-->", "")
     content = content.replace("SCENE-START", "")
-    content = re.sub(r"\s+", " ", content).strip()
+    content = _WHITESPACE.sub(" ", content).strip()
 
     result: Dict[str, Any] = {}
-    i = 0
-    while i < len(content):
-        if content[i].isspace():
-            i += 1
-            continue
-        key_match = re.match(r"[A-Za-z_][A-Za-z0-9_-]*", content[i:])
-        if not key_match:
-            i += 1
-            continue
-        key = key_match.group(0)
-        i += len(key)
-        if i >= len(content) or content[i] != ":":
-            i += 1
-            continue
-        i += 1
-        while i < len(content) and content[i].isspace():
-            i += 1
-        if i >= len(content):
+    pos = 0
+    while True:
+        pair = _META_PAIR.search(content, pos)
+        if pair is None:
+            break
+        key, quoted, plain_list, bracket, bare = pair.groups()
+        key = sys.intern(key)
+        pos = pair.end()
+        if quoted is not None:
+            result[key] = quoted
+        elif plain_list is not None:
+            # Slugs in lists (characters, tags, zones) recur across scenes; keep one copy of each.
+            result[key] = [sys.intern(item) for item in plain_list[2:-2].split('","')]
+        elif bracket is not None:
+            result[key], pos = _parse_list(content, pair.start(4))
+        elif bare is not None:
+            result[key] = bare
+        else:
             break
-        value, i = _parse_value(content, i)
-        result[key] = value
     return result
 
 
-def _parse_value(content: str, start: int) -> Tuple[Any, int]:
-    if content[start] == '"':
-        end = start + 1
-        while end < len(content) and content[end] != '"':
-            end += 1
-        value = content[start + 1 : end]
-        return value, end + 1
-    if content[start] == '[':
-        end = start + 1
-        depth = 1
-        while end < len(content) and depth > 0:
-            if content[end] == '[':
-                depth += 1
-            elif content[end] == ']':
-                depth -= 1
-            end += 1
-        raw = content[start:end]
-        try:
-            value = json.loads(raw)
-        except json.JSONDecodeError:
-            value = raw
-        return value, end
-
-    end = start
-    while end < len(content) and not content[end].isspace():
-        end += 1
-    return content[start:end], end
-
-
-def _build_scene_meta(meta_dict: Dict[str, Any], meta_block: str) -> SceneMeta:
+def _parse_list(content: str, start: int) -> Tuple[Any, int]:
+    depth = 1
+    end = len(content)
+    for bracket in _BRACKET.finditer(content, start + 1):
+        depth += 1 if bracket.group(0) == "[" else -1
+        if depth == 0:
+            end = bracket.end()
+            break
+    raw = content[start:end]
+    try:
+        return json.loads(raw), end
+    except json.JSONDecodeError:
+        return raw, end
+
+
+def _build_scene_meta(
+    meta_dict: Dict[str, Any],
+    source: Union[bytes, str],
+    start: int = 0,
+    end: Optional[int] = None,
+) -> SceneMeta:
+    """Build the meta record; its ``raw_text`` is ``source[start:end]`` (all of ``source`` by default)."""
     def _coerce_list(val: Any) -> List[str]:
         if val is None:
             return []
@@ -172,62 +400,69 @@ def _build_scene_meta(meta_dict: Dict[str, Any], meta_block: str) -> SceneMeta:
     scene_id = str(meta_dict.get("id", ""))
     title = str(meta_dict.get("title", ""))
 
-    return SceneMeta(
-        id=scene_id,
-        title=title,
-        when=meta_dict.get("when"),
-        location=meta_dict.get("location"),
-        characters=_coerce_list(meta_dict.get("characters")),
-        tags=_coerce_list(meta_dict.get("tags")),
-        images=_coerce_list(meta_dict.get("images")),
-        raw=meta_dict,
-        raw_text=meta_block,
+    return SceneMeta.from_span(
+        source,
+        start,
+        len(source) if end is None else end,
+        scene_id,
+        title,
+        meta_dict.get("when"),
+        meta_dict.get("location"),
+        _coerce_list(meta_dict.get("characters")),
+        _coerce_list(meta_dict.get("tags")),
+        _coerce_list(meta_dict.get("images")),
+        meta_dict,
     )
 
 
-def _split_paragraphs(scene_lines: List[Tuple[int, str]]) -> List[Paragraph]:
-    paragraphs: List[Paragraph] = []
-    buffer: List[str] = []
-    start_line = None
-    last_line = None
-    idx = 1
-
-    for line_no, line_text in scene_lines:
-        if line_text.strip() == "":
-            if buffer:
-                paragraphs.append(
-                    Paragraph(
-                        idx=idx,
-                        text="\n".join(buffer).strip(),
-                        start_line=start_line or line_no,
-                        end_line=last_line or line_no,
-                    )
-                )
-                idx += 1
-                buffer = []
-                start_line = None
-                last_line = None
-            continue
-        if start_line is None:
-            start_line = line_no
-        buffer.append(line_text)
-        last_line = line_no
-
-    if buffer:
-        paragraphs.append(
-            Paragraph(
-                idx=idx,
-                text="\n".join(buffer).strip(),
-                start_line=start_line or (last_line or 1),
-                end_line=last_line or (start_line or 1),
-            )
-        )
-
-    return paragraphs
-
-
-def _extract_title(lines: List[str]) -> str:
-    for line in lines:
-        if line.startswith("# "):
-            return line[2:].strip()
-    return ""
+def _paragraph_spans(
+    text: str,
+    body_start: int,
+    body_stop: int,
+    byte_start: int,
+    first_line: int,
+    ascii: bool,
+) -> array:
+    """Packed spans of the paragraphs in ``text[body_start:body_stop]``.
+
+    ``byte_start`` is the UTF-8 offset of ``body_start``; for ASCII text the two agree and
+    no encoding is needed.
+    """
+    spans = array("q")
+    line = first_line
+    char, byte = body_start, byte_start
+    for match in _PARAGRAPH.finditer(text, body_start, body_stop):
+        start, end = match.span()
+        line += text.count("\n", char, start)
+        lines = text.count("\n", start, end)
+        if ascii:
+            byte, byte_end = start, end
+        else:
+            byte += len(text[char:start].encode("utf-8"))
+            byte_end = byte + len(match.group().encode("utf-8"))
+        spans.extend((byte, byte_end, line, line + lines))
+        char, byte, line = end, byte_end, line + lines
+    return spans
+
+
+def _byte_offsets(text: str, ascii: bool) -> Callable[[int], int]:
+    """Map character offsets in ``text`` to offsets in its UTF-8 encoding.
+
+    Offsets must be asked for in non-decreasing order; each call encodes only the text
+    since the previous one, so a whole chapter costs one pass.
+    """
+    if ascii:
+        return lambda pos: pos
+    state = [0, 0]  # character offset, byte offset
+
+    def offset(pos: int) -> int:
+        state[1] += len(text[state[0] : pos].encode("utf-8"))
+        state[0] = pos
+        return state[1]
+
+    return offset
+
+
+def _line_end(text: str, pos: int) -> int:
+    end = text.find("\n", pos)
+    return end if end >= 0 else len(text)
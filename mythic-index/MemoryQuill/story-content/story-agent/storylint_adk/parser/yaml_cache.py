@@ -0,0 +1,126 @@
+"""YAML loading with libyaml when available, plus an on-disk cache of parsed documents.
+
+Only the standard library and PyYAML are imported here, so scripts outside the package
+(``mythic-index/tools``, ``chapter-location-analyzer``) can share the cache with storylint.
+"""
+from __future__ import annotations
+
+import hashlib
+import marshal
+import os
+import sys
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Optional, Union
+
+import yaml
+
+from .chapter_cache import touch_entry
+
+# libyaml's loader builds the same documents as the pure-Python SafeLoader about 10x faster.
+SafeLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+# Bump when the entry layout changes; older entries are then ignored.
+FORMAT_VERSION = 1
+_RUNTIME = f"py{sys.version_info[0]}.{sys.version_info[1]}-marshal{marshal.version}-yaml{yaml.__version__}"
+
+
+def safe_load(stream: Union[str, bytes]) -> Any:
+    """``yaml.safe_load`` through ``SafeLoader``."""
+    return yaml.load(stream, Loader=SafeLoader)
+
+
+@dataclass
+class YamlCacheStats:
+    hits: int = 0
+    rehashed: int = 0
+    misses: int = 0
+    writes: int = 0
+
+
+class YamlCache:
+    """Stores each parsed document as a marshalled tuple in ``<root>/yaml/<path hash>.bin``.
+
+    Entries are checked the way ``ChapterCache`` checks chapters: an unchanged size and
+    mtime serves the entry without reading the file, and otherwise the file is read and
+    the entry is kept when its content hash still matches. Files that fail to parse are
+    cached too, and raise the same ``yaml.YAMLError`` message on every load. Documents
+    marshal cannot store (timestamps, custom tags) are parsed each time.
+    """
+
+    def __init__(self, root: Path) -> None:
+        self.root = root / "yaml"
+        self.stats = YamlCacheStats()
+
+    def load(self, path: Path) -> Any:
+        stat = path.stat()
+        signature = (stat.st_size, stat.st_mtime_ns)
+        entry_path = self._entry_path(path)
+        entry = self._read(entry_path)
+        valid = entry is not None and entry[1] == str(path)
+        if valid and tuple(entry[2]) == signature:
+            self.stats.hits += 1
+            touch_entry(entry_path)
+            return _document(entry)
+
+        data = path.read_bytes()
+        digest = hashlib.blake2b(data, digest_size=16).hexdigest()
+        if valid and entry[3] == digest:
+            self.stats.rehashed += 1
+            self._write(entry_path, (FORMAT_VERSION, str(path), signature, digest, *entry[4:]))
+            return _document(entry)
+
+        self.stats.misses += 1
+        try:
+            document = safe_load(data)
+        except yaml.YAMLError as exc:
+            self._write(entry_path, (FORMAT_VERSION, str(path), signature, digest, False, str(exc)))
+            raise
+        self._write(entry_path, (FORMAT_VERSION, str(path), signature, digest, True, document))
+        return document
+
+    def _entry_path(self, path: Path) -> Path:
+        name = hashlib.blake2b(f"{_RUNTIME}:{path}".encode("utf-8"), digest_size=16).hexdigest()
+        return self.root / f"{name}.bin"
+
+    def _read(self, entry_path: Path) -> Optional[tuple]:
+        try:
+            entry = marshal.loads(entry_path.read_bytes())
+        except (OSError, EOFError, ValueError, TypeError):
+            return None
+        if not isinstance(entry, tuple) or len(entry) != 6 or entry[0] != FORMAT_VERSION:
+            return None
+        return entry
+
+    def _write(self, entry_path: Path, entry: tuple) -> None:
+        try:
+            payload = marshal.dumps(entry)
+        except ValueError:
+            return  # not representable in marshal; parse again next time
+        try:
+            entry_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = entry_path.with_suffix(f".{os.getpid()}.tmp")
+            tmp.write_bytes(payload)
+            tmp.replace(entry_path)
+        except OSError:
+            return
+        self.stats.writes += 1
+
+
+def load_yaml(path: Path, cache_dir: Optional[Path] = None) -> Any:
+    """Parse the YAML file at ``path``, through the cache under ``cache_dir`` when one is given."""
+    if cache_dir is None:
+        return safe_load(path.read_bytes())
+    return yaml_cache(cache_dir).load(path)
+
+
+@lru_cache(maxsize=None)
+def yaml_cache(root: Path) -> YamlCache:
+    return YamlCache(root)
+
+
+def _document(entry: tuple) -> Any:
+    if not entry[4]:
+        raise yaml.YAMLError(entry[5])
+    return entry[5]
+
@@ -1,26 +1,136 @@
 from __future__ import annotations
 
 import asyncio
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Callable, Dict, Optional, Protocol, Tuple
 from uuid import uuid4
 
-try:
+from .ratelimit import TokenUsage
+
+if TYPE_CHECKING:
     from google.adk.runners import Runner
     from google.adk.sessions import InMemorySessionService
-    from google.genai import types
-except ImportError as exc:  # pragma: no cover - optional dependency for runtime
-    raise RuntimeError("google-adk is not installed. Install with: pip install google-adk") from exc
 
 
-async def run_agent_prompt(agent, prompt: str, user_id: str = "storylint") -> str:
-    session_service = InMemorySessionService()
+class AgentBackend(Protocol):
+    """Replaces the ADK Runner call, e.g. with ``simulated.SimulatedBackend`` for offline benchmarks."""
+
+    async def run(self, agent, prompt: str, usage: Optional[TokenUsage] = None) -> str: ...
+
+
+def _adk() -> Tuple[Any, Any, Any]:
+    """ADK's ``Runner`` and ``InMemorySessionService`` and genai ``types``, imported on first use.
+
+    Importing them takes about a second, so importing this module neither pays that cost
+    nor fails when google-adk is missing; only building a runner or calling a model does.
+    """
+    try:
+        from google.adk.runners import Runner
+        from google.adk.sessions import InMemorySessionService
+        from google.genai import types
+    except ImportError as exc:  # pragma: no cover - optional dependency for runtime
+        raise RuntimeError("google-adk is not installed. Install with: pip install google-adk") from exc
+    return Runner, InMemorySessionService, types
+
+
+@dataclass
+class OfflineAgent:
+    """What an agent builder sets on an ``LlmAgent``, for backends that never run the agent.
+
+    Builders accept it as ``agent_cls``, so a backend gets the real name, instruction and
+    output schema without google-adk being imported.
+    """
+
+    name: str
+    model: str
+    description: str = ""
+    instruction: str = ""
+    output_schema: Optional[type] = None
+    output_key: Optional[str] = None
+
+
+@dataclass
+class PooledRunner:
+    agent: object
+    runner: Runner
+    session_service: InMemorySessionService
+
+
+class AgentRunnerPool:
+    """Builds each agent, its Runner and session service once per pipeline run.
+
+    Calls only create a fresh session and delete it afterwards, so session state
+    does not accumulate across a large run. With ``offline`` (a backend replaces the ADK
+    Runner), builders make ``OfflineAgent`` records and no Runner is built.
+    """
+
+    def __init__(self, offline: bool = False) -> None:
+        self.offline = offline
+        self._entries: Dict[Tuple[str, str], PooledRunner] = {}
+        self._by_agent: Dict[int, PooledRunner] = {}
+        self._offline_agents: Dict[Tuple[str, str], OfflineAgent] = {}
+
+    def agent(self, builder: Callable[..., object], model: str):
+        if self.offline:
+            key = (builder.__name__, model)
+            if key not in self._offline_agents:
+                self._offline_agents[key] = builder(model, agent_cls=OfflineAgent)
+            return self._offline_agents[key]
+        return self._entry(builder, model).agent
+
+    def runner_for(self, agent) -> Optional[PooledRunner]:
+        return self._by_agent.get(id(agent))
+
+    def _entry(self, builder: Callable[[str], object], model: str) -> PooledRunner:
+        key = (builder.__name__, model)
+        entry = self._entries.get(key)
+        if entry is None:
+            Runner, InMemorySessionService, _ = _adk()
+            agent = builder(model)
+            session_service = InMemorySessionService()
+            runner = Runner(agent=agent, app_name=agent.name, session_service=session_service)
+            entry = PooledRunner(agent=agent, runner=runner, session_service=session_service)
+            self._entries[key] = entry
+            self._by_agent[id(agent)] = entry
+        return entry
+
+
+async def run_agent_prompt(
+    agent,
+    prompt: str,
+    user_id: str = "storylint",
+    usage: Optional[TokenUsage] = None,
+    pool: Optional[AgentRunnerPool] = None,
+    backend: Optional[AgentBackend] = None,
+) -> str:
+    if backend is not None:
+        return await backend.run(agent, prompt, usage=usage)
+    Runner, InMemorySessionService, types = _adk()
+    pooled = pool.runner_for(agent) if pool else None
+    if pooled is not None:
+        session_service = pooled.session_service
+        runner = pooled.runner
+    else:
+        session_service = InMemorySessionService()
+        runner = Runner(agent=agent, app_name=agent.name, session_service=session_service)
     session_id = uuid4().hex
     await session_service.create_session(app_name=agent.name, user_id=user_id, session_id=session_id)
-    runner = Runner(agent=agent, app_name=agent.name, session_service=session_service)
 
     message = types.Content(role="user", parts=[types.Part(text=prompt)])
-    async for event in runner.run_async(user_id=user_id, session_id=session_id, new_message=message):
-        if event.is_final_response() and event.content:
-            return event.content.parts[0].text
+    try:
+        async for event in runner.run_async(user_id=user_id, session_id=session_id, new_message=message):
+            metadata = getattr(event, "usage_metadata", None)
+            if usage is not None and metadata is not None:
+                usage.add(
+                    getattr(metadata, "prompt_token_count", None) or 0,
+                    getattr(metadata, "candidates_token_count", None) or 0,
+                    getattr(metadata, "total_token_count", None) or 0,
+                )
+            if event.is_final_response() and event.content:
+                return event.content.parts[0].text
+    finally:
+        if pooled is not None:
+            await session_service.delete_session(app_name=agent.name, user_id=user_id, session_id=session_id)
     raise RuntimeError("No final response received from agent.")
 
 
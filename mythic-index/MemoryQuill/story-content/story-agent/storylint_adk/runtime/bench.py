@@ -0,0 +1,130 @@
+"""End-to-end pipeline benchmark on a synthetic corpus with a simulated model backend."""
+from __future__ import annotations
+
+import asyncio
+import shutil
+import tempfile
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import List, Optional
+
+from ..config import CacheConfig, ConcurrencyConfig, StorylintConfig, write_config
+from ..tools.synthetic import CorpusSpec, generate_corpus
+from .runner import RunCompletedWithErrors, run_pipeline
+from .simulated import SimulatedBackend, SimulationProfile
+from .telemetry import TELEMETRY_NAME, load_records
+
+
+@dataclass
+class BenchResult:
+    label: str
+    chapters: int
+    calls: int
+    cache_hits: int
+    failed_calls: int
+    overloads: int
+    wall_sec: float
+    cpu_sec: float
+    model_busy_sec: float
+    capacity: int
+
+    @property
+    def avg_in_flight(self) -> float:
+        return self.model_busy_sec / self.wall_sec if self.wall_sec else 0.0
+
+    @property
+    def utilization(self) -> float:
+        """Average calls in flight over the configured concurrency of all stages."""
+        return self.avg_in_flight / self.capacity if self.capacity else 0.0
+
+    @property
+    def cpu_ms_per_call(self) -> float:
+        return self.cpu_sec * 1000 / self.calls if self.calls else 0.0
+
+
+def run_bench(
+    corpus: CorpusSpec,
+    profile: SimulationProfile,
+    window: int = 3,
+    repeat: int = 1,
+    use_cache: bool = False,
+    adaptive: bool = False,
+    workdir: Optional[Path] = None,
+    keep: bool = False,
+) -> List[BenchResult]:
+    """Run the full pipeline ``repeat`` times; with ``use_cache`` later repeats measure warm-cache runs."""
+    root = workdir or Path(tempfile.mkdtemp(prefix="storylint-bench-"))
+    try:
+        generate_corpus(root, corpus)
+        concurrency = ConcurrencyConfig(adaptive=adaptive)
+        cfg = StorylintConfig(
+            project_root=root,
+            chapters_dir=Path("chapters"),
+            characters_dir=Path("characters"),
+            locations_dir=Path("locations"),
+            runs_dir=Path("runs"),
+            concurrency=concurrency,
+            cache=CacheConfig(enabled=use_cache, dir=Path(".storylint-cache"), persist_canon=use_cache),
+            dashboard_interval_sec=0,
+        )
+        config_path = root / "storylint.yaml"
+        write_config(cfg, config_path)
+        capacity = concurrency.chapter_audit + concurrency.adjacent + concurrency.arc + concurrency.synthesis
+
+        results = []
+        for attempt in range(1, repeat + 1):
+            results.append(_run_once(f"run {attempt}", config_path, cfg, corpus, profile, window, use_cache, capacity))
+        return results
+    finally:
+        if not keep and workdir is None:
+            shutil.rmtree(root, ignore_errors=True)
+
+
+def _run_once(
+    label: str,
+    config_path: Path,
+    cfg: StorylintConfig,
+    corpus: CorpusSpec,
+    profile: SimulationProfile,
+    window: int,
+    use_cache: bool,
+    capacity: int,
+) -> BenchResult:
+    backend = SimulatedBackend(profile)
+    run_id = f"bench-{label.replace(' ', '-')}"  # fresh run dir per repeat, so only the cache carries over
+    cpu_started = time.process_time()
+    started = time.perf_counter()
+    try:
+        asyncio.run(
+            run_pipeline(
+                start=None,
+                end=None,
+                mode="full",
+                window=window,
+                run_id=run_id,
+                force=False,
+                config_path=str(config_path),
+                use_cache=use_cache,
+                backend=backend,
+                quiet=True,
+            )
+        )
+    except RunCompletedWithErrors:
+        pass  # failed calls are counted from telemetry below
+    wall = time.perf_counter() - started
+    cpu = time.process_time() - cpu_started
+
+    records = load_records(cfg.runs_dir / run_id / "final" / TELEMETRY_NAME)
+    return BenchResult(
+        label=label,
+        chapters=corpus.chapters,
+        calls=len(records),
+        cache_hits=sum(1 for record in records if record.cached),
+        failed_calls=sum(1 for record in records if not record.ok),
+        overloads=backend.overloads,
+        wall_sec=round(wall, 3),
+        cpu_sec=round(cpu, 3),
+        model_busy_sec=round(sum(record.model_sec for record in records), 3),
+        capacity=capacity,
+    )
@@ -0,0 +1,146 @@
+"""Content-addressed response cache for Storylint ADK model calls."""
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from ..config import StorylintConfig
+from ..store.artifacts import write_json
+
+CACHE_VERSION = 1
+# Everything ``prune`` bounds under ``cache.dir``: model responses, and the marshalled
+# parsed-chapter and parsed-YAML entries, which share the same age and size limits.
+PRUNED_ENTRIES = ("*/*.json", "chapters/*.bin", "yaml/*.bin")
+
+
+@dataclass
+class CacheStats:
+    hits: int = 0
+    misses: int = 0
+    writes: int = 0
+    evicted: int = 0
+
+
+def make_cache_key(prompt: str, model: str, instruction: str, schema: Any) -> str:
+    payload = json.dumps(
+        {
+            "version": CACHE_VERSION,
+            "model": model,
+            "instruction": instruction,
+            "schema": schema,
+            "prompt": prompt,
+        },
+        sort_keys=True,
+        ensure_ascii=True,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def cache_key_for_agent(agent, prompt: str) -> str:
+    schema_cls = getattr(agent, "output_schema", None)
+    schema = schema_cls.model_json_schema() if schema_cls is not None else None
+    instruction = getattr(agent, "instruction", "")
+    return make_cache_key(
+        prompt=prompt,
+        model=str(getattr(agent, "model", "")),
+        instruction=instruction if isinstance(instruction, str) else repr(instruction),
+        schema=schema,
+    )
+
+
+class ResponseCache:
+    """Stores validated model responses on disk, keyed by prompt/model/agent hash.
+
+    Entries live in ``<root>/<key[:2]>/<key>.json``. Reads refresh the file mtime so
+    size-based eviction drops the least recently used entries first.
+    """
+
+    def __init__(self, root: Path, max_bytes: int, max_age_days: float) -> None:
+        self.root = root
+        self.max_bytes = max_bytes
+        self.max_age_sec = max_age_days * 86400 if max_age_days > 0 else 0.0
+        self.stats = CacheStats()
+
+    @classmethod
+    def from_config(cls, cfg: StorylintConfig) -> "ResponseCache":
+        return cls(cfg.cache.dir, cfg.cache.max_bytes, cfg.cache.max_age_days)
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        path = self._entry_path(key)
+        try:
+            stat = path.stat()
+        except FileNotFoundError:
+            self.stats.misses += 1
+            return None
+        if self._expired(stat.st_mtime, time.time()):
+            path.unlink(missing_ok=True)
+            self.stats.evicted += 1
+            self.stats.misses += 1
+            return None
+        try:
+            entry = json.loads(path.read_text())
+        except Exception:
+            path.unlink(missing_ok=True)
+            self.stats.misses += 1
+            return None
+        os.utime(path)
+        self.stats.hits += 1
+        return entry.get("response")
+
+    def put(self, key: str, response: Dict[str, Any], model: str) -> None:
+        write_json(
+            self._entry_path(key),
+            {
+                "key": key,
+                "model": model,
+                "created_at": time.time(),
+                "response": response,
+            },
+        )
+        self.stats.writes += 1
+
+    def prune(self) -> int:
+        """Drop expired entries, then the least recently used ones until under max_bytes.
+
+        Parsed-chapter and parsed-YAML entries count against the same bounds; their caches
+        refresh an entry's mtime when they serve it, so recency works the same way.
+        """
+        if not self.root.exists():
+            return 0
+        now = time.time()
+        removed = 0
+        entries: list[tuple[float, int, Path]] = []
+        paths = [path for pattern in PRUNED_ENTRIES for path in self.root.glob(pattern)]
+        for path in paths:
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            if self._expired(stat.st_mtime, now):
+                path.unlink(missing_ok=True)
+                removed += 1
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+
+        total = sum(size for _, size, _ in entries)
+        if self.max_bytes > 0 and total > self.max_bytes:
+            for _, size, path in sorted(entries, key=lambda item: item[0]):
+                if total <= self.max_bytes:
+                    break
+                path.unlink(missing_ok=True)
+                total -= size
+                removed += 1
+
+        self.stats.evicted += removed
+        return removed
+
+    def _entry_path(self, key: str) -> Path:
+        return self.root / key[:2] / f"{key}.json"
+
+    def _expired(self, mtime: float, now: float) -> bool:
+        return bool(self.max_age_sec) and now - mtime > self.max_age_sec
@@ -0,0 +1,195 @@
+"""Offline integrity check: every deterministic validator over every chapter, no models involved.
+
+Only config, parser and tools modules are imported here (never ``agents`` or ``adk_client``),
+so ``storylint check`` starts quickly enough for editor save hooks and pre-commit.
+"""
+from __future__ import annotations
+
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence
+
+from ..config import StorylintConfig
+from ..models import Issue
+from ..parser.scene_parser import load_chapter
+from ..tools.inventory import RepoInventory
+from ..tools.repo_tools import discover_chapters, validate_imagery, validate_slugs
+from .prepare import map_chapters
+
+SEVERITIES = ("minor", "moderate", "major")
+# Findings at or above this severity fail the check; "never" only fails on parse errors.
+FAIL_ON = SEVERITIES + ("never",)
+SARIF_LEVELS = {"major": "error", "moderate": "warning", "minor": "note"}
+SARIF_SCHEMA = "https://json.schemastore.org/sarif-2.1.0.json"
+EXIT_OK = 0
+EXIT_FINDINGS = 1
+EXIT_ERRORS = 2
+
+
+@dataclass
+class CheckFinding:
+    issue: Issue
+    file: Path
+    line: Optional[int] = None
+
+
+@dataclass
+class ChapterCheck:
+    path: Path
+    findings: List[CheckFinding] = field(default_factory=list)
+    error: Optional[str] = None
+
+
+@dataclass
+class CheckResult:
+    root: Path
+    chapters: List[ChapterCheck]
+    elapsed_sec: float = 0.0
+
+    @property
+    def findings(self) -> List[CheckFinding]:
+        return [finding for chapter in self.chapters for finding in chapter.findings]
+
+    @property
+    def errors(self) -> List[ChapterCheck]:
+        return [chapter for chapter in self.chapters if chapter.error is not None]
+
+    def counts(self) -> Dict[str, int]:
+        counts = {severity: 0 for severity in SEVERITIES}
+        for finding in self.findings:
+            counts[finding.issue.severity] += 1
+        counts["errors"] = len(self.errors)
+        return counts
+
+    def exit_code(self, fail_on: str = "major") -> int:
+        if self.errors:
+            return EXIT_ERRORS
+        if fail_on == "never":
+            return EXIT_OK
+        threshold = SEVERITIES.index(fail_on)
+        failing = any(SEVERITIES.index(finding.issue.severity) >= threshold for finding in self.findings)
+        return EXIT_FINDINGS if failing else EXIT_OK
+
+
+def run_check(
+    cfg: StorylintConfig,
+    paths: Optional[Sequence[Path]] = None,
+    workers: Optional[int] = None,
+) -> CheckResult:
+    """Parse and validate ``paths`` (default: every chapter) across the prepare process pool.
+
+    A chapter that cannot be read or parsed is reported as an error instead of stopping
+    the check. Results follow the order of ``paths``.
+    """
+    started = time.perf_counter()
+    chapter_paths = list(paths) if paths is not None else discover_chapters(cfg)
+    inventory = RepoInventory.from_config(cfg)
+    chapters = map_chapters(_check_batch, chapter_paths, cfg, inventory, workers)
+    return CheckResult(root=cfg.project_root, chapters=chapters, elapsed_sec=time.perf_counter() - started)
+
+
+def check_json(result: CheckResult) -> Dict[str, Any]:
+    return {
+        "version": 1,
+        "root": str(result.root),
+        "chapters": len(result.chapters),
+        "elapsed_sec": round(result.elapsed_sec, 3),
+        "summary": result.counts(),
+        "findings": [
+            {**finding.issue.model_dump(mode="json"), "file": _relative(finding.file, result.root), "line": finding.line}
+            for finding in result.findings
+        ],
+        "errors": [{"file": _relative(chapter.path, result.root), "message": chapter.error} for chapter in result.errors],
+    }
+
+
+def check_sarif(result: CheckResult) -> Dict[str, Any]:
+    """SARIF 2.1.0 log with one rule per issue type plus ``parse`` for unreadable chapters."""
+    results = []
+    for finding in result.findings:
+        issue = finding.issue
+        results.append(
+            {
+                "ruleId": issue.type,
+                "level": SARIF_LEVELS[issue.severity],
+                "message": {"text": f"{issue.explanation} {issue.suggested_action}"},
+                "locations": [_sarif_location(finding.file, finding.line, result.root, issue.location)],
+                "properties": {"severity": issue.severity, "evidence_refs": issue.evidence_refs},
+            }
+        )
+    for chapter in result.errors:
+        results.append(
+            {
+                "ruleId": "parse",
+                "level": "error",
+                "message": {"text": chapter.error},
+                "locations": [_sarif_location(chapter.path, None, result.root, None)],
+            }
+        )
+    rule_ids = sorted({entry["ruleId"] for entry in results})
+    return {
+        "$schema": SARIF_SCHEMA,
+        "version": "2.1.0",
+        "runs": [
+            {
+                "tool": {"driver": {"name": "storylint", "rules": [{"id": rule_id} for rule_id in rule_ids]}},
+                "originalUriBaseIds": {"ROOT": {"uri": result.root.as_uri() + "/"}},
+                "results": results,
+            }
+        ],
+    }
+
+
+def check_text(result: CheckResult) -> List[str]:
+    lines = []
+    for finding in result.findings:
+        where = _relative(finding.file, result.root) + (f":{finding.line}" if finding.line else "")
+        issue = finding.issue
+        lines.append(f"{where}: {issue.severity} {issue.type}: {issue.explanation} [{issue.location}]")
+    for chapter in result.errors:
+        lines.append(f"{_relative(chapter.path, result.root)}: error parse: {chapter.error}")
+    counts = result.counts()
+    lines.append(
+        f"{len(result.chapters)} chapter(s) in {result.elapsed_sec:.2f}s: "
+        f"{counts['major']} major, {counts['moderate']} moderate, {counts['minor']} minor, {counts['errors']} error(s)"
+    )
+    return lines
+
+
+def _check_batch(paths: List[Path], cfg: StorylintConfig, inventory: RepoInventory) -> List[ChapterCheck]:
+    checks = []
+    for path in paths:
+        try:
+            chapter = load_chapter(path, cfg)
+        except (OSError, UnicodeDecodeError, ValueError) as exc:
+            checks.append(ChapterCheck(path=path, error=str(exc)))
+            continue
+        # Findings point at "<chapter>:<scene id>" or "<chapter>:<imagery file>"; map them to a file and line.
+        scene_lines = {scene.meta.id: scene.meta_start_line for scene in chapter.scenes}
+        findings = []
+        for issue in validate_slugs(chapter, cfg, inventory) + validate_imagery(chapter, cfg, inventory):
+            anchor = issue.location.split(":", 1)[-1]
+            if anchor in cfg.imagery_filenames:
+                findings.append(CheckFinding(issue, path.parent / anchor))
+            else:
+                findings.append(CheckFinding(issue, path, scene_lines.get(anchor)))
+        checks.append(ChapterCheck(path=path, findings=findings))
+    return checks
+
+
+def _sarif_location(path: Path, line: Optional[int], root: Path, logical: Optional[str]) -> Dict[str, Any]:
+    physical: Dict[str, Any] = {"artifactLocation": {"uri": _relative(path, root), "uriBaseId": "ROOT"}}
+    if line:
+        physical["region"] = {"startLine": line}
+    location: Dict[str, Any] = {"physicalLocation": physical}
+    if logical:
+        location["logicalLocations"] = [{"fullyQualifiedName": logical}]
+    return location
+
+
+def _relative(path: Path, root: Path) -> str:
+    try:
+        return path.relative_to(root).as_posix()
+    except ValueError:
+        return path.as_posix()
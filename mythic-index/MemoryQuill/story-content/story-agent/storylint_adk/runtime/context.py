@@ -0,0 +1,49 @@
+"""Run-scoped services shared by every Storylint pipeline stage."""
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
+
+from ..config import StorylintConfig
+from ..models import Issue
+from ..tools.canon_store import CanonStore
+from .cache import ResponseCache
+from .dashboard import DashboardAggregator
+from .journal import RunJournal
+from .limits import AdaptiveLimiter, build_stage_limiters
+from .payloads import PayloadCache
+from .ratelimit import configure_rate_limits
+from .telemetry import TelemetryLedger
+
+if TYPE_CHECKING:  # only needed for annotations
+    from .adk_client import AgentBackend, AgentRunnerPool
+
+
+@dataclass
+class RunContext:
+    cache: Optional[ResponseCache] = None
+    read_cache: bool = True
+    limiters: Dict[str, AdaptiveLimiter] = field(default_factory=dict)
+    runners: Optional["AgentRunnerPool"] = None
+    backend: Optional["AgentBackend"] = None
+    canon: Optional[CanonStore] = None
+    payloads: Optional[PayloadCache] = None
+    prompt_cuts: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+    journal: Optional[RunJournal] = None
+    dashboard: Optional[DashboardAggregator] = None
+    telemetry: Optional[TelemetryLedger] = None
+    # Deterministic findings per chapter slug, computed once by ``prepare_chapters``.
+    integrity: Dict[str, List[Issue]] = field(default_factory=dict)
+
+
+def build_run_context(cfg: StorylintConfig, use_cache: bool = True, force: bool = False) -> RunContext:
+    cache = ResponseCache.from_config(cfg) if use_cache and cfg.cache.enabled else None
+    configure_rate_limits(cfg.rate_limits)
+    # --force still refreshes cache entries, it just never serves stale ones.
+    return RunContext(
+        cache=cache,
+        read_cache=not force,
+        limiters=build_stage_limiters(cfg),
+        canon=CanonStore.from_config(cfg),
+        payloads=PayloadCache(cfg),
+    )
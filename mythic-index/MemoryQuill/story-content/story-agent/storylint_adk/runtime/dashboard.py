@@ -0,0 +1,133 @@
+"""Streaming aggregation of report issues into the run dashboard."""
+from __future__ import annotations
+
+import json
+import time
+from collections import Counter
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from ..models import DashboardSummary
+from ..store.artifacts import write_json, write_text
+from ..store.render_md import render_markdown
+
+STAGES = ("chapter", "adjacent", "arc")
+TOP_CHAPTERS = 5
+
+IssueKey = Tuple[str, str]
+
+
+class DashboardAggregator:
+    """Keeps dashboard counts current as reports arrive instead of re-reading them at the end.
+
+    Each report's contribution is stored under its task key, so a report that is
+    produced again (``--force``, resume) replaces its earlier counts rather than
+    adding to them.
+    """
+
+    def __init__(
+        self,
+        run_dir: Path,
+        run_id: str,
+        mode: str,
+        window: int,
+        totals: Dict[str, int],
+        interval_sec: float = 30.0,
+    ) -> None:
+        self.run_dir = run_dir
+        self.run_id = run_id
+        self.mode = mode
+        self.window = window
+        self.totals = {stage: totals.get(stage, 0) for stage in STAGES}
+        self.interval_sec = interval_sec
+        self.by_severity: Counter[str] = Counter()
+        self.by_type: Counter[str] = Counter()
+        self.by_chapter: Counter[str] = Counter()
+        self._contributions: Dict[str, Tuple[str, Optional[str], List[IssueKey]]] = {}
+        self._completed: Counter[str] = Counter()
+        self._last_write = float("-inf")
+
+    def add_report(self, stage: str, key: str, data: Dict[str, Any]) -> None:
+        if stage == "chapter":
+            chapter_slug = data.get("chapter_slug") or key.split(":", 1)[-1]
+            issues = (data.get("issues") or []) + (data.get("integrity_findings") or [])
+        elif stage == "adjacent":
+            chapter_slug = None
+            issues = data.get("findings") or []
+        else:
+            chapter_slug = None
+            issues = []
+        self._remove(key)
+        counted = [(issue.get("severity", "unknown"), issue.get("type", "unknown")) for issue in issues]
+        self._contributions[key] = (stage, chapter_slug, counted)
+        self._completed[stage] += 1
+        for severity, issue_type in counted:
+            self.by_severity[severity] += 1
+            self.by_type[issue_type] += 1
+        if chapter_slug and counted:
+            self.by_chapter[chapter_slug] += len(counted)
+
+    def add_existing(self, stage: str, key: str, path: Path) -> None:
+        """Feed a report produced before this process (copied forward, resumed or not forced)."""
+        try:
+            data = json.loads(path.read_text())
+        except Exception:
+            return
+        self.add_report(stage, key, data)
+
+    def summary(self, error_count: int, recent_errors: List[str]) -> DashboardSummary:
+        top_chapters = [
+            {"chapter": slug, "issue_count": count}
+            for slug, count in sorted(self.by_chapter.items(), key=lambda item: item[1], reverse=True)[:TOP_CHAPTERS]
+        ]
+        return DashboardSummary(
+            run_id=self.run_id,
+            generated_at=datetime.utcnow().isoformat() + "Z",
+            mode=self.mode,
+            window=self.window,
+            counts={
+                "chapters_total": self.totals["chapter"],
+                "chapters_completed": self._completed["chapter"],
+                "adjacent_total": self.totals["adjacent"],
+                "adjacent_completed": self._completed["adjacent"],
+                "arc_total": self.totals["arc"],
+                "arc_completed": self._completed["arc"],
+                "errors": error_count,
+            },
+            issues={
+                "total": sum(self.by_severity.values()),
+                "by_severity": dict(self.by_severity),
+                "by_type": dict(self.by_type),
+            },
+            top_chapters=top_chapters,
+            errors=recent_errors,
+        )
+
+    def write(self, error_count: int, recent_errors: List[str]) -> None:
+        summary = self.summary(error_count, recent_errors).model_dump(mode="json")
+        write_json(self.run_dir / "final" / "dashboard.json", summary)
+        write_text(self.run_dir / "final" / "dashboard.md", render_markdown("dashboard.md.j2", {"dashboard": summary}))
+        self._last_write = time.monotonic()
+
+    def maybe_write(self, error_count: int, recent_errors: List[str]) -> bool:
+        """Write a live snapshot if ``interval_sec`` has passed since the last one."""
+        if self.interval_sec <= 0 or time.monotonic() - self._last_write < self.interval_sec:
+            return False
+        self.write(error_count, recent_errors)
+        return True
+
+    def _remove(self, key: str) -> None:
+        previous = self._contributions.pop(key, None)
+        if previous is None:
+            return
+        stage, chapter_slug, counted = previous
+        self._completed[stage] -= 1
+        for severity, issue_type in counted:
+            self.by_severity[severity] -= 1
+            self.by_type[issue_type] -= 1
+        if chapter_slug and counted:
+            self.by_chapter[chapter_slug] -= len(counted)
+        for counter in (self.by_severity, self.by_type, self.by_chapter):
+            for name in [name for name, count in counter.items() if count <= 0]:
+                del counter[name]
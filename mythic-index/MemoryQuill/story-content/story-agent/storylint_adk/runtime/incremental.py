@@ -0,0 +1,201 @@
+"""Cross-run incremental support: fingerprint inputs and copy forward unchanged artifacts."""
+from __future__ import annotations
+
+import hashlib
+import json
+import shutil
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from ..config import StorylintConfig
+from ..models import Issue
+from ..parser.scene_parser import Chapter
+from ..parser.slug_index import build_slug_index
+from ..store.artifacts import write_json
+from ..store.render_md import TEMPLATE_DIR
+from ..tools.canon_store import CanonStore
+from ..tools.repo_tools import load_canon_snapshot, validate_imagery, validate_slugs
+from .prompting import PROMPT_DIR
+
+MANIFEST_NAME = "manifest.json"
+MANIFEST_VERSION = 1
+
+
+@dataclass
+class RunManifest:
+    chapters: Dict[str, str] = field(default_factory=dict)
+    adjacent: Dict[str, str] = field(default_factory=dict)
+    arc: Dict[str, str] = field(default_factory=dict)
+
+
+@dataclass
+class CopyForwardResult:
+    source_run: Optional[Path] = None
+    chapters: List[str] = field(default_factory=list)
+    adjacent: List[str] = field(default_factory=list)
+    arc: List[str] = field(default_factory=list)
+
+    @property
+    def total(self) -> int:
+        return len(self.chapters) + len(self.adjacent) + len(self.arc)
+
+
+def chapter_fingerprint(
+    chapter: Chapter,
+    cfg: StorylintConfig,
+    canon: Optional[CanonStore] = None,
+    findings: Optional[List[Issue]] = None,
+) -> str:
+    """Hash everything a chapter audit prompt is built from, plus its deterministic findings."""
+    if findings is None:
+        findings = validate_slugs(chapter, cfg) + validate_imagery(chapter, cfg)
+    slug_index = build_slug_index(chapter)
+
+    def _snapshot(slug: str, base_dir: Path) -> str:
+        if canon is not None:
+            return canon.snapshot(slug, base_dir)
+        return load_canon_snapshot(slug, base_dir, cfg.canon_snapshot_chars)
+
+    payload = {
+        "slug": chapter.slug,
+        "title": chapter.title,
+        "scenes": [{"meta": scene.meta.raw, "text": scene.text} for scene in chapter.scenes],
+        "canon": {
+            "characters": {slug: _snapshot(slug, cfg.characters_dir) for slug in slug_index.characters},
+            "locations": {slug: _snapshot(slug, cfg.locations_dir) for slug in slug_index.locations},
+        },
+        "integrity": [issue.model_dump(mode="json") for issue in findings],
+        "prompt": cfg.prompt.model_dump(mode="json"),
+    }
+    return _digest(payload)
+
+
+def stage_fingerprint(agent: Any, *templates: str) -> str:
+    """Hash what a stage's reports depend on besides their inputs.
+
+    Covers the agent's model, instruction and output schema (as ``cache_key_for_agent``
+    does) and the source of each named prompt or report template, so editing any of them
+    stops earlier reports from being copied forward.
+    """
+    schema_cls = getattr(agent, "output_schema", None)
+    instruction = getattr(agent, "instruction", "")
+    return _digest(
+        {
+            "model": str(getattr(agent, "model", "")),
+            "instruction": instruction if isinstance(instruction, str) else repr(instruction),
+            "schema": schema_cls.model_json_schema() if schema_cls is not None else None,
+            "templates": {name: _template_source(name) for name in templates},
+        }
+    )
+
+
+def build_manifest(
+    chapters: list[Chapter],
+    adjacent_pairs: list[tuple[Chapter, Chapter]],
+    windows: list[list[Chapter]],
+    cfg: StorylintConfig,
+    models: Dict[str, str],
+    canon: Optional[CanonStore] = None,
+    integrity: Optional[Dict[str, List[Issue]]] = None,
+    stages: Optional[Dict[str, str]] = None,
+) -> RunManifest:
+    """``stages`` maps ``models``' keys to each stage's ``stage_fingerprint``."""
+    integrity = integrity or {}
+    stages = stages or {}
+    chapter_fps = {
+        chapter.slug: chapter_fingerprint(chapter, cfg, canon, integrity.get(chapter.slug)) for chapter in chapters
+    }
+    manifest = RunManifest()
+    for slug, fp in chapter_fps.items():
+        manifest.chapters[slug] = _digest([fp, models.get("chapter_audit"), stages.get("chapter_audit")])
+    for left, right in adjacent_pairs:
+        manifest.adjacent[f"{left.slug}_{right.slug}"] = _digest(
+            [chapter_fps[left.slug], chapter_fps[right.slug], models.get("adjacent_flow"), stages.get("adjacent_flow")]
+        )
+    for window_chapters in windows:
+        window_slug = f"{window_chapters[0].slug}-{window_chapters[-1].slug}"
+        manifest.arc[window_slug] = _digest(
+            [chapter_fps[chapter.slug] for chapter in window_chapters]
+            + [models.get("arc_window"), stages.get("arc_window")]
+        )
+    return manifest
+
+
+def write_manifest(run_dir: Path, manifest: RunManifest) -> None:
+    write_json(
+        run_dir / MANIFEST_NAME,
+        {
+            "version": MANIFEST_VERSION,
+            "chapters": manifest.chapters,
+            "adjacent": manifest.adjacent,
+            "arc": manifest.arc,
+        },
+    )
+
+
+def load_manifest(run_dir: Path) -> Optional[RunManifest]:
+    try:
+        data = json.loads((run_dir / MANIFEST_NAME).read_text())
+    except Exception:
+        return None
+    if data.get("version") != MANIFEST_VERSION:
+        return None
+    return RunManifest(
+        chapters=data.get("chapters") or {},
+        adjacent=data.get("adjacent") or {},
+        arc=data.get("arc") or {},
+    )
+
+
+def find_previous_run(runs_dir: Path, exclude: Path) -> Optional[Path]:
+    """Return the most recently written run directory that has a manifest."""
+    candidates = []
+    for manifest_path in runs_dir.glob(f"*/{MANIFEST_NAME}"):
+        run_dir = manifest_path.parent
+        if run_dir.resolve() == exclude.resolve():
+            continue
+        candidates.append((manifest_path.stat().st_mtime, run_dir))
+    if not candidates:
+        return None
+    return max(candidates, key=lambda item: item[0])[1]
+
+
+def copy_forward(previous_dir: Path, run_dir: Path, manifest: RunManifest) -> CopyForwardResult:
+    """Copy reports whose input fingerprint matches the previous run into this run."""
+    result = CopyForwardResult(source_run=previous_dir)
+    previous = load_manifest(previous_dir)
+    if previous is None:
+        return result
+    for folder, current, prior, copied in [
+        ("chapter", manifest.chapters, previous.chapters, result.chapters),
+        ("adjacent", manifest.adjacent, previous.adjacent, result.adjacent),
+        ("arc", manifest.arc, previous.arc, result.arc),
+    ]:
+        for key, fp in current.items():
+            if prior.get(key) != fp:
+                continue
+            source = previous_dir / folder / f"{key}.report.json"
+            if not source.exists():
+                continue
+            target_dir = run_dir / folder
+            target_dir.mkdir(parents=True, exist_ok=True)
+            shutil.copy2(source, target_dir / source.name)
+            source_md = previous_dir / folder / f"{key}.report.md"
+            if source_md.exists():
+                shutil.copy2(source_md, target_dir / source_md.name)
+            copied.append(key)
+    return result
+
+
+def _template_source(name: str) -> str:
+    for directory in (PROMPT_DIR, TEMPLATE_DIR):
+        path = directory / name
+        if path.exists():
+            return path.read_text()
+    raise FileNotFoundError(name)
+
+
+def _digest(payload: Any) -> str:
+    data = json.dumps(payload, sort_keys=True, ensure_ascii=True, default=str)
+    return hashlib.sha256(data.encode("utf-8")).hexdigest()
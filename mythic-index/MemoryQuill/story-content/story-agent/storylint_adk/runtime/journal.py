@@ -0,0 +1,134 @@
+"""Append-only JSONL journal of a run's plan and task state transitions."""
+from __future__ import annotations
+
+import json
+import time
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional, TextIO
+
+JOURNAL_NAME = "journal.jsonl"
+JOURNAL_VERSION = 1
+
+QUEUED = "queued"
+STARTED = "started"
+SUCCEEDED = "succeeded"
+FAILED = "failed"
+
+
+@dataclass
+class RunSpec:
+    """Everything needed to rebuild a run's task graph without re-resolving the chapter range."""
+
+    run_id: str
+    mode: str
+    window: int
+    force: bool
+    chapters: List[str]
+    models: Dict[str, str]
+    synthesis_fan_in: int
+
+
+@dataclass
+class JournalState:
+    spec: RunSpec
+    status: Dict[str, str] = field(default_factory=dict)
+    attempts: Dict[str, int] = field(default_factory=dict)
+    errors: Dict[str, str] = field(default_factory=dict)
+
+    @property
+    def succeeded(self) -> set[str]:
+        return {key for key, state in self.status.items() if state == SUCCEEDED}
+
+    @property
+    def unfinished(self) -> set[str]:
+        return {key for key, state in self.status.items() if state != SUCCEEDED}
+
+
+class RunJournal:
+    """Writes one JSON object per line and flushes each, so a killed run loses at most one event."""
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self._handle: Optional[TextIO] = None
+        self._started: Dict[str, float] = {}
+
+    @classmethod
+    def for_run(cls, run_dir: Path) -> "RunJournal":
+        return cls(run_dir / JOURNAL_NAME)
+
+    def record(self, event: str, **fields: Any) -> None:
+        if self._handle is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            torn = _ends_mid_line(self.path)
+            self._handle = self.path.open("a", encoding="utf-8")
+            if torn:
+                self._handle.write("\n")
+        entry = {"ts": round(time.time(), 3), "event": event, **fields}
+        self._handle.write(json.dumps(entry, ensure_ascii=True) + "\n")
+        self._handle.flush()
+
+    def plan(self, spec: RunSpec) -> None:
+        self.record("plan", version=JOURNAL_VERSION, spec=asdict(spec))
+
+    def queued(self, task: str, stage: str) -> None:
+        self.record(QUEUED, task=task, stage=stage)
+
+    def started(self, task: str, stage: str) -> None:
+        self._started[task] = time.monotonic()
+        self.record(STARTED, task=task, stage=stage)
+
+    def finished(self, task: str, stage: str, error: Optional[BaseException] = None) -> None:
+        started = self._started.pop(task, None)
+        elapsed = round(time.monotonic() - started, 3) if started is not None else None
+        if error is None:
+            self.record(SUCCEEDED, task=task, stage=stage, elapsed=elapsed)
+        else:
+            self.record(FAILED, task=task, stage=stage, elapsed=elapsed, error=f"{error.__class__.__name__}: {error}")
+
+    def retry(self, task: str, attempt: int, error: BaseException) -> None:
+        self.record("retry", task=task, attempt=attempt, error=f"{error.__class__.__name__}: {error}")
+
+    def close(self) -> None:
+        if self._handle is not None:
+            self._handle.close()
+            self._handle = None
+
+
+def _ends_mid_line(path: Path) -> bool:
+    try:
+        with path.open("rb") as handle:
+            handle.seek(-1, 2)
+            return handle.read(1) != b"\n"
+    except OSError:
+        return False
+
+
+def load_journal(path: Path) -> JournalState:
+    """Replay a journal into the latest state per task; a torn final line is ignored."""
+    state: Optional[JournalState] = None
+    with path.open(encoding="utf-8") as handle:
+        for line in handle:
+            try:
+                entry = json.loads(line)
+            except json.JSONDecodeError:
+                continue
+            event = entry.get("event")
+            if event == "plan":
+                if entry.get("version") != JOURNAL_VERSION:
+                    raise ValueError(f"Unsupported journal version in {path}")
+                if state is None:
+                    state = JournalState(spec=RunSpec(**entry["spec"]))
+                continue
+            if state is None or "task" not in entry:
+                continue
+            task = entry["task"]
+            if event in (QUEUED, STARTED, SUCCEEDED, FAILED):
+                state.status[task] = event
+            if event == STARTED:
+                state.attempts[task] = state.attempts.get(task, 0) + 1
+            elif event == FAILED:
+                state.errors[task] = entry.get("error", "")
+    if state is None:
+        raise ValueError(f"Journal {path} has no plan record")
+    return state
@@ -0,0 +1,139 @@
+"""Adaptive (AIMD) concurrency limits for model-calling pipeline stages."""
+from __future__ import annotations
+
+import asyncio
+import time
+from typing import Callable, Dict, Optional
+
+from ..config import StorylintConfig
+
+ChangeCallback = Callable[["AdaptiveLimiter"], None]
+
+OVERLOAD_MARKERS = (
+    "429",
+    "resource_exhausted",
+    "resource exhausted",
+    "too many requests",
+    "rate limit",
+    "quota",
+    "overloaded",
+    "503",
+    "unavailable",
+)
+
+
+def is_overload_error(exc: BaseException) -> bool:
+    """True for provider quota/overload errors (HTTP 429/503 and their gRPC names)."""
+    for attr in ("code", "status_code"):
+        if getattr(exc, attr, None) in (429, 503):
+            return True
+    text = f"{exc.__class__.__name__} {exc}".lower()
+    return any(marker in text for marker in OVERLOAD_MARKERS)
+
+
+class AdaptiveLimiter:
+    """Concurrency limiter whose window grows additively and shrinks multiplicatively.
+
+    Each success adds ``increase / window`` (about +increase per full window of
+    successes); an overload error multiplies the window by ``decrease``. Cuts are
+    rate-limited by ``cooldown_sec`` so one burst of 429s from calls that were already
+    in flight only halves the window once.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        initial: int,
+        minimum: int = 1,
+        maximum: Optional[int] = None,
+        increase: float = 1.0,
+        decrease: float = 0.5,
+        cooldown_sec: float = 5.0,
+    ) -> None:
+        self.name = name
+        self.minimum = max(1, minimum)
+        self.maximum = max(self.minimum, maximum if maximum is not None else initial)
+        self.increase = increase
+        self.decrease = decrease
+        self.cooldown_sec = cooldown_sec
+        self.in_flight = 0
+        self.on_change: Optional[ChangeCallback] = None
+        self._window = float(min(max(initial, self.minimum), self.maximum))
+        self._last_cut = float("-inf")
+        self._cond = asyncio.Condition()
+
+    @property
+    def window(self) -> int:
+        return int(self._window)
+
+    async def __aenter__(self) -> "AdaptiveLimiter":
+        async with self._cond:
+            await self._cond.wait_for(lambda: self.in_flight < self.window)
+            self.in_flight += 1
+        self._notify()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        async with self._cond:
+            self.in_flight -= 1
+            self._cond.notify_all()
+        self._notify()
+
+    def on_success(self) -> None:
+        before = self.window
+        self._window = min(float(self.maximum), self._window + self.increase / max(self._window, 1.0))
+        if self.window != before:
+            self._wake()
+        self._notify()
+
+    def on_overload(self) -> None:
+        now = time.monotonic()
+        if now - self._last_cut < self.cooldown_sec:
+            return
+        self._last_cut = now
+        self._window = max(float(self.minimum), self._window * self.decrease)
+        self._notify()
+
+    def record(self, exc: Optional[BaseException]) -> None:
+        if exc is None:
+            self.on_success()
+        elif is_overload_error(exc):
+            self.on_overload()
+
+    def _wake(self) -> None:
+        async def _notify_waiters() -> None:
+            async with self._cond:
+                self._cond.notify_all()
+
+        try:
+            asyncio.get_running_loop().create_task(_notify_waiters())
+        except RuntimeError:
+            pass
+
+    def _notify(self) -> None:
+        if self.on_change:
+            self.on_change(self)
+
+
+def build_stage_limiters(cfg: StorylintConfig) -> Dict[str, AdaptiveLimiter]:
+    conc = cfg.concurrency
+    limiters: Dict[str, AdaptiveLimiter] = {}
+    for stage, initial in [
+        ("chapter", conc.chapter_audit),
+        ("adjacent", conc.adjacent),
+        ("arc", conc.arc),
+        ("synthesis", conc.synthesis),
+    ]:
+        if conc.adaptive:
+            limiters[stage] = AdaptiveLimiter(
+                stage,
+                initial=initial,
+                minimum=conc.min_limit,
+                maximum=max(conc.max_limit, initial),
+                increase=conc.increase,
+                decrease=conc.decrease,
+                cooldown_sec=conc.cooldown_sec,
+            )
+        else:
+            limiters[stage] = AdaptiveLimiter(stage, initial=initial, minimum=initial, maximum=initial)
+    return limiters
@@ -0,0 +1,163 @@
+"""Fit rendered prompts into a per-model token budget, cutting low-priority content first."""
+from __future__ import annotations
+
+import json
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Mapping, Optional, Sequence
+
+from ..config import StorylintConfig
+from .payloads import truncate
+from .prompting import JsonFragment, render_prompt
+from .ratelimit import CHARS_PER_TOKEN, DEFAULT_KEY, estimate_tokens
+
+# Re-render at most this many times; per-item estimates are close enough that
+# one canon pass and one or two paragraph passes normally suffice.
+MAX_PASSES = 8
+
+
+@dataclass
+class PackResult:
+    prompt: str
+    tokens: int
+    budget: Optional[int]
+    tokens_before: int
+    canon_chars_removed: int = 0
+    paragraphs_dropped: Dict[str, int] = field(default_factory=dict)
+    snippets_dropped: List[str] = field(default_factory=list)
+
+    @property
+    def trimmed(self) -> bool:
+        return self.tokens != self.tokens_before
+
+    @property
+    def over_budget(self) -> bool:
+        return self.budget is not None and self.tokens > self.budget
+
+    def summary(self) -> Dict[str, Any]:
+        return {
+            "budget": self.budget,
+            "tokens_before": self.tokens_before,
+            "tokens_after": self.tokens,
+            "over_budget": self.over_budget,
+            "canon_chars_removed": self.canon_chars_removed,
+            "paragraphs_dropped": self.paragraphs_dropped,
+            "snippets_dropped": self.snippets_dropped,
+        }
+
+
+def token_budget(cfg: StorylintConfig, model: str) -> Optional[int]:
+    budgets = cfg.prompt.token_budgets
+    budget = budgets.get(model, budgets.get(DEFAULT_KEY))
+    return budget if budget and budget > 0 else None
+
+
+def pack_prompt(
+    template_name: str,
+    context: Mapping[str, Any],
+    budget: Optional[int],
+    chapter_keys: Sequence[str] = (),
+) -> PackResult:
+    """Render ``template_name`` and, if it exceeds ``budget``, trim until it fits.
+
+    Canon snapshot tails go first (every snapshot shrinks by the same fraction), then
+    late paragraphs: the last listed chapter in ``chapter_keys`` loses its trailing
+    paragraphs (or, for arc summary lists, its trailing scene snippets) before earlier
+    ones do. The schema and scene metadata are never cut.
+    """
+    prompt = render_prompt(template_name, dict(context))
+    tokens = estimate_tokens(prompt)
+    result = PackResult(prompt=prompt, tokens=tokens, budget=budget, tokens_before=tokens)
+    if budget is None or tokens <= budget:
+        return result
+
+    working = {key: _decode(value) for key, value in context.items()}
+    canon = working.get("canon")
+    for _ in range(MAX_PASSES):
+        tokens_over = result.tokens - budget
+        if tokens_over <= 0:
+            break
+        removed = _trim_canon(canon, tokens_over * CHARS_PER_TOKEN) if isinstance(canon, dict) else 0
+        if removed:
+            result.canon_chars_removed += removed
+        elif not _drop_late_content(working, chapter_keys, tokens_over, result):
+            break
+        _render(template_name, working, result)
+    return result
+
+
+def _render(template_name: str, context: Dict[str, Any], result: PackResult) -> None:
+    result.prompt = render_prompt(template_name, context)
+    result.tokens = estimate_tokens(result.prompt)
+
+
+def _decode(value: Any) -> Any:
+    """Turn cached JSON fragments back into mutable copies; copy plain payloads too."""
+    if isinstance(value, JsonFragment):
+        return json.loads(value)
+    if isinstance(value, list) and any(isinstance(item, JsonFragment) for item in value):
+        return [_decode(item) for item in value]
+    if isinstance(value, (dict, list)):
+        return json.loads(json.dumps(value))
+    return value
+
+
+def _trim_canon(canon: Dict[str, Any], chars_over: int) -> int:
+    snapshots = [
+        (group, slug, text)
+        for group, entries in canon.items()
+        if isinstance(entries, dict)
+        for slug, text in entries.items()
+        if isinstance(text, str) and text
+    ]
+    total = sum(len(text) for _, _, text in snapshots)
+    if not total:
+        return 0
+    keep = max(0.0, 1.0 - chars_over / total)
+    removed = 0
+    for group, slug, text in snapshots:
+        limit = int(len(text) * keep)
+        trimmed = truncate(text, limit) if limit >= 4 else ""
+        canon[group][slug] = trimmed
+        removed += len(text) - len(trimmed)
+    return removed
+
+
+def _drop_late_content(
+    context: Dict[str, Any],
+    chapter_keys: Sequence[str],
+    tokens_over: int,
+    result: PackResult,
+) -> bool:
+    chars_over = tokens_over * CHARS_PER_TOKEN
+    freed = 0
+    dropped_any = False
+    for key in reversed(chapter_keys):
+        value = context.get(key)
+        # Paragraphs render four levels deep in a chapter payload, one more inside a list.
+        depth = 4 if isinstance(value, dict) else 5
+        chapters = value if isinstance(value, list) else [value]
+        for chapter in reversed(chapters):
+            if not isinstance(chapter, dict):
+                continue
+            for scene in reversed(chapter.get("scenes") or []):
+                anchor = f"{chapter.get('slug')}:{scene.get('id')}"
+                paragraphs = scene.get("paragraphs")
+                while paragraphs:
+                    freed += _rendered_chars(paragraphs.pop(), depth)
+                    result.paragraphs_dropped[anchor] = result.paragraphs_dropped.get(anchor, 0) + 1
+                    dropped_any = True
+                    if freed >= chars_over:
+                        return True
+                if scene.get("snippet"):
+                    freed += len(json.dumps(scene["snippet"]))
+                    scene["snippet"] = ""
+                    result.snippets_dropped.append(anchor)
+                    dropped_any = True
+                    if freed >= chars_over:
+                        return True
+    return dropped_any
+
+
+def _rendered_chars(value: Any, depth: int) -> int:
+    text = json.dumps(value, ensure_ascii=True, indent=2)
+    return len(text) + (text.count("\n") + 1) * 2 * depth + 2
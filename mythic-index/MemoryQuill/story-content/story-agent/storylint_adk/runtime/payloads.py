@@ -0,0 +1,112 @@
+"""Prompt payloads built once per chapter and shared by every stage."""
+from __future__ import annotations
+
+from typing import Any, Callable, Dict
+
+from ..config import StorylintConfig
+from ..parser.scene_parser import Chapter
+from .prompting import JsonFragment, to_json
+
+
+class PayloadCache:
+    """Memoizes each chapter's full and summary payloads and their JSON rendering.
+
+    A chapter appears in one audit, up to two adjacent pairs and up to ``window`` arc
+    windows; without this every appearance re-truncates every paragraph and
+    re-serializes the result.
+    """
+
+    def __init__(self, cfg: StorylintConfig) -> None:
+        self.cfg = cfg
+        self._full: Dict[str, Dict[str, Any]] = {}
+        self._summary: Dict[str, Dict[str, Any]] = {}
+        self._json: Dict[tuple[str, str], JsonFragment] = {}
+
+    def chapter(self, chapter: Chapter) -> Dict[str, Any]:
+        payload = self._full.get(chapter.slug)
+        if payload is None:
+            payload = chapter_payload(chapter, self.cfg)
+            self._full[chapter.slug] = payload
+        return payload
+
+    def summary(self, chapter: Chapter) -> Dict[str, Any]:
+        payload = self._summary.get(chapter.slug)
+        if payload is None:
+            payload = chapter_summary_payload(chapter, self.cfg)
+            self._summary[chapter.slug] = payload
+        return payload
+
+    def chapter_json(self, chapter: Chapter) -> JsonFragment:
+        return self._fragment("full", chapter, self.chapter)
+
+    def summary_json(self, chapter: Chapter) -> JsonFragment:
+        return self._fragment("summary", chapter, self.summary)
+
+    def _fragment(self, kind: str, chapter: Chapter, build: Callable[[Chapter], Dict[str, Any]]) -> JsonFragment:
+        key = (kind, chapter.slug)
+        fragment = self._json.get(key)
+        if fragment is None:
+            fragment = JsonFragment(to_json(build(chapter)))
+            self._json[key] = fragment
+        return fragment
+
+
+def chapter_payload(chapter: Chapter, cfg: StorylintConfig) -> Dict[str, Any]:
+    scenes = []
+    for scene in chapter.scenes:
+        paragraphs = []
+        for paragraph in scene.paragraphs[: cfg.prompt.max_paragraphs]:
+            paragraphs.append(
+                {
+                    "idx": paragraph.idx,
+                    "location": f"{chapter.slug}:{scene.meta.id}:p{paragraph.idx}",
+                    "text": truncate(paragraph.text, cfg.prompt.max_scene_chars),
+                }
+            )
+        scenes.append(
+            {
+                "id": scene.meta.id,
+                "title": scene.meta.title,
+                "when": scene.meta.when,
+                "location": scene.meta.location,
+                "characters": scene.meta.characters,
+                "tags": scene.meta.tags,
+                "images": scene.meta.images,
+                "paragraphs": paragraphs,
+            }
+        )
+
+    return {
+        "slug": chapter.slug,
+        "title": chapter.title,
+        "path": str(chapter.path),
+        "scenes": scenes,
+    }
+
+
+def chapter_summary_payload(chapter: Chapter, cfg: StorylintConfig) -> Dict[str, Any]:
+    scenes = []
+    for scene in chapter.scenes:
+        paragraphs = scene.paragraphs
+        snippet = truncate(paragraphs[0].text, 320) if paragraphs else ""
+        scenes.append(
+            {
+                "id": scene.meta.id,
+                "title": scene.meta.title,
+                "location": scene.meta.location,
+                "characters": scene.meta.characters,
+                "tags": scene.meta.tags,
+                "snippet": snippet,
+            }
+        )
+    return {
+        "slug": chapter.slug,
+        "title": chapter.title,
+        "scenes": scenes,
+    }
+
+
+def truncate(text: str, max_chars: int) -> str:
+    if max_chars <= 0 or len(text) <= max_chars:
+        return text
+    return text[: max_chars - 3] + "..."
@@ -0,0 +1,125 @@
+"""Parse and validate the planned chapters before a run, across a process pool for large corpora."""
+from __future__ import annotations
+
+import os
+import pickle
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Sequence, Tuple, TypeVar
+
+from ..config import StorylintConfig
+from ..models import Issue
+from ..parser.scene_parser import Chapter, load_chapter
+from ..tools.inventory import RepoInventory
+from ..tools.repo_tools import validate_imagery, validate_slugs
+
+T = TypeVar("T")
+
+# Below this many chapters per worker, process start-up costs more than it saves.
+MIN_CHAPTERS_PER_WORKER = 8
+# Each worker gets about this many batches, so one slow chapter does not leave the others idle.
+BATCHES_PER_WORKER = 4
+
+# The config and inventory of a pool worker, set once per process by ``_init_worker``.
+_worker_state: Optional[Tuple[StorylintConfig, RepoInventory]] = None
+
+
+@dataclass
+class PreparedChapter:
+    chapter: Chapter
+    findings: List[Issue]
+
+
+def prepare_chapters(
+    paths: Sequence[Path],
+    cfg: StorylintConfig,
+    workers: Optional[int] = None,
+) -> List[PreparedChapter]:
+    """Parse each chapter and run ``validate_slugs``/``validate_imagery`` on it.
+
+    Results come back in the order of ``paths`` whatever the worker count (see
+    ``map_chapters``). Parse errors are raised the same way with and without a pool. The
+    validators share one ``RepoInventory`` of the canon and chapter folders, built here and
+    sent to each worker once.
+    """
+    return map_chapters(_prepare_batch, list(paths), cfg, RepoInventory.from_config(cfg), workers)
+
+
+def map_chapters(
+    batch_fn: Callable[[List[Path], StorylintConfig, RepoInventory], List[T]],
+    paths: List[Path],
+    cfg: StorylintConfig,
+    inventory: RepoInventory,
+    workers: Optional[int] = None,
+) -> List[T]:
+    """Run ``batch_fn`` over contiguous batches of ``paths`` and concatenate the results in order.
+
+    ``batch_fn`` must be a module-level function so worker processes can import it.
+    ``cfg`` and ``inventory`` are sent to each worker once, when it starts; batches carry
+    only their paths.
+    ``workers`` defaults to ``cfg.concurrency.parse_workers`` (0 means one per available
+    CPU), and is capped so each worker gets at least ``MIN_CHAPTERS_PER_WORKER`` chapters.
+    With one worker, or when a process pool cannot be started, everything runs in this
+    process.
+    """
+    count = resolve_workers(cfg, len(paths), workers)
+    if count > 1:
+        try:
+            return _map_parallel(batch_fn, paths, cfg, inventory, count)
+        except (OSError, BrokenProcessPool, pickle.PicklingError, NotImplementedError):
+            pass  # no usable process pool here (sandbox, missing semaphores); fall through
+    return batch_fn(paths, cfg, inventory)
+
+
+def resolve_workers(cfg: StorylintConfig, chapters: int, workers: Optional[int] = None) -> int:
+    requested = cfg.concurrency.parse_workers if workers is None else workers
+    if requested <= 0:
+        requested = _available_cpus()
+    return max(1, min(requested, chapters // MIN_CHAPTERS_PER_WORKER))
+
+
+def integrity_index(prepared: List[PreparedChapter]) -> Dict[str, List[Issue]]:
+    """Findings keyed by chapter slug, the shape ``RunContext.integrity`` holds."""
+    return {item.chapter.slug: item.findings for item in prepared}
+
+
+def _map_parallel(
+    batch_fn: Callable[[List[Path], StorylintConfig, RepoInventory], List[T]],
+    paths: List[Path],
+    cfg: StorylintConfig,
+    inventory: RepoInventory,
+    workers: int,
+) -> List[T]:
+    size = max(1, -(-len(paths) // (workers * BATCHES_PER_WORKER)))
+    batches = [paths[start : start + size] for start in range(0, len(paths), size)]
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(cfg, inventory)) as pool:
+        # ``map`` yields in submission order, which keeps the result deterministic.
+        results = pool.map(_run_batch, [batch_fn] * len(batches), batches)
+        return [item for batch in results for item in batch]
+
+
+def _init_worker(cfg: StorylintConfig, inventory: RepoInventory) -> None:
+    global _worker_state
+    _worker_state = (cfg, inventory)
+
+
+def _run_batch(batch_fn: Callable[[List[Path], StorylintConfig, RepoInventory], List[T]], paths: List[Path]) -> List[T]:
+    cfg, inventory = _worker_state
+    return batch_fn(paths, cfg, inventory)
+
+
+def _prepare_batch(paths: List[Path], cfg: StorylintConfig, inventory: RepoInventory) -> List[PreparedChapter]:
+    prepared = []
+    for path in paths:
+        chapter = load_chapter(path, cfg)
+        findings = validate_slugs(chapter, cfg, inventory) + validate_imagery(chapter, cfg, inventory)
+        prepared.append(PreparedChapter(chapter, findings))
+    return prepared
+
+
+def _available_cpus() -> int:
+    if hasattr(os, "sched_getaffinity"):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count() or 1
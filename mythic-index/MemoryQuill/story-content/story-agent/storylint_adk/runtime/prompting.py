@@ -1,6 +1,8 @@
 from __future__ import annotations
 
 import json
+import textwrap
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict
 
@@ -10,8 +12,26 @@ BASE_DIR = Path(__file__).resolve().parents[1]
 PROMPT_DIR = BASE_DIR / "prompts"
 
 
-def render_prompt(template_name: str, context: Dict[str, Any]) -> str:
+class JsonFragment(str):
+    """Already-serialized ``to_json`` output that the ``tojson`` filter emits verbatim."""
+
+
+def to_json(value: Any) -> str:
+    if isinstance(value, JsonFragment):
+        return value
+    if isinstance(value, list) and value and all(isinstance(item, JsonFragment) for item in value):
+        # Same bytes json.dumps(indent=2) would produce for the decoded list.
+        return "[\n" + ",\n".join(textwrap.indent(item, "  ") for item in value) + "\n]"
+    return json.dumps(value, ensure_ascii=True, indent=2)
+
+
+@lru_cache(maxsize=1)
+def _environment() -> Environment:
     env = Environment(loader=FileSystemLoader(str(PROMPT_DIR)), autoescape=False)
-    env.filters["tojson"] = lambda value: json.dumps(value, ensure_ascii=True, indent=2)
-    template = env.get_template(template_name)
+    env.filters["tojson"] = to_json
+    return env
+
+
+def render_prompt(template_name: str, context: Dict[str, Any]) -> str:
+    template = _environment().get_template(template_name)
     return template.render(**context)
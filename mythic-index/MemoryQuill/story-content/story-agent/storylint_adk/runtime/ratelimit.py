@@ -0,0 +1,150 @@
+"""Process-wide requests/tokens-per-minute limiter, shared per model name.
+
+Used by the ADK runner and the legacy ``storylint.llm`` client, so this module
+must stay free of ADK and config imports.
+"""
+from __future__ import annotations
+
+import asyncio
+import math
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Mapping, Optional
+
+DEFAULT_KEY = "default"
+CHARS_PER_TOKEN = 4
+
+
+@dataclass
+class TokenUsage:
+    prompt_tokens: int = 0
+    output_tokens: int = 0
+    total_tokens: int = 0
+
+    def add(self, prompt_tokens: int, output_tokens: int, total_tokens: int) -> None:
+        self.prompt_tokens += prompt_tokens
+        self.output_tokens += output_tokens
+        self.total_tokens += total_tokens or (prompt_tokens + output_tokens)
+
+
+def estimate_tokens(text: str) -> int:
+    """Cheap local token estimate (~4 characters per token for English prose and JSON)."""
+    return max(1, math.ceil(len(text) / CHARS_PER_TOKEN))
+
+
+class TokenBucket:
+    """Continuously refilling bucket that hands out reservations.
+
+    ``reserve`` debits immediately and returns how long the caller must wait, so the
+    balance can go negative and concurrent callers queue up in reservation order.
+    """
+
+    def __init__(self, per_minute: float, clock: Callable[[], float] = time.monotonic) -> None:
+        self.capacity = float(per_minute)
+        self.rate = float(per_minute) / 60.0
+        self._clock = clock
+        self._tokens = self.capacity
+        self._updated = clock()
+
+    def reserve(self, amount: float) -> float:
+        self._refill()
+        self._tokens -= min(amount, self.capacity)
+        if self._tokens >= 0:
+            return 0.0
+        return -self._tokens / self.rate
+
+    def adjust(self, delta: float) -> None:
+        """Credit (positive) or debit (negative) the bucket after the fact."""
+        self._refill()
+        self._tokens = min(self.capacity, self._tokens + delta)
+
+    @property
+    def available(self) -> float:
+        self._refill()
+        return self._tokens
+
+    def _refill(self) -> None:
+        now = self._clock()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+
+class ModelRateLimiter:
+    def __init__(
+        self,
+        model: str,
+        rpm: Optional[int],
+        tpm: Optional[int],
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.model = model
+        self.rpm = rpm
+        self.tpm = tpm
+        self._request_bucket = TokenBucket(rpm, clock) if rpm else None
+        self._token_bucket = TokenBucket(tpm, clock) if tpm else None
+        self._lock = threading.Lock()
+
+    def reserve(self, estimated_tokens: int) -> float:
+        with self._lock:
+            delay = 0.0
+            if self._request_bucket:
+                delay = max(delay, self._request_bucket.reserve(1))
+            if self._token_bucket:
+                delay = max(delay, self._token_bucket.reserve(estimated_tokens))
+            return delay
+
+    async def acquire(self, estimated_tokens: int) -> None:
+        delay = self.reserve(estimated_tokens)
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    def acquire_sync(self, estimated_tokens: int) -> None:
+        delay = self.reserve(estimated_tokens)
+        if delay > 0:
+            time.sleep(delay)
+
+    def reconcile(self, estimated_tokens: int, actual_tokens: int) -> None:
+        """Swap the up-front estimate for the provider-reported usage."""
+        if not self._token_bucket or actual_tokens <= 0:
+            return
+        with self._lock:
+            self._token_bucket.adjust(estimated_tokens - actual_tokens)
+
+
+_limiters: Dict[str, ModelRateLimiter] = {}
+_limits: Dict[str, tuple[Optional[int], Optional[int]]] = {}
+_registry_lock = threading.Lock()
+
+
+def configure_rate_limits(limits: Mapping[str, Any]) -> None:
+    """Register per-model limits. Values expose ``rpm``/``tpm`` as attributes or keys.
+
+    A ``default`` entry applies to models without their own entry. Reconfiguring with
+    identical limits keeps the existing buckets, so budgets carry across runs in one process.
+    """
+    parsed: Dict[str, tuple[Optional[int], Optional[int]]] = {}
+    for model, value in (limits or {}).items():
+        if isinstance(value, Mapping):
+            parsed[model] = (value.get("rpm"), value.get("tpm"))
+        else:
+            parsed[model] = (getattr(value, "rpm", None), getattr(value, "tpm", None))
+    with _registry_lock:
+        if parsed == _limits:
+            return
+        _limits.clear()
+        _limits.update(parsed)
+        _limiters.clear()
+
+
+def get_rate_limiter(model: str) -> Optional[ModelRateLimiter]:
+    with _registry_lock:
+        limiter = _limiters.get(model)
+        if limiter is not None:
+            return limiter
+        rpm, tpm = _limits.get(model) or _limits.get(DEFAULT_KEY) or (None, None)
+        if not rpm and not tpm:
+            return None
+        limiter = ModelRateLimiter(model, rpm, tpm)
+        _limiters[model] = limiter
+        return limiter
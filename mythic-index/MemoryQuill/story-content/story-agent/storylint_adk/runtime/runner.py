@@ -3,7 +3,9 @@ from __future__ import annotations
 import asyncio
 import json
 import re
-from datetime import datetime
+import time
+from dataclasses import asdict
+from functools import partial
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
@@ -12,9 +14,8 @@ from ..agents.arc_analyst import build_arc_agent
 from ..agents.chapter_auditor import build_chapter_audit_agent
 from ..agents.synthesizer import build_synthesis_agent
 from ..config import StorylintConfig, load_config
-from ..models import ActionPlan, AdjacentReport, ArcReport, ChapterReport, DashboardSummary
-from ..parser.scene_parser import Chapter, parse_chapter
-from ..parser.slug_index import build_slug_index
+from ..models import ActionPlan, AdjacentReport, ArcReport, ChapterReport, Issue
+from ..parser.scene_parser import Chapter
 from ..store.artifacts import ensure_run_dir, new_run_id, write_json, write_text, artifact_exists, build_index
 from ..store.render_md import render_markdown
 from ..tools.repo_tools import (
@@ -23,10 +24,30 @@ from ..tools.repo_tools import (
     validate_imagery,
     validate_slugs,
 )
-from .adk_client import run_agent_prompt
+from .adk_client import AgentBackend, AgentRunnerPool, run_agent_prompt
+from .cache import cache_key_for_agent
+from .context import RunContext, build_run_context
+from .dashboard import STAGES as DASHBOARD_STAGES, DashboardAggregator
+from .incremental import build_manifest, copy_forward, find_previous_run, stage_fingerprint, write_manifest
+from .journal import RunJournal, RunSpec, load_journal
+from .packing import pack_prompt, token_budget
+from .payloads import PayloadCache
 from .planning import build_plan
+from .prepare import integrity_index, prepare_chapters
 from .prompting import render_prompt
+from .ratelimit import TokenUsage, estimate_tokens, get_rate_limiter
+from .scheduler import GraphTask, TaskGraph
 from .status import StatusReporter
+from .synthesis import ROOT_KEY, SynthesisNode, build_synthesis_tree
+from .telemetry import CallRecord, TelemetryLedger, summarize, summary_table
+
+
+class RunCompletedWithErrors(RuntimeError):
+    """The run finished, but ``errors`` of its tasks failed; their artifacts are missing."""
+
+    def __init__(self, errors: int) -> None:
+        super().__init__(f"Storylint completed with {errors} error(s). See error panel for details.")
+        self.errors = errors
 
 
 async def run_pipeline(
@@ -38,121 +59,239 @@ async def run_pipeline(
     force: bool,
     config_path: Optional[str],
     model: str | None = None,
+    use_cache: bool = True,
+    incremental: bool = False,
+    backend: Optional[AgentBackend] = None,
+    quiet: bool = False,
 ) -> Path:
     cfg = load_config(Path(config_path) if config_path else None, start_dir=Path.cwd())
     chapter_files = discover_chapters(cfg)
     plan = build_plan(chapter_files, start, end)
     if not plan:
         raise RuntimeError("No chapters found for the requested range.")
-    mode = (mode or "full").lower()
-    chapter_model = model or cfg.models.chapter_audit
-    adjacent_model = model or cfg.models.adjacent_flow
-    arc_model = model or cfg.models.arc_window
-    synthesis_model = model or cfg.models.synthesis
-
-    parsed_chapters: List[Chapter] = [parse_chapter(item.path, cfg) for item in plan]
     run_id = run_id or new_run_id()
+    spec = RunSpec(
+        run_id=run_id,
+        mode=(mode or "full").lower(),
+        window=window,
+        force=force,
+        chapters=[str(item.path) for item in plan],
+        models={
+            "chapter_audit": model or cfg.models.chapter_audit,
+            "adjacent_flow": model or cfg.models.adjacent_flow,
+            "arc_window": model or cfg.models.arc_window,
+            "synthesis": model or cfg.models.synthesis,
+        },
+        synthesis_fan_in=cfg.synthesis.fan_in,
+    )
     run_dir = ensure_run_dir(cfg.runs_dir, run_id)
+    journal = RunJournal.for_run(run_dir)
+    journal.plan(spec)
+    return await _execute_run(
+        cfg,
+        run_dir,
+        spec,
+        journal,
+        use_cache=use_cache,
+        incremental=incremental,
+        backend=backend,
+        quiet=quiet,
+    )
 
-    write_json(run_dir / "config.json", cfg.model_dump(mode="json", exclude={"config_path"}))
-    write_json(run_dir / "index.json", build_index(parsed_chapters))
 
-    reporter = StatusReporter()
-    error_count = 0
-    chapter_sem = asyncio.Semaphore(cfg.concurrency.chapter_audit)
-    adjacent_sem = asyncio.Semaphore(cfg.concurrency.adjacent)
-    arc_sem = asyncio.Semaphore(cfg.concurrency.arc)
+async def resume_pipeline(run_id: str, config_path: Optional[str], use_cache: bool = True) -> Path:
+    """Finish an interrupted run from its journal, rescheduling only tasks that never succeeded."""
+    cfg = load_config(Path(config_path) if config_path else None, start_dir=Path.cwd())
+    run_dir = cfg.runs_dir / run_id
+    journal = RunJournal.for_run(run_dir)
+    if not journal.path.exists():
+        raise RuntimeError(f"No journal found for run {run_id} in {cfg.runs_dir}")
+    try:
+        state = load_journal(journal.path)
+    except ValueError as exc:
+        raise RuntimeError(str(exc)) from exc
+    journal.record("resumed", unfinished=len(state.unfinished))
+    return await _execute_run(cfg, run_dir, state.spec, journal, use_cache=use_cache, completed=state.succeeded)
+
+
+async def _execute_run(
+    cfg: StorylintConfig,
+    run_dir: Path,
+    spec: RunSpec,
+    journal: RunJournal,
+    use_cache: bool = True,
+    incremental: bool = False,
+    completed: Optional[set[str]] = None,
+    backend: Optional[AgentBackend] = None,
+    quiet: bool = False,
+) -> Path:
+    resuming = completed is not None
+    run_id, mode, window, force = spec.run_id, spec.mode, spec.window, spec.force
+    chapter_model = spec.models["chapter_audit"]
+    adjacent_model = spec.models["adjacent_flow"]
+    arc_model = spec.models["arc_window"]
+    synthesis_model = spec.models["synthesis"]
+
+    prepared = prepare_chapters([Path(path) for path in spec.chapters], cfg)
+    parsed_chapters: List[Chapter] = [item.chapter for item in prepared]
+    index = build_index(parsed_chapters)
+    previous_index = _read_json(run_dir / "index.json") if resuming else None
+    write_json(run_dir / "config.json", cfg.model_dump(mode="json", exclude={"config_path"}))
+    write_json(run_dir / "index.json", index)
+
+    run_adjacent = mode in {"full", "all", "adjacent", "adjacent-only", "flow"}
+    run_arc = mode in {"full", "all", "arc", "arc-only"}
+    adjacent_pairs: list[tuple[Chapter, Chapter]] = []
+    windows: list[list[Chapter]] = []
+    if run_adjacent and len(parsed_chapters) > 1:
+        adjacent_pairs = list(zip(parsed_chapters[:-1], parsed_chapters[1:]))
+    if run_arc and len(parsed_chapters) >= window:
+        windows = _build_windows(parsed_chapters, window)
+
+    ctx = build_run_context(cfg, use_cache=use_cache, force=force)
+    ctx.runners = AgentRunnerPool(offline=backend is not None)
+    ctx.backend = backend
+    ctx.journal = journal
+    ctx.telemetry = TelemetryLedger.for_run(run_dir)
+    ctx.integrity = integrity_index(prepared)
+    if previous_index:
+        ctx.prompt_cuts.update(previous_index.get("prompt_cuts") or {})
+    copied = None
+    if not resuming:
+        manifest = build_manifest(
+            parsed_chapters,
+            adjacent_pairs,
+            windows,
+            cfg,
+            models={"chapter_audit": chapter_model, "adjacent_flow": adjacent_model, "arc_window": arc_model},
+            canon=ctx.canon,
+            integrity=ctx.integrity,
+            stages={
+                "chapter_audit": stage_fingerprint(
+                    _build_agent(build_chapter_audit_agent, chapter_model, ctx), "chapter_audit.j2", "chapter_report.md.j2"
+                ),
+                "adjacent_flow": stage_fingerprint(
+                    _build_agent(build_adjacent_flow_agent, adjacent_model, ctx), "adjacent_flow.j2", "adjacent_report.md.j2"
+                ),
+                "arc_window": stage_fingerprint(
+                    _build_agent(build_arc_agent, arc_model, ctx), "arc_window.j2", "arc_report.md.j2"
+                ),
+            },
+        )
+        if incremental and not force:
+            previous_dir = find_previous_run(cfg.runs_dir, exclude=run_dir)
+            if previous_dir is not None:
+                copied = copy_forward(previous_dir, run_dir, manifest)
+        write_manifest(run_dir, manifest)
+
+    reporter = StatusReporter(quiet=quiet)
+    graph = TaskGraph(limits=ctx.limiters)
+    for chapter in parsed_chapters:
+        graph.add(
+            _chapter_key(chapter),
+            "chapter",
+            partial(run_chapter_audit, chapter, cfg, run_dir, model=chapter_model, force=force, ctx=ctx),
+        )
+    # Adjacent pairs and arc windows only read parsed chapters, so they are ready
+    # immediately; synthesis is the only stage that consumes other reports.
+    for left, right in adjacent_pairs:
+        graph.add(
+            _adjacent_key(left, right),
+            "adjacent",
+            partial(run_adjacent_flow, left, right, cfg, run_dir, model=adjacent_model, force=force, ctx=ctx),
+        )
+    for window_chapters in windows:
+        graph.add(
+            _arc_key(window_chapters),
+            "arc",
+            partial(run_arc_window, window_chapters, cfg, run_dir, model=arc_model, force=force, ctx=ctx),
+        )
+    synthesis_nodes = build_synthesis_tree([chapter.slug for chapter in parsed_chapters], spec.synthesis_fan_in)
+    for node in synthesis_nodes:
+        graph.add(
+            node.key,
+            "synthesis",
+            partial(run_synthesis, run_dir, model=synthesis_model, force=force, ctx=ctx, node=node),
+            deps=node.deps,
+        )
+    dashboard = DashboardAggregator(
+        run_dir,
+        run_id,
+        mode,
+        window,
+        totals={"chapter": len(parsed_chapters), "adjacent": len(adjacent_pairs), "arc": len(windows)},
+        interval_sec=cfg.dashboard_interval_sec,
+    )
+    ctx.dashboard = dashboard
+    if completed:
+        graph.skip(completed)
+        for key in sorted(completed):
+            stage = key.split(":", 1)[0]
+            if stage in DASHBOARD_STAGES:
+                dashboard.add_existing(stage, key, _report_path(run_dir, key))
+    for task in graph.tasks():
+        journal.queued(task.key, task.stage)
 
     with reporter.display():
         reporter.log("[bold]Storylint run started[/bold]")
-        chapter_task = reporter.add_task("Chapter audits", total=len(parsed_chapters))
-
-        async def _run_chapter(chapter: Chapter) -> None:
-            nonlocal error_count
-            async with chapter_sem:
-                try:
-                    await run_chapter_audit(chapter, cfg, run_dir, model=chapter_model, force=force)
-                except Exception as exc:
-                    error_count += 1
-                    reporter.record_error(f"chapter:{chapter.slug}", exc)
-                reporter.advance(chapter_task)
-
-        await asyncio.gather(*[_run_chapter(chapter) for chapter in parsed_chapters])
-
-        run_adjacent = mode in {"full", "all", "adjacent", "adjacent-only", "flow"}
-        run_arc = mode in {"full", "all", "arc", "arc-only"}
-        adjacent_pairs: list[tuple[Chapter, Chapter]] = []
-        windows: list[list[Chapter]] = []
-        if run_adjacent and len(parsed_chapters) > 1:
-            adjacent_pairs = list(zip(parsed_chapters[:-1], parsed_chapters[1:]))
-            adjacent_task = reporter.add_task("Adjacent flow", total=len(adjacent_pairs))
-
-            async def _run_adjacent(left: Chapter, right: Chapter) -> None:
-                nonlocal error_count
-                async with adjacent_sem:
-                    try:
-                        await run_adjacent_flow(
-                            left,
-                            right,
-                            cfg,
-                            run_dir,
-                            model=adjacent_model,
-                            force=force,
-                        )
-                    except Exception as exc:
-                        error_count += 1
-                        reporter.record_error(f"adjacent:{left.slug}->{right.slug}", exc)
-                    reporter.advance(adjacent_task)
-
-            await asyncio.gather(*[_run_adjacent(left, right) for left, right in adjacent_pairs])
-
-        if run_arc and len(parsed_chapters) >= window:
-            windows = _build_windows(parsed_chapters, window)
-            arc_task = reporter.add_task("Arc windows", total=len(windows))
-
-            async def _run_arc(window_chapters: list[Chapter]) -> None:
-                nonlocal error_count
-                async with arc_sem:
-                    try:
-                        await run_arc_window(
-                            window_chapters,
-                            cfg,
-                            run_dir,
-                            model=arc_model,
-                            force=force,
-                        )
-                    except Exception as exc:
-                        error_count += 1
-                        window_slug = f"{window_chapters[0].slug}-{window_chapters[-1].slug}"
-                        reporter.record_error(f"arc:{window_slug}", exc)
-                    reporter.advance(arc_task)
-
-            await asyncio.gather(*[_run_arc(window_set) for window_set in windows])
-
-        try:
-            await run_synthesis(run_dir, model=synthesis_model, force=force)
-        except Exception as exc:
-            error_count += 1
-            reporter.record_error("synthesis", exc)
-
-        await write_dashboard_summary(
-            run_dir=run_dir,
-            run_id=run_id,
-            mode=mode,
-            window=window,
-            chapters=parsed_chapters,
-            adjacent_pairs=adjacent_pairs if run_adjacent else [],
-            arc_windows=windows if run_arc else [],
-            error_count=error_count,
-            recent_errors=reporter.recent_errors() if hasattr(reporter, "recent_errors") else [],
-        )
+        if resuming:
+            reporter.log(f"Resuming {run_id}: {len(completed)} task(s) already done, {len(graph)} to run")
+        if copied is not None:
+            reporter.log(
+                f"Incremental: reused {len(copied.chapters)} chapter, {len(copied.adjacent)} adjacent, "
+                f"{len(copied.arc)} arc report(s) from {copied.source_run.name}"
+            )
+        progress = {"chapter": reporter.add_task("Chapter audits", total=graph.count("chapter"))}
+        if graph.count("adjacent"):
+            progress["adjacent"] = reporter.add_task("Adjacent flow", total=graph.count("adjacent"))
+        if graph.count("arc"):
+            progress["arc"] = reporter.add_task("Arc windows", total=graph.count("arc"))
+        if graph.count("synthesis") > 1:
+            progress["synthesis"] = reporter.add_task("Synthesis", total=graph.count("synthesis"))
+        for limiter in ctx.limiters.values():
+            limiter.on_change = lambda item: reporter.set_concurrency(item.name, item.window, item.in_flight)
+            reporter.set_concurrency(limiter.name, limiter.window, limiter.in_flight)
+
+        def _on_start(task: GraphTask) -> None:
+            journal.started(task.key, task.stage)
+
+        def _on_done(task: GraphTask, error: Optional[BaseException]) -> None:
+            journal.finished(task.key, task.stage, error)
+            if error is not None:
+                reporter.record_error(task.key, error)
+            if task.stage in progress:
+                reporter.advance(progress[task.stage])
+            dashboard.maybe_write(len(graph.failed), reporter.recent_errors())
+
+        await graph.run(on_done=_on_done, on_start=_on_start)
+        error_count = len(graph.failed)
+        if ctx.prompt_cuts:
+            index["prompt_cuts"] = dict(sorted(ctx.prompt_cuts.items()))
+            write_json(run_dir / "index.json", index)
+            reporter.log(f"Token budget: trimmed {len(ctx.prompt_cuts)} prompt(s); see index.json prompt_cuts")
+
+        dashboard.write(error_count, reporter.recent_errors())
+        ctx.telemetry.close()
+        if ctx.telemetry.records:
+            stage_summaries = summarize(ctx.telemetry.records)
+            write_json(run_dir / "final" / "telemetry-summary.json", [asdict(item) for item in stage_summaries])
+            reporter.log(summary_table(stage_summaries))
+
+        if ctx.canon is not None:
+            ctx.canon.save()
+        if ctx.cache is not None:
+            ctx.cache.prune()
+            stats = ctx.cache.stats
+            reporter.log(f"Response cache: {stats.hits} hit(s), {stats.misses} miss(es), {stats.evicted} evicted")
 
         if error_count:
             reporter.log(f"[bold yellow]Storylint completed with {error_count} error(s).[/bold yellow]")
         else:
             reporter.log("[bold green]Storylint run completed[/bold green]")
+    journal.record("finished", errors=error_count)
+    journal.close()
     if error_count:
-        raise RuntimeError(f"Storylint completed with {error_count} error(s). See error panel for details.")
+        raise RunCompletedWithErrors(error_count)
     return run_dir
 
 
@@ -165,6 +304,8 @@ def run_pipeline_sync(
     force: bool,
     config_path: Optional[str],
     model: str | None = None,
+    use_cache: bool = True,
+    incremental: bool = False,
 ) -> Path:
     return asyncio.run(
         run_pipeline(
@@ -176,52 +317,59 @@ def run_pipeline_sync(
             force=force,
             config_path=config_path,
             model=model,
+            use_cache=use_cache,
+            incremental=incremental,
         )
     )
 
 
+def resume_pipeline_sync(run_id: str, config_path: Optional[str], use_cache: bool = True) -> Path:
+    return asyncio.run(resume_pipeline(run_id, config_path=config_path, use_cache=use_cache))
+
+
 async def run_chapter_audit(
     chapter: Chapter,
     cfg: StorylintConfig,
     run_dir: Path,
     model: str,
     force: bool,
+    ctx: Optional[RunContext] = None,
 ) -> None:
     report_path = run_dir / "chapter" / f"{chapter.slug}.report.json"
     md_path = run_dir / "chapter" / f"{chapter.slug}.report.md"
     if artifact_exists(report_path) and not force:
+        if ctx and ctx.dashboard is not None:
+            ctx.dashboard.add_existing("chapter", _chapter_key(chapter), report_path)
         return
 
-    slug_index = build_slug_index(chapter)
-    canon_payload = {
-        "characters": {
-            slug: load_canon_snapshot(slug, cfg.characters_dir, cfg.canon_snapshot_chars)
-            for slug in slug_index.characters
-        },
-        "locations": {
-            slug: load_canon_snapshot(slug, cfg.locations_dir, cfg.canon_snapshot_chars)
-            for slug in slug_index.locations
-        },
-    }
+    canon_payload = _canon_payload_for_chapters([chapter], cfg, ctx)
 
-    integrity_findings = validate_slugs(chapter, cfg) + validate_imagery(chapter, cfg)
+    integrity_findings = _integrity_findings(chapter, cfg, ctx)
 
-    prompt = render_prompt(
+    prompt = _pack_prompt(
         "chapter_audit.j2",
         {
             "schema": ChapterReport.model_json_schema(),
-            "chapter": _chapter_payload(chapter, cfg),
+            "chapter": _payloads(cfg, ctx).chapter_json(chapter),
             "canon": canon_payload,
         },
+        cfg,
+        model,
+        ctx,
+        task_key=_chapter_key(chapter),
+        chapter_keys=["chapter"],
     )
 
-    agent = build_chapter_audit_agent(model)
+    agent = _build_agent(build_chapter_audit_agent, model, ctx)
     report = await _generate_report(
         agent,
         prompt,
         ChapterReport,
         retries=2,
         defaults={"chapter_slug": chapter.slug, "integrity_findings": []},
+        ctx=ctx,
+        stage="chapter",
+        task=_chapter_key(chapter),
     )
 
     report = report.model_copy(
@@ -231,9 +379,12 @@ async def run_chapter_audit(
         }
     )
 
-    write_json(report_path, report.model_dump(mode="json"))
-    md = render_markdown("chapter_report.md.j2", {"report": report.model_dump(mode="json")})
+    data = report.model_dump(mode="json")
+    write_json(report_path, data)
+    md = render_markdown("chapter_report.md.j2", {"report": data})
     write_text(md_path, md)
+    if ctx and ctx.dashboard is not None:
+        ctx.dashboard.add_report("chapter", _chapter_key(chapter), data)
 
 
 async def run_adjacent_flow(
@@ -243,18 +394,22 @@ async def run_adjacent_flow(
     run_dir: Path,
     model: str,
     force: bool,
+    ctx: Optional[RunContext] = None,
 ) -> None:
     report_path = run_dir / "adjacent" / f"{left.slug}_{right.slug}.report.json"
     md_path = run_dir / "adjacent" / f"{left.slug}_{right.slug}.report.md"
     if artifact_exists(report_path) and not force:
+        if ctx and ctx.dashboard is not None:
+            ctx.dashboard.add_existing("adjacent", _adjacent_key(left, right), report_path)
         return
 
-    left_payload = _chapter_payload(left, cfg)
-    right_payload = _chapter_payload(right, cfg)
+    payloads = _payloads(cfg, ctx)
+    left_payload = payloads.chapter_json(left)
+    right_payload = payloads.chapter_json(right)
 
-    canon_payload = _canon_payload_for_chapters([left, right], cfg)
+    canon_payload = _canon_payload_for_chapters([left, right], cfg, ctx)
 
-    prompt = render_prompt(
+    prompt = _pack_prompt(
         "adjacent_flow.j2",
         {
             "schema": AdjacentReport.model_json_schema(),
@@ -262,20 +417,31 @@ async def run_adjacent_flow(
             "right": right_payload,
             "canon": canon_payload,
         },
+        cfg,
+        model,
+        ctx,
+        task_key=_adjacent_key(left, right),
+        chapter_keys=["left", "right"],
     )
 
-    agent = build_adjacent_flow_agent(model)
+    agent = _build_agent(build_adjacent_flow_agent, model, ctx)
     report = await _generate_report(
         agent,
         prompt,
         AdjacentReport,
         retries=2,
         defaults={"left_slug": left.slug, "right_slug": right.slug},
+        ctx=ctx,
+        stage="adjacent",
+        task=_adjacent_key(left, right),
     )
 
-    write_json(report_path, report.model_dump(mode="json"))
-    md = render_markdown("adjacent_report.md.j2", {"report": report.model_dump(mode="json")})
+    data = report.model_dump(mode="json")
+    write_json(report_path, data)
+    md = render_markdown("adjacent_report.md.j2", {"report": data})
     write_text(md_path, md)
+    if ctx and ctx.dashboard is not None:
+        ctx.dashboard.add_report("adjacent", _adjacent_key(left, right), data)
 
 
 async def run_arc_window(
@@ -284,128 +450,134 @@ async def run_arc_window(
     run_dir: Path,
     model: str,
     force: bool,
+    ctx: Optional[RunContext] = None,
 ) -> None:
     if not window_chapters:
         return
-    window_slug = f"{window_chapters[0].slug}-{window_chapters[-1].slug}"
+    window_slug = _window_slug(window_chapters)
     report_path = run_dir / "arc" / f"{window_slug}.report.json"
     md_path = run_dir / "arc" / f"{window_slug}.report.md"
     if artifact_exists(report_path) and not force:
+        if ctx and ctx.dashboard is not None:
+            ctx.dashboard.add_existing("arc", _arc_key(window_chapters), report_path)
         return
 
-    window_payload = [_chapter_summary_payload(chapter, cfg) for chapter in window_chapters]
-    canon_payload = _canon_payload_for_chapters(window_chapters, cfg)
+    payloads = _payloads(cfg, ctx)
+    window_payload = [payloads.summary_json(chapter) for chapter in window_chapters]
+    canon_payload = _canon_payload_for_chapters(window_chapters, cfg, ctx)
 
-    prompt = render_prompt(
+    prompt = _pack_prompt(
         "arc_window.j2",
         {
             "schema": ArcReport.model_json_schema(),
             "window": window_payload,
             "canon": canon_payload,
         },
+        cfg,
+        model,
+        ctx,
+        task_key=_arc_key(window_chapters),
+        chapter_keys=["window"],
     )
 
-    agent = build_arc_agent(model)
+    agent = _build_agent(build_arc_agent, model, ctx)
     report = await _generate_report(
         agent,
         prompt,
         ArcReport,
         retries=2,
         defaults={"window_slug": window_slug},
+        ctx=ctx,
+        stage="arc",
+        task=_arc_key(window_chapters),
     )
 
-    write_json(report_path, report.model_dump(mode="json"))
-    md = render_markdown("arc_report.md.j2", {"report": report.model_dump(mode="json")})
+    data = report.model_dump(mode="json")
+    write_json(report_path, data)
+    md = render_markdown("arc_report.md.j2", {"report": data})
     write_text(md_path, md)
+    if ctx and ctx.dashboard is not None:
+        ctx.dashboard.add_report("arc", _arc_key(window_chapters), data)
 
 
-async def run_synthesis(run_dir: Path, model: str, force: bool) -> None:
-    report_dir = run_dir / "chapter"
-    output_json = run_dir / "final" / "action-plan.json"
-    output_md = run_dir / "final" / "action-plan.md"
+async def run_synthesis(
+    run_dir: Path,
+    model: str,
+    force: bool,
+    ctx: Optional[RunContext] = None,
+    node: Optional[SynthesisNode] = None,
+) -> None:
+    """Synthesize one node of the reduction tree; without ``node``, every chapter report in the run."""
+    output_json = node.output_path(run_dir) if node else run_dir / "final" / "action-plan.json"
     if artifact_exists(output_json) and not force:
         return
 
-    reports = []
-    for report_path in report_dir.glob("*.report.json"):
+    if node is None:
+        input_paths = sorted((run_dir / "chapter").glob("*.report.json"))
+    else:
+        input_paths = node.input_paths(run_dir)
+    inputs = []
+    for input_path in input_paths:
         try:
-            reports.append(json.loads(report_path.read_text()))
+            inputs.append(json.loads(input_path.read_text()))
         except Exception:
             continue
 
-    prompt = render_prompt(
-        "synthesis.j2",
-        {
-            "schema": ActionPlan.model_json_schema(),
-            "reports": reports,
-        },
-    )
+    if node is not None and node.level > 1:
+        prompt = render_prompt("synthesis_merge.j2", {"schema": ActionPlan.model_json_schema(), "plans": inputs})
+    else:
+        prompt = render_prompt("synthesis.j2", {"schema": ActionPlan.model_json_schema(), "reports": inputs})
 
-    agent = build_synthesis_agent(model)
-    plan = await _generate_report(agent, prompt, ActionPlan, retries=2, defaults={})
+    agent = _build_agent(build_synthesis_agent, model, ctx)
+    plan = await _generate_report(
+        agent,
+        prompt,
+        ActionPlan,
+        retries=2,
+        defaults={},
+        ctx=ctx,
+        stage="synthesis",
+        task=node.key if node else ROOT_KEY,
+    )
 
     write_json(output_json, plan.model_dump(mode="json"))
-    md = render_markdown("action_plan.md.j2", {"plan": plan.model_dump(mode="json")})
-    write_text(output_md, md)
-
-
-def _chapter_payload(chapter: Chapter, cfg: StorylintConfig) -> Dict[str, Any]:
-    scenes = []
-    for scene in chapter.scenes:
-        paragraphs = []
-        for paragraph in scene.paragraphs[: cfg.prompt.max_paragraphs]:
-            paragraphs.append(
-                {
-                    "idx": paragraph.idx,
-                    "location": f"{chapter.slug}:{scene.meta.id}:p{paragraph.idx}",
-                    "text": _truncate(paragraph.text, cfg.prompt.max_scene_chars),
-                }
-            )
-        scenes.append(
-            {
-                "id": scene.meta.id,
-                "title": scene.meta.title,
-                "when": scene.meta.when,
-                "location": scene.meta.location,
-                "characters": scene.meta.characters,
-                "tags": scene.meta.tags,
-                "images": scene.meta.images,
-                "paragraphs": paragraphs,
-            }
-        )
+    if node is None or node.is_root:
+        md = render_markdown("action_plan.md.j2", {"plan": plan.model_dump(mode="json")})
+        write_text(output_json.with_suffix(".md"), md)
 
-    return {
-        "slug": chapter.slug,
-        "title": chapter.title,
-        "path": str(chapter.path),
-        "scenes": scenes,
-    }
 
+def _pack_prompt(
+    template_name: str,
+    context: Dict[str, Any],
+    cfg: StorylintConfig,
+    model: str,
+    ctx: Optional[RunContext],
+    task_key: str,
+    chapter_keys: list[str],
+) -> str:
+    packed = pack_prompt(template_name, context, token_budget(cfg, model), chapter_keys)
+    if packed.trimmed and ctx is not None:
+        ctx.prompt_cuts[task_key] = packed.summary()
+    return packed.prompt
 
-def _chapter_summary_payload(chapter: Chapter, cfg: StorylintConfig) -> Dict[str, Any]:
-    scenes = []
-    for scene in chapter.scenes:
-        snippet = ""
-        if scene.paragraphs:
-            snippet = _truncate(scene.paragraphs[0].text, 320)
-        scenes.append(
-            {
-                "id": scene.meta.id,
-                "title": scene.meta.title,
-                "location": scene.meta.location,
-                "characters": scene.meta.characters,
-                "tags": scene.meta.tags,
-                "snippet": snippet,
-            }
-        )
-    return {
-        "slug": chapter.slug,
-        "title": chapter.title,
-        "scenes": scenes,
-    }
+
+def _payloads(cfg: StorylintConfig, ctx: Optional[RunContext]) -> PayloadCache:
+    if ctx is not None and ctx.payloads is not None:
+        return ctx.payloads
+    return PayloadCache(cfg)
 
 
-def _canon_payload_for_chapters(chapters: list[Chapter], cfg: StorylintConfig) -> Dict[str, Any]:
+def _integrity_findings(chapter: Chapter, cfg: StorylintConfig, ctx: Optional[RunContext]) -> List[Issue]:
+    if ctx and chapter.slug in ctx.integrity:
+        return ctx.integrity[chapter.slug]
+    return validate_slugs(chapter, cfg) + validate_imagery(chapter, cfg)
+
+
+def _canon_payload_for_chapters(
+    chapters: list[Chapter],
+    cfg: StorylintConfig,
+    ctx: Optional[RunContext] = None,
+) -> Dict[str, Any]:
     characters = set()
     locations = set()
     for chapter in chapters:
@@ -414,22 +586,43 @@ def _canon_payload_for_chapters(chapters: list[Chapter], cfg: StorylintConfig) -
             if scene.meta.location:
                 locations.add(scene.meta.location)
 
+    def _snapshot(slug: str, base_dir: Path) -> str:
+        if ctx and ctx.canon is not None:
+            return ctx.canon.snapshot(slug, base_dir)
+        return load_canon_snapshot(slug, base_dir, cfg.canon_snapshot_chars)
+
     return {
-        "characters": {
-            slug: load_canon_snapshot(slug, cfg.characters_dir, cfg.canon_snapshot_chars)
-            for slug in sorted(c for c in characters if c)
-        },
-        "locations": {
-            slug: load_canon_snapshot(slug, cfg.locations_dir, cfg.canon_snapshot_chars)
-            for slug in sorted(l for l in locations if l)
-        },
+        "characters": {slug: _snapshot(slug, cfg.characters_dir) for slug in sorted(c for c in characters if c)},
+        "locations": {slug: _snapshot(slug, cfg.locations_dir) for slug in sorted(l for l in locations if l)},
     }
 
 
-def _truncate(text: str, max_chars: int) -> str:
-    if max_chars <= 0 or len(text) <= max_chars:
-        return text
-    return text[: max_chars - 3] + "..."
+def _window_slug(window_chapters: list[Chapter]) -> str:
+    return f"{window_chapters[0].slug}-{window_chapters[-1].slug}"
+
+
+def _chapter_key(chapter: Chapter) -> str:
+    return f"chapter:{chapter.slug}"
+
+
+def _adjacent_key(left: Chapter, right: Chapter) -> str:
+    return f"adjacent:{left.slug}->{right.slug}"
+
+
+def _arc_key(window_chapters: list[Chapter]) -> str:
+    return f"arc:{_window_slug(window_chapters)}"
+
+
+def _report_path(run_dir: Path, key: str) -> Path:
+    stage, name = key.split(":", 1)
+    return run_dir / stage / f"{name.replace('->', '_')}.report.json"
+
+
+def _read_json(path: Path) -> Optional[Dict[str, Any]]:
+    try:
+        return json.loads(path.read_text())
+    except Exception:
+        return None
 
 
 def _build_windows(chapters: list[Chapter], window: int) -> list[list[Chapter]]:
@@ -440,20 +633,101 @@ def _build_windows(chapters: list[Chapter], window: int) -> list[list[Chapter]]:
     return [chapters[i : i + window] for i in range(0, len(chapters) - window + 1)]
 
 
-async def _generate_report(agent, prompt: str, model_cls, retries: int = 2, defaults: Optional[Dict[str, Any]] = None):
-    last_error: Optional[Exception] = None
-    for attempt in range(retries + 1):
-        try:
-            raw = await run_agent_prompt(agent, prompt)
-            data = _extract_json(raw)
-            if defaults:
-                for key, value in defaults.items():
-                    data.setdefault(key, value)
-            return model_cls.model_validate(data)
-        except Exception as exc:
-            last_error = exc
-            await asyncio.sleep(1 + attempt)
-    raise RuntimeError(f"Failed to generate report: {last_error}")
+def _build_agent(builder, model: str, ctx: Optional[RunContext]):
+    if ctx and ctx.runners is not None:
+        return ctx.runners.agent(builder, model)
+    return builder(model)
+
+
+async def _generate_report(
+    agent,
+    prompt: str,
+    model_cls,
+    retries: int = 2,
+    defaults: Optional[Dict[str, Any]] = None,
+    ctx: Optional[RunContext] = None,
+    stage: str = "",
+    task: str = "",
+):
+    cache = ctx.cache if ctx else None
+    limiter = ctx.limiters.get(stage) if ctx else None
+    telemetry = ctx.telemetry if ctx else None
+    estimated_tokens = estimate_tokens(prompt)
+    call = CallRecord(
+        stage=stage,
+        task=task,
+        model=str(agent.model),
+        prompt_chars=len(prompt),
+        prompt_tokens_est=estimated_tokens,
+    )
+    wall_start = time.monotonic()
+    try:
+        cache_key = cache_key_for_agent(agent, prompt) if cache else None
+        if cache and cache_key and ctx.read_cache:
+            cached = cache.get(cache_key)
+            if cached is not None:
+                try:
+                    report = model_cls.model_validate(cached)
+                    call.cached = call.ok = True
+                    return report
+                except Exception:
+                    pass
+
+        rate_limiter = get_rate_limiter(str(agent.model))
+        last_error: Optional[Exception] = None
+        for attempt in range(retries + 1):
+            call.attempts = attempt + 1
+            try:
+                if rate_limiter:
+                    await rate_limiter.acquire(estimated_tokens)
+                usage = TokenUsage()
+                call_start = time.monotonic()
+                try:
+                    raw = await run_agent_prompt(
+                        agent,
+                        prompt,
+                        usage=usage,
+                        pool=ctx.runners if ctx else None,
+                        backend=ctx.backend if ctx else None,
+                    )
+                except Exception as exc:
+                    if limiter:
+                        limiter.record(exc)
+                    raise
+                finally:
+                    call_sec = time.monotonic() - call_start
+                    call.latency_sec = round(call_sec, 4)
+                    call.model_sec = round(call.model_sec + call_sec, 4)
+                    call.prompt_tokens += usage.prompt_tokens
+                    call.output_tokens += usage.output_tokens
+                    call.total_tokens += usage.total_tokens
+                    if rate_limiter:
+                        rate_limiter.reconcile(estimated_tokens, usage.total_tokens)
+                if limiter:
+                    limiter.record(None)
+                data = _extract_json(raw)
+                if defaults:
+                    for key, value in defaults.items():
+                        data.setdefault(key, value)
+                report = model_cls.model_validate(data)
+                if cache and cache_key:
+                    cache.put(cache_key, report.model_dump(mode="json"), model=str(agent.model))
+                call.ok = True
+                call.error_class = None
+                return report
+            except Exception as exc:
+                last_error = exc
+                call.error_class = exc.__class__.__name__
+                if attempt == retries:
+                    break  # the task's failure event follows; nothing is retried
+                if ctx and ctx.journal is not None and task:
+                    ctx.journal.retry(task, attempt + 1, exc)
+                await asyncio.sleep(1 + attempt)
+        raise RuntimeError(f"Failed to generate report: {last_error}")
+    finally:
+        call.wall_sec = round(time.monotonic() - wall_start, 4)
+        if telemetry is not None:
+            telemetry.record(call)
 
 
 def _extract_json(text: str) -> Any:
@@ -464,85 +738,3 @@ def _extract_json(text: str) -> Any:
     if match:
         return json.loads(match.group(0))
     raise ValueError("No JSON object found in model output.")
-
-
-async def write_dashboard_summary(
-    run_dir: Path,
-    run_id: str,
-    mode: str,
-    window: int,
-    chapters: list[Chapter],
-    adjacent_pairs: list[tuple[Chapter, Chapter]],
-    arc_windows: list[list[Chapter]],
-    error_count: int,
-    recent_errors: list[str],
-) -> None:
-    chapter_reports = list((run_dir / "chapter").glob("*.report.json"))
-    adjacent_reports = list((run_dir / "adjacent").glob("*.report.json"))
-    arc_reports = list((run_dir / "arc").glob("*.report.json"))
-
-    issues_total = 0
-    by_severity: dict[str, int] = {}
-    by_type: dict[str, int] = {}
-    by_chapter: dict[str, int] = {}
-
-    for report_path in chapter_reports:
-        try:
-            data = json.loads(report_path.read_text())
-        except Exception:
-            continue
-        chapter_slug = data.get("chapter_slug") or report_path.stem.replace(".report", "")
-        for issue in (data.get("issues") or []) + (data.get("integrity_findings") or []):
-            issues_total += 1
-            severity = issue.get("severity", "unknown")
-            issue_type = issue.get("type", "unknown")
-            by_severity[severity] = by_severity.get(severity, 0) + 1
-            by_type[issue_type] = by_type.get(issue_type, 0) + 1
-            by_chapter[chapter_slug] = by_chapter.get(chapter_slug, 0) + 1
-
-    for report_path in adjacent_reports:
-        try:
-            data = json.loads(report_path.read_text())
-        except Exception:
-            continue
-        for issue in data.get("findings") or []:
-            issues_total += 1
-            severity = issue.get("severity", "unknown")
-            issue_type = issue.get("type", "unknown")
-            by_severity[severity] = by_severity.get(severity, 0) + 1
-            by_type[issue_type] = by_type.get(issue_type, 0) + 1
-
-    top_chapters = sorted(
-        ({"chapter": slug, "issue_count": count} for slug, count in by_chapter.items()),
-        key=lambda item: item["issue_count"],
-        reverse=True,
-    )[:5]
-
-    summary = DashboardSummary(
-        run_id=run_id,
-        generated_at=datetime.utcnow().isoformat() + "Z",
-        mode=mode,
-        window=window,
-        counts={
-            "chapters_total": len(chapters),
-            "chapters_completed": len(chapter_reports),
-            "adjacent_total": len(adjacent_pairs),
-            "adjacent_completed": len(adjacent_reports),
-            "arc_total": len(arc_windows),
-            "arc_completed": len(arc_reports),
-            "errors": error_count,
-        },
-        issues={
-            "total": issues_total,
-            "by_severity": by_severity,
-            "by_type": by_type,
-        },
-        top_chapters=top_chapters,
-        errors=recent_errors,
-    )
-
-    output_json = run_dir / "final" / "dashboard.json"
-    output_md = run_dir / "final" / "dashboard.md"
-    write_json(output_json, summary.model_dump(mode="json"))
-    md = render_markdown("dashboard.md.j2", {"dashboard": summary.model_dump(mode="json")})
-    write_text(output_md, md)
@@ -0,0 +1,112 @@
+"""Dependency-driven task scheduler for Storylint pipeline stages."""
+from __future__ import annotations
+
+import asyncio
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+TaskFn = Callable[[], Awaitable[None]]
+StartCallback = Callable[["GraphTask"], None]
+DoneCallback = Callable[["GraphTask", Optional[BaseException]], None]
+
+
+@dataclass
+class GraphTask:
+    key: str
+    stage: str
+    fn: TaskFn
+    deps: List[str] = field(default_factory=list)
+
+
+class TaskGraph:
+    """Runs each task as soon as its dependencies have settled.
+
+    Tasks in the same stage share that stage's limiter (anything usable with
+    ``async with``), so per-stage concurrency holds without stage-wide barriers.
+    A failed dependency does not cancel its dependents; they run against whatever
+    artifacts exist, matching the pipeline's best-effort behavior.
+    """
+
+    def __init__(self, limits: Dict[str, Any]) -> None:
+        self._limits = limits
+        self._tasks: Dict[str, GraphTask] = {}
+        self.failed: Dict[str, BaseException] = {}
+
+    def add(self, key: str, stage: str, fn: TaskFn, deps: Optional[List[str]] = None) -> GraphTask:
+        if key in self._tasks:
+            raise ValueError(f"Duplicate task key: {key}")
+        task = GraphTask(key=key, stage=stage, fn=fn, deps=list(deps or []))
+        self._tasks[key] = task
+        return task
+
+    def skip(self, keys: set[str]) -> None:
+        """Drop already-completed tasks; dependents treat them as settled."""
+        for key in keys:
+            self._tasks.pop(key, None)
+        for task in self._tasks.values():
+            task.deps = [dep for dep in task.deps if dep not in keys]
+
+    def tasks(self) -> List[GraphTask]:
+        return list(self._tasks.values())
+
+    def __len__(self) -> int:
+        return len(self._tasks)
+
+    def count(self, stage: str) -> int:
+        return sum(1 for task in self._tasks.values() if task.stage == stage)
+
+    async def run(
+        self,
+        on_done: Optional[DoneCallback] = None,
+        on_start: Optional[StartCallback] = None,
+    ) -> None:
+        self._check_graph()
+        settled = {key: asyncio.Event() for key in self._tasks}
+
+        async def _run(task: GraphTask) -> None:
+            error: Optional[BaseException] = None
+            try:
+                for dep in task.deps:
+                    await settled[dep].wait()
+                limit = self._limits.get(task.stage)
+                if limit is None:
+                    if on_start:
+                        on_start(task)
+                    await task.fn()
+                else:
+                    async with limit:
+                        if on_start:
+                            on_start(task)
+                        await task.fn()
+            except Exception as exc:
+                error = exc
+                self.failed[task.key] = exc
+            finally:
+                settled[task.key].set()
+            if on_done:
+                on_done(task, error)
+
+        await asyncio.gather(*[_run(task) for task in self._tasks.values()])
+
+    def _check_graph(self) -> None:
+        for task in self._tasks.values():
+            for dep in task.deps:
+                if dep not in self._tasks:
+                    raise ValueError(f"Task {task.key} depends on unknown task {dep}")
+
+        visiting: set[str] = set()
+        done: set[str] = set()
+
+        def _visit(key: str) -> None:
+            if key in done:
+                return
+            if key in visiting:
+                raise ValueError(f"Dependency cycle detected at task {key}")
+            visiting.add(key)
+            for dep in self._tasks[key].deps:
+                _visit(dep)
+            visiting.discard(key)
+            done.add(key)
+
+        for key in self._tasks:
+            _visit(key)
@@ -0,0 +1,110 @@
+"""Offline stand-in for model calls: schema-valid JSON with simulated latency and failures."""
+from __future__ import annotations
+
+import asyncio
+import json
+import math
+import random
+import time
+import typing
+from dataclasses import dataclass
+from typing import Any, Dict, Optional
+
+from pydantic import BaseModel
+
+from .ratelimit import TokenUsage, estimate_tokens
+
+
+@dataclass
+class SimulationProfile:
+    """Latency is lognormal, fitted to the given median and p95 (both in seconds)."""
+
+    median_sec: float = 0.8
+    p95_sec: float = 2.5
+    error_rate: float = 0.0
+    burst_rate: float = 0.0
+    burst_sec: float = 5.0
+    output_tokens: int = 600
+    seed: Optional[int] = None
+
+
+class SimulatedOverload(RuntimeError):
+    """Mimics a provider 429 so adaptive limits react as they would in production."""
+
+    code = 429
+
+
+class SimulatedBackend:
+    """Drop-in for ``run_agent_prompt`` that never touches the network.
+
+    Each call sleeps for a sampled latency, then either raises (``error_rate``), raises a
+    429 (inside a burst started with probability ``burst_rate`` per call and lasting
+    ``burst_sec``), or returns JSON that validates against the agent's ``output_schema``.
+    """
+
+    def __init__(self, profile: Optional[SimulationProfile] = None, clock=time.monotonic) -> None:
+        self.profile = profile or SimulationProfile()
+        self.calls = 0
+        self.errors = 0
+        self.overloads = 0
+        self._rng = random.Random(self.profile.seed)
+        self._clock = clock
+        self._burst_until = float("-inf")
+        median = max(self.profile.median_sec, 1e-6)
+        p95 = max(self.profile.p95_sec, median)
+        self._mu = math.log(median)
+        self._sigma = (math.log(p95) - self._mu) / 1.6449  # z-score of the 95th percentile
+
+    def sample_latency(self) -> float:
+        if self.profile.median_sec <= 0:
+            return 0.0
+        return self._rng.lognormvariate(self._mu, self._sigma)
+
+    async def run(self, agent, prompt: str, usage: Optional[TokenUsage] = None) -> str:
+        self.calls += 1
+        now = self._clock()
+        if now >= self._burst_until and self._rng.random() < self.profile.burst_rate:
+            self._burst_until = now + self.profile.burst_sec
+        if now < self._burst_until:
+            self.overloads += 1
+            await asyncio.sleep(min(0.05, self.sample_latency()))
+            raise SimulatedOverload("429 RESOURCE_EXHAUSTED (simulated)")
+
+        await asyncio.sleep(self.sample_latency())
+        if self._rng.random() < self.profile.error_rate:
+            self.errors += 1
+            raise RuntimeError("simulated model failure")
+        if usage is not None:
+            prompt_tokens = estimate_tokens(prompt)
+            usage.add(prompt_tokens, self.profile.output_tokens, prompt_tokens + self.profile.output_tokens)
+        schema = getattr(agent, "output_schema", None)
+        if schema is None:
+            return "{}"
+        return json.dumps(sample_payload(schema, self._rng))
+
+
+def sample_payload(model_cls: type[BaseModel], rng: random.Random) -> Dict[str, Any]:
+    """Fill every field of ``model_cls`` with a plausible value of the declared type."""
+    return {name: _sample(field.annotation, name, rng) for name, field in model_cls.model_fields.items()}
+
+
+def _sample(annotation: Any, name: str, rng: random.Random) -> Any:
+    origin = typing.get_origin(annotation)
+    args = typing.get_args(annotation)
+    if origin is typing.Literal:
+        return rng.choice(args)
+    if origin in (list, typing.List):
+        return [_sample(args[0] if args else str, name, rng) for _ in range(rng.randint(1, 3))]
+    if origin in (dict, typing.Dict) or annotation is dict:
+        return {}
+    if origin is typing.Union:
+        return _sample(next(arg for arg in args if arg is not type(None)), name, rng)
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        return sample_payload(annotation, rng)
+    if annotation is float:
+        return round(rng.uniform(0.5, 0.95), 2)
+    if annotation is int:
+        return rng.randint(0, 10)
+    if annotation is bool:
+        return rng.random() < 0.5
+    return f"simulated {name.replace('_', ' ')} {rng.randint(1, 999)}"
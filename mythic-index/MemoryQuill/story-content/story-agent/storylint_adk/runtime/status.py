@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from contextlib import contextmanager
 from dataclasses import dataclass
-from typing import Optional
+from typing import Any, Optional
 
 try:  # optional
     from rich.console import Console
@@ -31,7 +31,8 @@ class TaskHandle:
 
 
 class StatusReporter:
-    def __init__(self, max_errors: int = 6) -> None:
+    def __init__(self, max_errors: int = 6, quiet: bool = False) -> None:
+        self._quiet = quiet
         self._console = Console() if Console else None
         self._progress = None
         self._live = None
@@ -39,10 +40,11 @@ class StatusReporter:
         self._errors: list[tuple[str, str]] = []
         self._max_errors = max_errors
         self._error_count = 0
+        self._concurrency: dict[str, tuple[int, int]] = {}
 
     @contextmanager
     def display(self):
-        if Progress is None or Live is None or Panel is None or Table is None:
+        if self._quiet or Progress is None or Live is None or Panel is None or Table is None:
             yield self
             return
 
@@ -75,7 +77,9 @@ class StatusReporter:
         self._progress.update(handle.task_id, advance=advance, description=description)
         self._refresh()
 
-    def log(self, message: str) -> None:
+    def log(self, message: Any) -> None:
+        if self._quiet:
+            return
         if self._console:
             self._console.print(message)
         else:
@@ -89,6 +93,12 @@ class StatusReporter:
             self._errors = self._errors[-self._max_errors :]
         self._refresh()
 
+    def set_concurrency(self, stage: str, window: int, in_flight: int) -> None:
+        if self._concurrency.get(stage) == (window, in_flight):
+            return
+        self._concurrency[stage] = (window, in_flight)
+        self._refresh()
+
     @property
     def error_count(self) -> int:
         return self._error_count
@@ -102,11 +112,28 @@ class StatusReporter:
         layout = Layout()
         layout.split_column(
             Layout(name="progress", ratio=3),
+            Layout(name="concurrency", size=10),
             Layout(name="errors", ratio=1),
         )
+        self._update_layout(layout)
+        return layout
+
+    def _update_layout(self, layout) -> None:
         layout["progress"].update(Panel(self._progress, title="Progress", border_style="cyan"))
+        layout["concurrency"].update(Panel(self._concurrency_table(), title="Concurrency", border_style="blue"))
         layout["errors"].update(Panel(self._error_table(), title="Errors", border_style="red"))
-        return layout
+
+    def _concurrency_table(self):
+        table = Table(show_header=True, header_style="bold blue")
+        table.add_column("Stage", width=24)
+        table.add_column("Window", justify="right")
+        table.add_column("In flight", justify="right")
+        if not self._concurrency:
+            table.add_row("-", "-", "-")
+            return table
+        for stage, (window, in_flight) in self._concurrency.items():
+            table.add_row(stage, str(window), str(in_flight))
+        return table
 
     def _error_table(self):
         table = Table(show_header=True, header_style="bold red")
@@ -122,8 +149,7 @@ class StatusReporter:
     def _refresh(self) -> None:
         if self._layout is None or self._live is None or self._progress is None:
             return
-        self._layout["progress"].update(Panel(self._progress, title="Progress", border_style="cyan"))
-        self._layout["errors"].update(Panel(self._error_table(), title="Errors", border_style="red"))
+        self._update_layout(self._layout)
         self._live.refresh()
 
 
@@ -0,0 +1,72 @@
+"""Tree-reduction plan for synthesizing chapter reports into one action plan."""
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import List
+
+ROOT_KEY = "synthesis"
+
+
+@dataclass
+class SynthesisNode:
+    """One synthesis call: level 1 reads chapter reports, higher levels merge child plans."""
+
+    key: str
+    level: int
+    inputs: List[str]
+    deps: List[str] = field(default_factory=list)
+
+    @property
+    def is_root(self) -> bool:
+        return self.key == ROOT_KEY
+
+    def output_path(self, run_dir: Path) -> Path:
+        return plan_path(run_dir, self.key)
+
+    def input_paths(self, run_dir: Path) -> List[Path]:
+        if self.level == 1:
+            return [run_dir / "chapter" / f"{slug}.report.json" for slug in self.inputs]
+        return [plan_path(run_dir, key) for key in self.inputs]
+
+
+def plan_path(run_dir: Path, key: str) -> Path:
+    if key == ROOT_KEY:
+        return run_dir / "final" / "action-plan.json"
+    return run_dir / "synthesis" / f"{key.split(':', 1)[-1]}.plan.json"
+
+
+def build_synthesis_tree(chapter_slugs: List[str], fan_in: int) -> List[SynthesisNode]:
+    """Batch chapters ``fan_in`` at a time, then merge plans ``fan_in`` at a time until one is left.
+
+    Returns nodes in dependency order, ending with the root. With ``fan_in < 2`` or no more
+    chapters than ``fan_in``, the root alone covers every chapter (a single flat synthesis).
+    """
+    if fan_in < 2 or len(chapter_slugs) <= fan_in:
+        return [SynthesisNode(ROOT_KEY, 1, list(chapter_slugs), [f"chapter:{slug}" for slug in chapter_slugs])]
+
+    nodes: List[SynthesisNode] = []
+    level = 1
+    current = [
+        SynthesisNode(f"synthesis:l1-{idx:03d}", 1, batch, [f"chapter:{slug}" for slug in batch])
+        for idx, batch in enumerate(_batches(chapter_slugs, fan_in))
+    ]
+    while len(current) > fan_in:
+        nodes.extend(current)
+        level += 1
+        current = [
+            SynthesisNode(
+                f"synthesis:l{level}-{idx:03d}",
+                level,
+                [child.key for child in batch],
+                [child.key for child in batch],
+            )
+            for idx, batch in enumerate(_batches(current, fan_in))
+        ]
+    nodes.extend(current)
+    nodes.append(SynthesisNode(ROOT_KEY, level + 1, [node.key for node in current], [node.key for node in current]))
+    return nodes
+
+
+def _batches(items: list, size: int) -> list[list]:
+    return [items[idx : idx + size] for idx in range(0, len(items), size)]
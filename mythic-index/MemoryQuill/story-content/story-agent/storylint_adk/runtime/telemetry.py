@@ -0,0 +1,157 @@
+"""Per-call latency/token ledger (``final/telemetry.jsonl``) and its per-stage summary."""
+from __future__ import annotations
+
+import json
+import math
+import time
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, TextIO
+
+TELEMETRY_NAME = "telemetry.jsonl"
+
+
+@dataclass
+class CallRecord:
+    stage: str
+    task: str
+    model: str
+    prompt_chars: int
+    prompt_tokens_est: int
+    started_at: float = field(default_factory=time.time)
+    prompt_tokens: int = 0
+    output_tokens: int = 0
+    total_tokens: int = 0
+    attempts: int = 0
+    latency_sec: float = 0.0
+    model_sec: float = 0.0
+    wall_sec: float = 0.0
+    cached: bool = False
+    ok: bool = False
+    error_class: Optional[str] = None
+
+
+@dataclass
+class StageSummary:
+    stage: str
+    calls: int
+    cached: int
+    failed: int
+    retries: int
+    p50_sec: float
+    p95_sec: float
+    calls_per_min: float
+    output_tokens_per_min: float
+
+
+class TelemetryLedger:
+    """Appends one JSON line per model-backed report request, flushed as it is written."""
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self.records: List[CallRecord] = []
+        self._handle: Optional[TextIO] = None
+
+    @classmethod
+    def for_run(cls, run_dir: Path) -> "TelemetryLedger":
+        return cls(run_dir / "final" / TELEMETRY_NAME)
+
+    def record(self, record: CallRecord) -> None:
+        self.records.append(record)
+        if self._handle is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._handle = self.path.open("a", encoding="utf-8")
+        self._handle.write(json.dumps(asdict(record), ensure_ascii=True) + "\n")
+        self._handle.flush()
+
+    def close(self) -> None:
+        if self._handle is not None:
+            self._handle.close()
+            self._handle = None
+
+
+def load_records(path: Path) -> List[CallRecord]:
+    records: List[CallRecord] = []
+    with path.open(encoding="utf-8") as handle:
+        for line in handle:
+            try:
+                records.append(CallRecord(**json.loads(line)))
+            except (json.JSONDecodeError, TypeError):
+                continue
+    return records
+
+
+def percentile(values: List[float], pct: float) -> float:
+    """Nearest-rank percentile; 0.0 for an empty list."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(1, math.ceil(pct / 100.0 * len(ordered)))
+    return ordered[rank - 1]
+
+
+def summarize(records: Iterable[CallRecord]) -> List[StageSummary]:
+    """Latency percentiles and throughput per stage; cache hits count as calls but not latency."""
+    by_stage: Dict[str, List[CallRecord]] = {}
+    for record in records:
+        by_stage.setdefault(record.stage, []).append(record)
+
+    summaries = []
+    for stage, items in by_stage.items():
+        live = [item for item in items if not item.cached]
+        latencies = [item.latency_sec for item in live if item.ok]
+        span = 0.0
+        if items:
+            span = max(item.started_at + item.wall_sec for item in items) - min(item.started_at for item in items)
+        minutes = span / 60.0 if span > 0 else 0.0
+        summaries.append(
+            StageSummary(
+                stage=stage,
+                calls=len(items),
+                cached=len(items) - len(live),
+                failed=sum(1 for item in items if not item.ok),
+                retries=sum(max(0, item.attempts - 1) for item in live),
+                p50_sec=round(percentile(latencies, 50), 3),
+                p95_sec=round(percentile(latencies, 95), 3),
+                calls_per_min=round(len(items) / minutes, 1) if minutes else 0.0,
+                output_tokens_per_min=round(sum(item.output_tokens for item in live) / minutes, 1) if minutes else 0.0,
+            )
+        )
+    return summaries
+
+
+SUMMARY_COLUMNS = ["Stage", "Calls", "Hit", "Fail", "Retry", "p50 s", "p95 s", "Calls/m", "Tok/m"]
+
+
+def summary_rows(summaries: List[StageSummary]) -> List[List[str]]:
+    return [
+        [
+            item.stage,
+            str(item.calls),
+            str(item.cached),
+            str(item.failed),
+            str(item.retries),
+            f"{item.p50_sec:.2f}",
+            f"{item.p95_sec:.2f}",
+            f"{item.calls_per_min:.1f}",
+            f"{item.output_tokens_per_min:.0f}",
+        ]
+        for item in summaries
+    ]
+
+
+def summary_table(summaries: List[StageSummary]) -> Any:
+    """A rich Table when rich is installed, otherwise aligned plain text."""
+    rows = summary_rows(summaries)
+    try:
+        from rich.table import Table
+    except ImportError:  # pragma: no cover
+        widths = [max(len(row[idx]) for row in [SUMMARY_COLUMNS, *rows]) for idx in range(len(SUMMARY_COLUMNS))]
+        return "\n".join("  ".join(cell.ljust(width) for cell, width in zip(row, widths)) for row in [SUMMARY_COLUMNS, *rows])
+
+    table = Table(title="Model calls by stage")
+    for column in SUMMARY_COLUMNS:
+        table.add_column(column, justify="left" if column == "Stage" else "right", no_wrap=True)
+    for row in rows:
+        table.add_row(*row)
+    return table
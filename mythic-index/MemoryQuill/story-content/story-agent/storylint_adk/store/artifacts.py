@@ -57,7 +57,7 @@ def build_index(chapters: list[Chapter]) -> Dict[str, Any]:
                         "tags": scene.meta.tags,
                         "images": scene.meta.images,
                         "line_range": [scene.start_line, scene.end_line],
-                        "paragraphs": len(scene.paragraphs),
+                        "paragraphs": scene.paragraph_count,
                         "anchor": f"{chapter.slug}:{scene.meta.id}",
                     }
                     for scene in chapter.scenes
@@ -0,0 +1,539 @@
+"""Corpus-wide SQLite index of chapters, scenes and the slugs they reference.
+
+The index lives in ``<cache.dir>/scene-index.sqlite`` and is brought up to date by
+``refresh``: chapters whose size and mtime are unchanged are skipped, edited ones are
+re-parsed (through the parsed-chapter cache) and deleted ones are dropped. Queries are
+plain SQL over indexed tables, so tools can ask "which scenes feature this character"
+without reading a single ``content.md``.
+"""
+from __future__ import annotations
+
+import re
+import sqlite3
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+import yaml
+
+from ..config import StorylintConfig
+from ..parser.scene_parser import Chapter, load_chapter
+from ..parser.yaml_cache import safe_load
+from ..tools.repo_tools import discover_chapters
+
+INDEX_NAME = "scene-index.sqlite"
+# Bump when the tables or what is extracted into them change; the index is then rebuilt.
+SCHEMA_VERSION = 1
+
+_FRONTMATTER = re.compile(r"\A---\s*\n(.*?)\n---\s*\n", re.DOTALL)
+_FRONTMATTER_REFS = {"key_characters": "character", "key_locations": "location"}
+_SEP = "\x1f"
+
+_SCHEMA = """
+CREATE TABLE meta (key TEXT PRIMARY KEY, value TEXT NOT NULL);
+CREATE TABLE chapters (
+    id INTEGER PRIMARY KEY,
+    slug TEXT NOT NULL,
+    folder TEXT NOT NULL UNIQUE,
+    path TEXT NOT NULL,
+    title TEXT NOT NULL,
+    top_level INTEGER NOT NULL,
+    size INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    error TEXT
+);
+CREATE TABLE scenes (
+    id INTEGER PRIMARY KEY,
+    chapter_id INTEGER NOT NULL REFERENCES chapters(id) ON DELETE CASCADE,
+    ordinal INTEGER NOT NULL,
+    scene_id TEXT NOT NULL,
+    title TEXT NOT NULL,
+    time TEXT,
+    location TEXT,
+    primary_zone TEXT,
+    start_line INTEGER NOT NULL,
+    end_line INTEGER NOT NULL,
+    meta_start_line INTEGER NOT NULL,
+    paragraphs INTEGER NOT NULL
+);
+CREATE TABLE scene_characters (
+    scene INTEGER NOT NULL REFERENCES scenes(id) ON DELETE CASCADE,
+    position INTEGER NOT NULL,
+    character TEXT NOT NULL
+);
+CREATE TABLE scene_locations (
+    scene INTEGER NOT NULL REFERENCES scenes(id) ON DELETE CASCADE,
+    location TEXT NOT NULL
+);
+CREATE TABLE zones (
+    scene INTEGER NOT NULL REFERENCES scenes(id) ON DELETE CASCADE,
+    location TEXT,
+    zone TEXT NOT NULL,
+    is_primary INTEGER NOT NULL
+);
+CREATE TABLE images (
+    scene INTEGER NOT NULL REFERENCES scenes(id) ON DELETE CASCADE,
+    position INTEGER NOT NULL,
+    image TEXT NOT NULL
+);
+CREATE TABLE anchors (
+    anchor TEXT NOT NULL,
+    scene INTEGER NOT NULL REFERENCES scenes(id) ON DELETE CASCADE,
+    paragraph INTEGER,
+    start_line INTEGER NOT NULL,
+    end_line INTEGER NOT NULL
+);
+CREATE TABLE chapter_refs (
+    chapter_id INTEGER NOT NULL REFERENCES chapters(id) ON DELETE CASCADE,
+    kind TEXT NOT NULL,
+    slug TEXT NOT NULL
+);
+CREATE INDEX scenes_chapter ON scenes(chapter_id, ordinal);
+CREATE INDEX scenes_scene_id ON scenes(scene_id);
+CREATE INDEX scene_characters_character ON scene_characters(character, scene);
+CREATE INDEX scene_characters_scene ON scene_characters(scene);
+CREATE INDEX scene_locations_location ON scene_locations(location, scene);
+CREATE INDEX scene_locations_scene ON scene_locations(scene);
+CREATE INDEX zones_location ON zones(location, zone);
+CREATE INDEX zones_scene ON zones(scene);
+CREATE INDEX images_image ON images(image);
+CREATE INDEX images_scene ON images(scene);
+CREATE INDEX anchors_anchor ON anchors(anchor);
+CREATE INDEX anchors_scene ON anchors(scene);
+CREATE INDEX chapter_refs_slug ON chapter_refs(kind, slug);
+CREATE INDEX chapter_refs_chapter ON chapter_refs(chapter_id);
+"""
+
+# Columns of ``SceneRow`` in order; the list columns are folded with group_concat.
+_SCENE_SELECT = f"""
+SELECT c.slug, s.ordinal, s.scene_id, s.title, s.time, s.location, s.primary_zone,
+    (SELECT group_concat(character, '{_SEP}') FROM
+        (SELECT character FROM scene_characters WHERE scene = s.id ORDER BY position)),
+    (SELECT group_concat(image, '{_SEP}') FROM
+        (SELECT image FROM images WHERE scene = s.id ORDER BY position)),
+    s.start_line, s.end_line, s.meta_start_line, s.paragraphs, c.path
+FROM scenes s JOIN chapters c ON c.id = s.chapter_id
+"""
+_SCENE_ORDER = " ORDER BY c.folder, s.ordinal"
+
+
+@dataclass(frozen=True)
+class ChapterRow:
+    slug: str
+    folder: str
+    path: Path
+    title: str
+    top_level: bool
+    scenes: int
+    error: Optional[str]
+
+
+@dataclass(frozen=True)
+class SceneRow:
+    chapter: str
+    ordinal: int
+    scene_id: str
+    title: str
+    when: Optional[str]
+    location: Optional[str]
+    primary_zone: Optional[str]
+    characters: Tuple[str, ...]
+    images: Tuple[str, ...]
+    start_line: int
+    end_line: int
+    meta_start_line: int
+    paragraphs: int
+    path: Path
+
+    @property
+    def anchor(self) -> str:
+        return f"{self.chapter}:{self.scene_id}"
+
+
+@dataclass(frozen=True)
+class AnchorRow:
+    anchor: str
+    chapter: str
+    scene_id: str
+    paragraph: Optional[int]
+    start_line: int
+    end_line: int
+    path: Path
+
+
+@dataclass
+class IndexStats:
+    chapters: int = 0
+    unchanged: int = 0
+    indexed: int = 0
+    removed: int = 0
+    errors: int = 0
+
+
+class SceneIndex:
+    """Incrementally maintained SQLite index over every chapter ``discover_chapters`` finds.
+
+    Queries read whatever the last ``refresh`` stored; callers that may run after edits
+    refresh first (a stat per chapter when nothing changed). ``top_level=True`` restricts
+    a query to chapter folders directly under ``chapters_dir``, skipping ``drafts/`` and
+    other nested folders.
+    """
+
+    def __init__(self, db_path: Path, config: StorylintConfig) -> None:
+        self.db_path = db_path
+        self.config = config
+        db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(db_path))
+        try:
+            self._prepare()
+        except sqlite3.DatabaseError:
+            # Not a database (or a damaged one): it only holds derived data, so start over.
+            self._conn.close()
+            for suffix in ("", "-wal", "-shm"):
+                Path(f"{db_path}{suffix}").unlink(missing_ok=True)
+            self._conn = sqlite3.connect(str(db_path))
+            self._prepare()
+
+    @classmethod
+    def from_config(cls, cfg: StorylintConfig) -> "SceneIndex":
+        return cls(cfg.cache.dir / INDEX_NAME, cfg)
+
+    @classmethod
+    def for_story_content(cls, root: Path, refresh: bool = True) -> "SceneIndex":
+        """Open (and by default refresh) the index of a story-content tree laid out like this repo's."""
+        cfg = StorylintConfig(
+            project_root=root,
+            chapters_dir=Path("chapters"),
+            characters_dir=Path("characters"),
+            locations_dir=Path("locations"),
+        )
+        index = cls.from_config(cfg)
+        if refresh:
+            index.refresh()
+        return index
+
+    def close(self) -> None:
+        self._conn.close()
+
+    def __enter__(self) -> "SceneIndex":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+    # -- maintenance -----------------------------------------------------------------
+
+    def refresh(self) -> IndexStats:
+        """Bring the index in line with the chapter files on disk in one transaction."""
+        stats = IndexStats()
+        chapters_dir = self.config.chapters_dir
+        known = {
+            folder: (chapter_id, size, mtime_ns)
+            for chapter_id, folder, size, mtime_ns in self._conn.execute(
+                "SELECT id, folder, size, mtime_ns FROM chapters"
+            )
+        }
+        with self._conn:
+            seen = set()
+            for path in discover_chapters(self.config):
+                folder = path.parent.relative_to(chapters_dir).as_posix()
+                seen.add(folder)
+                stats.chapters += 1
+                stat = path.stat()
+                previous = known.get(folder)
+                if previous is not None and previous[1:] == (stat.st_size, stat.st_mtime_ns):
+                    stats.unchanged += 1
+                    continue
+                if previous is not None:
+                    self._conn.execute("DELETE FROM chapters WHERE id = ?", (previous[0],))
+                if not self._index_chapter(path, folder, stat.st_size, stat.st_mtime_ns):
+                    stats.errors += 1
+                stats.indexed += 1
+            for folder in known.keys() - seen:
+                self._conn.execute("DELETE FROM chapters WHERE id = ?", (known[folder][0],))
+                stats.removed += 1
+        return stats
+
+    def clear(self) -> None:
+        """Forget every chapter so the next ``refresh`` parses them all again."""
+        with self._conn:
+            self._conn.execute("DELETE FROM chapters")
+
+    def _index_chapter(self, path: Path, folder: str, size: int, mtime_ns: int) -> bool:
+        try:
+            chapter: Optional[Chapter] = load_chapter(path, self.config)
+            error = None
+        except (ValueError, UnicodeDecodeError) as exc:
+            chapter, error = None, str(exc)
+        cursor = self._conn.execute(
+            "INSERT INTO chapters (slug, folder, path, title, top_level, size, mtime_ns, error)"
+            " VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+            (
+                path.parent.name,
+                folder,
+                str(path),
+                chapter.title if chapter else "",
+                "/" not in folder,
+                size,
+                mtime_ns,
+                error,
+            ),
+        )
+        chapter_id = cursor.lastrowid
+        self._conn.executemany(
+            "INSERT INTO chapter_refs (chapter_id, kind, slug) VALUES (?, ?, ?)",
+            ((chapter_id, kind, slug) for kind, slug in _frontmatter_refs(path)),
+        )
+        if chapter is None:
+            return False
+        for ordinal, scene in enumerate(chapter.scenes, start=1):
+            meta = scene.meta
+            primary_zone = _optional_str(meta.raw.get("primary_zone"))
+            paragraphs = scene.paragraph_lines()
+            scene_row = self._conn.execute(
+                "INSERT INTO scenes (chapter_id, ordinal, scene_id, title, time, location, primary_zone,"
+                " start_line, end_line, meta_start_line, paragraphs) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    chapter_id,
+                    ordinal,
+                    meta.id,
+                    meta.title,
+                    _optional_str(meta.when),
+                    _optional_str(meta.location),
+                    primary_zone,
+                    scene.start_line,
+                    scene.end_line,
+                    scene.meta_start_line,
+                    len(paragraphs),
+                ),
+            ).lastrowid
+            self._conn.executemany(
+                "INSERT INTO scene_characters (scene, position, character) VALUES (?, ?, ?)",
+                ((scene_row, position, slug) for position, slug in enumerate(meta.characters) if slug),
+            )
+            if meta.location:
+                self._conn.execute(
+                    "INSERT INTO scene_locations (scene, location) VALUES (?, ?)", (scene_row, str(meta.location))
+                )
+            self._conn.executemany(
+                "INSERT INTO zones (scene, location, zone, is_primary) VALUES (?, ?, ?, ?)",
+                (
+                    (scene_row, _optional_str(meta.location), zone, zone == primary_zone)
+                    for zone in _scene_zones(meta.raw, primary_zone)
+                ),
+            )
+            self._conn.executemany(
+                "INSERT INTO images (scene, position, image) VALUES (?, ?, ?)",
+                ((scene_row, position, image) for position, image in enumerate(meta.images) if image),
+            )
+            anchor = f"{chapter.slug}:{meta.id}"
+            self._conn.executemany(
+                "INSERT INTO anchors (anchor, scene, paragraph, start_line, end_line) VALUES (?, ?, ?, ?, ?)",
+                [(anchor, scene_row, None, scene.start_line, scene.end_line)]
+                + [
+                    (f"{anchor}:p{idx}", scene_row, idx, start_line, end_line)
+                    for idx, start_line, end_line in paragraphs
+                ],
+            )
+        return True
+
+    def _prepare(self) -> None:
+        self._conn.execute("PRAGMA foreign_keys = ON")
+        self._conn.execute("PRAGMA journal_mode = WAL")
+        self._conn.execute("PRAGMA synchronous = NORMAL")
+        self._ensure_schema()
+
+    def _ensure_schema(self) -> None:
+        try:
+            row = self._conn.execute("SELECT value FROM meta WHERE key = 'schema'").fetchone()
+        except sqlite3.OperationalError:
+            row = None
+        signature = f"{SCHEMA_VERSION}:{self.config.scene_start}:{self.config.scene_end}"
+        if row is not None and row[0] == signature:
+            return
+        with self._conn:
+            tables = [name for (name,) in self._conn.execute("SELECT name FROM sqlite_master WHERE type = 'table'")]
+            self._conn.execute("PRAGMA foreign_keys = OFF")
+            for name in tables:
+                self._conn.execute(f'DROP TABLE IF EXISTS "{name}"')
+            self._conn.execute("PRAGMA foreign_keys = ON")
+        self._conn.executescript(_SCHEMA)
+        with self._conn:
+            self._conn.execute("INSERT INTO meta (key, value) VALUES ('schema', ?)", (signature,))
+
+    # -- queries -----------------------------------------------------------------------
+
+    def chapters(self, top_level: bool = False) -> List[ChapterRow]:
+        rows = self._conn.execute(
+            "SELECT c.slug, c.folder, c.path, c.title, c.top_level, "
+            "(SELECT count(*) FROM scenes WHERE chapter_id = c.id), c.error FROM chapters c"
+            + (" WHERE c.top_level" if top_level else "")
+            + " ORDER BY c.folder"
+        )
+        return [
+            ChapterRow(slug, folder, Path(path), title, bool(flag), count, error)
+            for slug, folder, path, title, flag, count, error in rows
+        ]
+
+    def scenes(self, chapter: Optional[str] = None, top_level: bool = False) -> List[SceneRow]:
+        """Every indexed scene, or those of the chapter with slug ``chapter``, in reading order."""
+        where, params = _filters(top_level, ("c.slug = ?", chapter))
+        return self._scenes(where, params)
+
+    def scenes_with_character(self, slug: str, top_level: bool = False) -> List[SceneRow]:
+        where, params = _filters(
+            top_level, ("s.id IN (SELECT scene FROM scene_characters WHERE character = ?)", slug)
+        )
+        return self._scenes(where, params)
+
+    def scenes_at_location(self, slug: str, zone: Optional[str] = None, top_level: bool = False) -> List[SceneRow]:
+        where, params = _filters(
+            top_level,
+            ("s.id IN (SELECT scene FROM scene_locations WHERE location = ?)", slug),
+            ("s.id IN (SELECT scene FROM zones WHERE zone = ?)", zone),
+        )
+        return self._scenes(where, params)
+
+    def scenes_with_image(self, image: str) -> List[SceneRow]:
+        return self._scenes(*_filters(False, ("s.id IN (SELECT scene FROM images WHERE image = ?)", image)))
+
+    def chapters_with_character(self, slug: str, frontmatter: bool = True, top_level: bool = False) -> List[str]:
+        """Chapter slugs with a scene featuring ``slug`` or, with ``frontmatter``, listing it in ``key_characters``."""
+        return self._chapters_referencing("character", "scene_characters", "character", slug, frontmatter, top_level)
+
+    def chapters_referencing_location(self, slug: str, frontmatter: bool = True, top_level: bool = False) -> List[str]:
+        """Chapter slugs with a scene set at ``slug`` or, with ``frontmatter``, listing it in ``key_locations``."""
+        return self._chapters_referencing("location", "scene_locations", "location", slug, frontmatter, top_level)
+
+    def location_zones(self, slug: str, top_level: bool = False) -> Dict[str, List[str]]:
+        """Zone slug to the chapters (reading order) whose scenes at ``slug`` use that zone."""
+        rows = self._conn.execute(
+            "SELECT DISTINCT z.zone, c.slug, c.folder FROM zones z"
+            " JOIN scenes s ON s.id = z.scene JOIN chapters c ON c.id = s.chapter_id"
+            " WHERE z.location = ?" + (" AND c.top_level" if top_level else "") + " ORDER BY c.folder, z.zone",
+            (slug,),
+        )
+        zones: Dict[str, List[str]] = {}
+        for zone, chapter, _ in rows:
+            zones.setdefault(zone, []).append(chapter)
+        return zones
+
+    def frontmatter_refs(self, kind: str, top_level: bool = False) -> Dict[str, List[str]]:
+        """Slugs listed in chapter frontmatter (``kind`` is ``character`` or ``location``) to their chapters."""
+        rows = self._conn.execute(
+            "SELECT r.slug, c.slug FROM chapter_refs r JOIN chapters c ON c.id = r.chapter_id"
+            " WHERE r.kind = ?" + (" AND c.top_level" if top_level else "") + " ORDER BY c.folder",
+            (kind,),
+        )
+        refs: Dict[str, List[str]] = {}
+        for slug, chapter in rows:
+            refs.setdefault(slug, []).append(chapter)
+        return refs
+
+    def resolve_anchor(self, anchor: str) -> Optional[AnchorRow]:
+        """Line range of a ``chapter:scene`` or ``chapter:scene:pN`` anchor, as report evidence uses."""
+        row = self._conn.execute(
+            "SELECT a.anchor, c.slug, s.scene_id, a.paragraph, a.start_line, a.end_line, c.path FROM anchors a"
+            " JOIN scenes s ON s.id = a.scene JOIN chapters c ON c.id = s.chapter_id"
+            " WHERE a.anchor = ? ORDER BY c.folder, s.ordinal LIMIT 1",
+            (anchor,),
+        ).fetchone()
+        if row is None:
+            return None
+        return AnchorRow(*row[:6], path=Path(row[6]))
+
+    def _scenes(self, where: str, params: Tuple[Any, ...]) -> List[SceneRow]:
+        rows = self._conn.execute(_SCENE_SELECT + where + _SCENE_ORDER, params)
+        return [
+            SceneRow(
+                chapter=chapter,
+                ordinal=ordinal,
+                scene_id=scene_id,
+                title=title,
+                when=when,
+                location=location,
+                primary_zone=primary_zone,
+                characters=tuple(characters.split(_SEP)) if characters else (),
+                images=tuple(images.split(_SEP)) if images else (),
+                start_line=start_line,
+                end_line=end_line,
+                meta_start_line=meta_start_line,
+                paragraphs=paragraphs,
+                path=Path(path),
+            )
+            for (
+                chapter,
+                ordinal,
+                scene_id,
+                title,
+                when,
+                location,
+                primary_zone,
+                characters,
+                images,
+                start_line,
+                end_line,
+                meta_start_line,
+                paragraphs,
+                path,
+            ) in rows
+        ]
+
+    def _chapters_referencing(
+        self, kind: str, table: str, column: str, slug: str, frontmatter: bool, top_level: bool
+    ) -> List[str]:
+        sources = [f"SELECT s.chapter_id FROM {table} t JOIN scenes s ON s.id = t.scene WHERE t.{column} = ?"]
+        params: List[Any] = [slug]
+        if frontmatter:
+            sources.append("SELECT chapter_id FROM chapter_refs WHERE kind = ? AND slug = ?")
+            params += [kind, slug]
+        rows = self._conn.execute(
+            f"SELECT slug FROM chapters WHERE id IN ({' UNION '.join(sources)})"
+            + (" AND top_level" if top_level else "")
+            + " ORDER BY folder",
+            params,
+        )
+        return [chapter for (chapter,) in rows]
+
+
+def _filters(top_level: bool, *conditions: Tuple[str, Any]) -> Tuple[str, Tuple[Any, ...]]:
+    clauses = ["c.top_level"] if top_level else []
+    params = []
+    for clause, value in conditions:
+        if value is not None:
+            clauses.append(clause)
+            params.append(value)
+    return (" WHERE " + " AND ".join(clauses) if clauses else ""), tuple(params)
+
+
+def _frontmatter_refs(path: Path) -> Iterable[Tuple[str, str]]:
+    try:
+        match = _FRONTMATTER.match(path.read_text(encoding="utf-8"))
+    except (OSError, UnicodeDecodeError):
+        return []
+    if not match:
+        return []
+    try:
+        data = safe_load(match.group(1))
+    except yaml.YAMLError:
+        return []
+    if not isinstance(data, dict):
+        return []
+    refs = []
+    for key, kind in _FRONTMATTER_REFS.items():
+        values = data.get(key)
+        if isinstance(values, list):
+            refs.extend((kind, str(value)) for value in values if value)
+    return refs
+
+
+def _scene_zones(raw: Dict[str, Any], primary_zone: Optional[str]) -> List[str]:
+    zones = [primary_zone] if primary_zone else []
+    listed = raw.get("location_zones")
+    if isinstance(listed, list):
+        zones.extend(str(zone) for zone in listed if zone and str(zone) not in zones)
+    return zones
+
+
+def _optional_str(value: Any) -> Optional[str]:
+    return None if value is None or value == "" else str(value)
@@ -0,0 +1,115 @@
+"""Run-scoped memo of canon snapshots shared by every pipeline stage."""
+from __future__ import annotations
+
+import json
+import os
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+from ..config import StorylintConfig
+from ..store.artifacts import write_json
+from .repo_tools import read_canon_snapshot, select_canon_source
+
+STORE_VERSION = 1
+
+
+@dataclass
+class CanonEntry:
+    folder_mtime_ns: int
+    source: Optional[str]
+    source_mtime_ns: int
+    source_size: int
+    text: str
+
+
+class CanonStore:
+    """Loads each character/location snapshot once and serves it from memory.
+
+    An entry is reused while the slug folder's mtime (files added or removed) and the
+    chosen source file's mtime and size are unchanged, so edits between or during runs
+    are picked up for the cost of two ``stat`` calls. With ``persist_path`` set, the
+    memo is saved to disk and revalidated the same way on the next run.
+    """
+
+    def __init__(self, max_chars: int, persist_path: Optional[Path] = None) -> None:
+        self.max_chars = max_chars
+        self.persist_path = persist_path
+        self.loads = 0
+        self.hits = 0
+        self._entries: Dict[str, CanonEntry] = {}
+        self._dirty = False
+        if persist_path is not None:
+            self._load(persist_path)
+
+    @classmethod
+    def from_config(cls, cfg: StorylintConfig) -> "CanonStore":
+        persist_path = cfg.cache.dir / "canon.json" if cfg.cache.enabled and cfg.cache.persist_canon else None
+        return cls(cfg.canon_snapshot_chars, persist_path)
+
+    def snapshot(self, slug: str, base_dir: Path) -> str:
+        folder = base_dir / slug
+        key = str(folder)
+        try:
+            folder_mtime = folder.stat().st_mtime_ns
+        except (FileNotFoundError, NotADirectoryError):
+            self._entries.pop(key, None)
+            return ""
+
+        entry = self._entries.get(key)
+        if entry is not None and entry.folder_mtime_ns == folder_mtime:
+            if entry.source is None:
+                self.hits += 1
+                return entry.text
+            signature = _file_signature(Path(entry.source))
+            if signature == (entry.source_mtime_ns, entry.source_size):
+                self.hits += 1
+                return entry.text
+
+        self.loads += 1
+        source = select_canon_source(folder)
+        text = read_canon_snapshot(source, self.max_chars) if source else ""
+        mtime_ns, size = _file_signature(source) if source else (0, 0)
+        self._entries[key] = CanonEntry(
+            folder_mtime_ns=folder_mtime,
+            source=str(source) if source else None,
+            source_mtime_ns=mtime_ns,
+            source_size=size,
+            text=text,
+        )
+        self._dirty = True
+        return text
+
+    def save(self) -> None:
+        if self.persist_path is None or not self._dirty:
+            return
+        write_json(
+            self.persist_path,
+            {
+                "version": STORE_VERSION,
+                "max_chars": self.max_chars,
+                "entries": {key: asdict(entry) for key, entry in self._entries.items()},
+            },
+        )
+        self._dirty = False
+
+    def _load(self, path: Path) -> None:
+        try:
+            data = json.loads(path.read_text())
+        except Exception:
+            return
+        if data.get("version") != STORE_VERSION or data.get("max_chars") != self.max_chars:
+            return
+        for key, value in (data.get("entries") or {}).items():
+            try:
+                self._entries[key] = CanonEntry(**value)
+            except TypeError:
+                continue
+
+
+def _file_signature(path: Path) -> Tuple[int, int]:
+    try:
+        stat = os.stat(path)
+    except FileNotFoundError:
+        return (-1, -1)
+    return (stat.st_mtime_ns, stat.st_size)
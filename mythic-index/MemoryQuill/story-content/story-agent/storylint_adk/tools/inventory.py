@@ -0,0 +1,88 @@
+"""In-memory listing of the canon and chapter folders, so validators can check paths without ``stat``."""
+from __future__ import annotations
+
+import os
+from pathlib import Path
+from typing import Dict, FrozenSet, Iterable, List, Optional, Set, Tuple, Union
+
+from ..config import StorylintConfig
+from .repo_scan import SKIP_DIRS, TreeScan, scan_tree
+
+PathLike = Union[str, "os.PathLike[str]"]
+
+
+class RepoInventory:
+    """Names in every directory under a set of roots, keyed by the directory's absolute path.
+
+    ``exists`` and ``has_markdown`` answer from the listing for any path under a scanned
+    root. Paths the listing cannot settle (outside every root, inside skipped directories,
+    dangling symlinks, or through a directory the scan reached by another path first) are
+    checked on disk, so answers always match the filesystem as of the scan.
+    """
+
+    def __init__(self, scans: Iterable[TreeScan]) -> None:
+        self._dirs: Dict[str, Tuple[FrozenSet[str], FrozenSet[str], FrozenSet[str]]] = {}
+        # Every listed file and directory, so a path that exists is one set lookup.
+        self._paths: Set[str] = set()
+        self._markdown: Set[str] = set()
+        self.roots: List[Path] = []
+        for scan in scans:
+            self.roots.append(scan.root)
+            base = os.path.abspath(scan.root)
+            for rel, entry in scan.walk():
+                key = os.path.join(base, *rel.split("/")) if rel else base
+                self._dirs[key] = (frozenset(entry.dirs), frozenset(entry.files), frozenset(entry.dangling))
+                self._paths.add(key)
+                self._paths.update(os.path.join(key, name) for name in entry.files)
+                if any(name.endswith(".md") for name in entry.dirs + entry.files):
+                    self._markdown.add(key)
+
+    @classmethod
+    def from_config(cls, config: StorylintConfig, refresh: bool = False) -> "RepoInventory":
+        """Scan the chapters, characters, locations and images folders once.
+
+        The listings are shared with ``discover_chapters`` through ``cache.dir``, so a
+        folder is listed again only when its mtime changes.
+        """
+        cache_dir = config.cache.dir if config.cache.enabled else None
+        folders = [config.chapters_dir, config.characters_dir, config.locations_dir, config.images_dir]
+        return cls(scan_tree(root, cache_dir=cache_dir, refresh=refresh) for root in _outermost(folders))
+
+    def exists(self, path: PathLike) -> bool:
+        target = os.path.abspath(path)
+        if target in self._paths:
+            return True
+        child, parent = target, os.path.dirname(target)
+        while parent != child:
+            listing = self._dirs.get(parent)
+            if listing is not None:
+                name = os.path.basename(child)
+                if any(name in names for names in listing) or _skipped(name):
+                    break  # a file, link, unlisted or skipped directory on the way: only the disk knows
+                return False
+            child, parent = parent, os.path.dirname(parent)
+        return os.path.exists(target)
+
+    def has_markdown(self, folder: PathLike) -> bool:
+        """Whether ``folder/*.md`` matches anything."""
+        key = os.path.abspath(folder)
+        if key in self._dirs:
+            return key in self._markdown
+        return any(Path(folder).glob("*.md"))
+
+    def __len__(self) -> int:
+        return len(self._dirs)
+
+
+def _outermost(folders: Iterable[Optional[Path]]) -> List[Path]:
+    """Drop duplicates and folders nested in another one; the outer scan already lists them."""
+    unique = sorted({os.path.abspath(folder) for folder in folders if folder is not None})
+    roots: List[str] = []
+    for folder in unique:
+        if not any(folder.startswith(root + os.sep) for root in roots):
+            roots.append(folder)
+    return [Path(root) for root in roots]
+
+
+def _skipped(name: str) -> bool:
+    return name.startswith(".") or name in SKIP_DIRS
@@ -0,0 +1,195 @@
+"""Single-walk snapshot of a story-content tree, reused while its directories are unchanged."""
+from __future__ import annotations
+
+import hashlib
+import json
+import mmap
+import os
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple
+
+# Bump when the snapshot layout changes; older files are then rescanned.
+SNAPSHOT_VERSION = 2
+# A chapter's first scene fence is normally near the top; only longer files are searched past this.
+MARKER_PREFIX_BYTES = 64 * 1024
+# Never descended into, along with every dot-directory (.git, .venv, .storylint-cache), so a
+# chapter kept under one of them is not discovered. Symlinked directories are followed.
+SKIP_DIRS = frozenset({"node_modules", "__pycache__"})
+
+
+@dataclass
+class DirEntry:
+    mtime_ns: int
+    dirs: List[str]
+    files: List[str]
+    # Markdown files in this directory that contain the scan's marker.
+    marked: List[str] = field(default_factory=list)
+    # Symlinks whose target was missing at scan time; listed in neither ``dirs`` nor ``files``.
+    dangling: List[str] = field(default_factory=list)
+
+
+@dataclass
+class TreeScan:
+    """Every directory under ``root`` keyed by its posix path relative to ``root`` (``""`` is the root)."""
+
+    root: Path
+    marker: Optional[str]
+    dirs: Dict[str, DirEntry]
+    rescanned: int = 0
+
+    def walk(self) -> Iterator[Tuple[str, DirEntry]]:
+        """Directories depth-first in name order (``scan_tree`` fills ``dirs`` in that order)."""
+        return iter(self.dirs.items())
+
+    def path(self, rel: str, name: str = "") -> Path:
+        return self.root / _join(rel, name) if rel or name else self.root
+
+    def files_named(self, name: str, under: Optional[str] = None) -> List[Path]:
+        """Files called ``name``; with ``under``, only below a directory of that name."""
+        return [
+            self.path(rel, name)
+            for rel, entry in self.walk()
+            if name in entry.files and (under is None or under in rel.split("/"))
+        ]
+
+    def dirs_named(self, name: str) -> List[Path]:
+        return [self.path(rel, name) for rel, entry in self.walk() if name in entry.dirs]
+
+    def marked_files(self) -> List[Path]:
+        return [self.path(rel, name) for rel, entry in self.walk() for name in entry.marked]
+
+
+def scan_tree(
+    root: Path,
+    marker: Optional[str] = None,
+    cache_dir: Optional[Path] = None,
+    refresh: bool = False,
+) -> TreeScan:
+    """Walk ``root`` once with ``os.scandir``, listing files and subdirectories per directory.
+
+    With ``marker``, each ``*.md`` file is checked for it by reading its first
+    ``MARKER_PREFIX_BYTES`` and mmap-searching the rest only when the prefix misses.
+    With ``cache_dir``, the snapshot is saved there and reused: a directory whose mtime is
+    unchanged keeps its recorded entries, so an unchanged tree costs one ``stat`` per
+    directory. Directory mtimes only move when entries are added, removed or renamed, so an
+    in-place edit that adds the first marker to an existing file is picked up the next time
+    its directory changes, or on ``refresh``, which rescans everything and saves the result.
+
+    Symlinked directories are followed and listed under the link's path. A directory
+    reached a second time (a symlink loop, or two links to one folder) is listed only
+    where the walk first reached it.
+    """
+    snapshot_path = None
+    previous: Dict[str, DirEntry] = {}
+    if cache_dir is not None:
+        try:
+            # Created before the walk so that writing the snapshot never changes a scanned mtime.
+            cache_dir.mkdir(parents=True, exist_ok=True)
+        except OSError:
+            cache_dir = None
+    if cache_dir is not None:
+        snapshot_path = cache_dir / _snapshot_name(root, marker)
+        if not refresh:
+            previous = _load_snapshot(snapshot_path)
+
+    marker_bytes = marker.encode("utf-8") if marker else None
+    scan = TreeScan(root=root, marker=marker, dirs={})
+    base = os.fspath(root)
+    stack = [""]
+    visited = set()
+    while stack:
+        rel = stack.pop()
+        path = os.path.join(base, rel) if rel else base
+        try:
+            stat = os.stat(path)
+        except OSError:
+            continue
+        if (stat.st_dev, stat.st_ino) in visited:
+            continue
+        visited.add((stat.st_dev, stat.st_ino))
+        mtime_ns = stat.st_mtime_ns
+        entry = previous.get(rel)
+        if entry is None or entry.mtime_ns != mtime_ns:
+            entry = _list_dir(path, mtime_ns, marker_bytes)
+            scan.rescanned += 1
+        scan.dirs[rel] = entry
+        stack.extend(_join(rel, name) for name in reversed(entry.dirs))
+
+    if snapshot_path is not None and (scan.rescanned or len(scan.dirs) != len(previous)):
+        _save_snapshot(snapshot_path, scan)
+    return scan
+
+
+def _list_dir(path: str, mtime_ns: int, marker: Optional[bytes]) -> DirEntry:
+    dirs: List[str] = []
+    files: List[str] = []
+    dangling: List[str] = []
+    try:
+        with os.scandir(path) as entries:
+            for item in entries:
+                if item.is_dir():
+                    if not item.name.startswith(".") and item.name not in SKIP_DIRS:
+                        dirs.append(item.name)
+                elif item.is_symlink() and not os.path.exists(item.path):
+                    dangling.append(item.name)
+                else:
+                    files.append(item.name)
+    except OSError:
+        pass
+    dirs.sort()
+    files.sort()
+    dangling.sort()
+    marked = [name for name in files if marker and name.endswith(".md") and _contains(os.path.join(path, name), marker)]
+    return DirEntry(mtime_ns=mtime_ns, dirs=dirs, files=files, marked=marked, dangling=dangling)
+
+
+def _contains(path: str, marker: bytes) -> bool:
+    try:
+        with open(path, "rb") as handle:
+            head = handle.read(MARKER_PREFIX_BYTES)
+            if marker in head:
+                return True
+            if len(head) < MARKER_PREFIX_BYTES:
+                return False
+            with mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as view:
+                return view.find(marker, MARKER_PREFIX_BYTES - len(marker) + 1) != -1
+    except (OSError, ValueError):
+        return False
+
+
+def _join(rel: str, name: str) -> str:
+    return f"{rel}/{name}" if rel else name
+
+
+def _snapshot_name(root: Path, marker: Optional[str]) -> str:
+    digest = hashlib.blake2b(f"{root.absolute()}\0{marker}".encode("utf-8"), digest_size=8).hexdigest()
+    return f"repo-scan-{digest}.json"
+
+
+def _load_snapshot(path: Path) -> Dict[str, DirEntry]:
+    try:
+        data = json.loads(path.read_text())
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(data, dict) or data.get("version") != SNAPSHOT_VERSION:
+        return {}
+    try:
+        return {rel: DirEntry(*fields) for rel, fields in data["dirs"].items()}
+    except (KeyError, TypeError, AttributeError):
+        return {}
+
+
+def _save_snapshot(path: Path, scan: TreeScan) -> None:
+    data = {
+        "version": SNAPSHOT_VERSION,
+        "root": str(scan.root.absolute()),
+        "marker": scan.marker,
+        "dirs": {rel: [entry.mtime_ns, entry.dirs, entry.files, entry.marked, entry.dangling] for rel, entry in scan.dirs.items()},
+    }
+    tmp = path.with_suffix(f".{os.getpid()}.tmp")
+    try:
+        tmp.write_text(json.dumps(data, separators=(",", ":")))
+        tmp.replace(path)
+    except OSError:
+        return
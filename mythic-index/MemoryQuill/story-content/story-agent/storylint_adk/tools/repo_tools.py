@@ -5,12 +5,14 @@ from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
-import yaml
 import re
 
 from ..config import StorylintConfig
 from ..models import Issue
 from ..parser.scene_parser import Chapter
+from ..parser.yaml_cache import load_yaml
+from .inventory import RepoInventory
+from .repo_scan import scan_tree
 
 
 @dataclass
@@ -25,23 +27,34 @@ class RepoMap:
     images_dir_candidates: List[Path]
 
 
-def discover_repo_map(root: Path, scene_marker: str = "SCENE-START") -> RepoMap:
-    chapter_files = _find_chapter_files(root, scene_marker)
+def discover_repo_map(
+    root: Path,
+    scene_marker: str = "SCENE-START",
+    cache_dir: Optional[Path] = None,
+    refresh: bool = False,
+) -> RepoMap:
+    """Locate the chapters, characters and locations folders from one walk of ``root``.
+
+    See ``repo_scan.scan_tree``; with ``cache_dir`` an unchanged tree is answered from the
+    saved snapshot without listing or reading anything.
+    """
+    scan = scan_tree(root, scene_marker, cache_dir, refresh=refresh)
+    chapter_files = scan.marked_files()
     chapter_sample = chapter_files[0] if chapter_files else None
     chapters_dir = _infer_parent_dir(chapter_files, expected_child="content.md")
 
-    character_files = list(root.rglob("characters/**/profile.md"))
+    character_files = scan.files_named("profile.md", under="characters")
     character_sample = character_files[0] if character_files else None
     characters_dir = _infer_parent_dir(character_files, expected_child=None, parent_name="characters")
 
-    location_files = list(root.rglob("locations/**/overview.md"))
+    location_files = scan.files_named("overview.md", under="locations")
     location_sample = location_files[0] if location_files else None
     locations_dir = _infer_parent_dir(location_files, expected_child=None, parent_name="locations")
 
-    imagery_files = list(root.rglob("imagery.yaml")) + list(root.rglob("chapter-imagery.yaml"))
+    imagery_files = scan.files_named("imagery.yaml") + scan.files_named("chapter-imagery.yaml")
     imagery_sample = imagery_files[0] if imagery_files else None
 
-    images_dir_candidates = [path.parent for path in root.rglob("images") if path.is_dir()]
+    images_dir_candidates = [path.parent for path in scan.dirs_named("images")]
 
     return RepoMap(
         chapters_dir=chapters_dir,
@@ -55,18 +68,6 @@ def discover_repo_map(root: Path, scene_marker: str = "SCENE-START") -> RepoMap:
     )
 
 
-def _find_chapter_files(root: Path, scene_marker: str) -> List[Path]:
-    candidates = []
-    for md in root.rglob("*.md"):
-        try:
-            text = md.read_text()
-        except Exception:
-            continue
-        if scene_marker in text:
-            candidates.append(md)
-    return candidates
-
-
 def _infer_parent_dir(files: List[Path], expected_child: Optional[str], parent_name: Optional[str] = None) -> Optional[Path]:
     if not files:
         return None
@@ -88,11 +89,10 @@ def _infer_parent_dir(files: List[Path], expected_child: Optional[str], parent_n
 
 
 def discover_chapters(config: StorylintConfig) -> List[Path]:
-    chapter_files: List[Path] = []
-    if config.chapters_dir.exists():
-        for path in config.chapters_dir.rglob(config.chapter_filename):
-            if path.is_file():
-                chapter_files.append(path)
+    if not config.chapters_dir.exists():
+        return []
+    cache_dir = config.cache.dir if config.cache.enabled else None
+    chapter_files = scan_tree(config.chapters_dir, cache_dir=cache_dir).files_named(config.chapter_filename)
     return sorted(chapter_files, key=lambda p: p.parent.name)
 
 
@@ -100,15 +100,27 @@ def load_canon_snapshot(slug: str, base_dir: Path, max_chars: int) -> str:
     folder = base_dir / slug
     if not folder.exists():
         return ""
-    candidates = sorted(folder.glob("*.md"))
-    if not candidates:
+    source = select_canon_source(folder)
+    if source is None:
         return ""
-    raw = candidates[0].read_text()
-    stripped = _strip_markdown(raw)
+    return read_canon_snapshot(source, max_chars)
+
+
+def select_canon_source(folder: Path) -> Optional[Path]:
+    candidates = sorted(folder.glob("*.md"))
+    return candidates[0] if candidates else None
+
+
+def read_canon_snapshot(source: Path, max_chars: int) -> str:
+    stripped = _strip_markdown(source.read_text())
     return stripped[:max_chars]
 
 
-def validate_slugs(chapter: Chapter, config: StorylintConfig) -> List[Issue]:
+def validate_slugs(chapter: Chapter, config: StorylintConfig, inventory: Optional[RepoInventory] = None) -> List[Issue]:
+    """Report character and location slugs without a canonical folder or markdown in it.
+
+    With ``inventory`` (see ``RepoInventory.from_config``) folders are looked up in memory.
+    """
     findings: List[Issue] = []
     seen = set()
 
@@ -121,7 +133,7 @@ def validate_slugs(chapter: Chapter, config: StorylintConfig) -> List[Issue]:
                 continue
             seen.add(key)
             path = config.characters_dir / slug
-            if not path.exists():
+            if not _exists(path, inventory):
                 findings.append(
                     Issue(
                         type="slug",
@@ -132,7 +144,7 @@ def validate_slugs(chapter: Chapter, config: StorylintConfig) -> List[Issue]:
                         evidence_refs=[slug],
                     )
                 )
-            elif not list(path.glob("*.md")):
+            elif not _has_markdown(path, inventory):
                 findings.append(
                     Issue(
                         type="slug",
@@ -150,7 +162,7 @@ def validate_slugs(chapter: Chapter, config: StorylintConfig) -> List[Issue]:
                 continue
             seen.add(key)
             path = config.locations_dir / slug
-            if not path.exists():
+            if not _exists(path, inventory):
                 findings.append(
                     Issue(
                         type="slug",
@@ -161,7 +173,7 @@ def validate_slugs(chapter: Chapter, config: StorylintConfig) -> List[Issue]:
                         evidence_refs=[slug],
                     )
                 )
-            elif not list(path.glob("*.md")):
+            elif not _has_markdown(path, inventory):
                 findings.append(
                     Issue(
                         type="slug",
@@ -176,14 +188,18 @@ def validate_slugs(chapter: Chapter, config: StorylintConfig) -> List[Issue]:
     return findings
 
 
-def validate_imagery(chapter: Chapter, config: StorylintConfig) -> List[Issue]:
+def validate_imagery(chapter: Chapter, config: StorylintConfig, inventory: Optional[RepoInventory] = None) -> List[Issue]:
+    """Report scene images and ``imagery.yaml`` generated images that are missing on disk.
+
+    With ``inventory`` paths are looked up in memory instead of probed with ``stat``.
+    """
     findings: List[Issue] = []
     for scene in chapter.scenes:
         for image in scene.meta.images:
             if not image:
                 continue
-            resolved = _resolve_image_path(image, chapter, config)
-            if resolved is None or not resolved.exists():
+            resolved = _resolve_image_path(image, chapter, config, inventory)
+            if resolved is None or not _exists(resolved, inventory):
                 findings.append(
                     Issue(
                         type="imagery",
@@ -195,12 +211,12 @@ def validate_imagery(chapter: Chapter, config: StorylintConfig) -> List[Issue]:
                     )
                 )
 
-    imagery_files = _find_imagery_files(chapter.path.parent, config.imagery_filenames)
+    imagery_files = _find_imagery_files(chapter.path.parent, config.imagery_filenames, inventory)
     for imagery_file in imagery_files:
-        data = _load_yaml(imagery_file)
+        data = _load_yaml(imagery_file, config)
         for image_path in _collect_generated_images(data):
-            resolved = (config.project_root / image_path).resolve()
-            if not resolved.exists():
+            resolved = _project_path(image_path, config, inventory)
+            if not _exists(resolved, inventory):
                 findings.append(
                     Issue(
                         type="imagery",
@@ -215,35 +231,60 @@ def validate_imagery(chapter: Chapter, config: StorylintConfig) -> List[Issue]:
     return findings
 
 
-def _find_imagery_files(folder: Path, names: List[str]) -> List[Path]:
+def _find_imagery_files(folder: Path, names: List[str], inventory: Optional[RepoInventory] = None) -> List[Path]:
     files = []
     for name in names:
         candidate = folder / name
-        if candidate.exists():
+        if _exists(candidate, inventory):
             files.append(candidate)
     return files
 
 
-def _resolve_image_path(image: str, chapter: Chapter, config: StorylintConfig) -> Optional[Path]:
+def _resolve_image_path(
+    image: str,
+    chapter: Chapter,
+    config: StorylintConfig,
+    inventory: Optional[RepoInventory] = None,
+) -> Optional[Path]:
     image_path = Path(image)
     if image_path.is_absolute():
         return image_path
     if "/" in image or "\\" in image:
-        return (config.project_root / image_path).resolve()
+        return _project_path(image, config, inventory)
     chapter_dir = chapter.path.parent
     candidates = [chapter_dir / image, chapter_dir / "images" / image]
     if config.images_dir:
         candidates.append(config.images_dir / chapter.slug / image)
         candidates.append(config.images_dir / chapter.slug / "images" / image)
     for candidate in candidates:
-        if candidate.exists():
+        if _exists(candidate, inventory):
             return candidate
     return candidates[0] if candidates else None
 
 
-def _load_yaml(path: Path) -> Dict[str, Any]:
+def _project_path(relative: str, config: StorylintConfig, inventory: Optional[RepoInventory]) -> Path:
+    path = config.project_root / relative
+    # resolve() stats every component; the inventory normalizes paths itself, and only
+    # ".." needs symlinks resolved first.
+    if inventory is None or ".." in path.parts:
+        return path.resolve()
+    return path
+
+
+def _exists(path: Path, inventory: Optional[RepoInventory]) -> bool:
+    return inventory.exists(path) if inventory is not None else path.exists()
+
+
+def _has_markdown(folder: Path, inventory: Optional[RepoInventory]) -> bool:
+    if inventory is not None:
+        return inventory.has_markdown(folder)
+    return bool(list(folder.glob("*.md")))
+
+
+def _load_yaml(path: Path, config: StorylintConfig) -> Dict[str, Any]:
+    cache_dir = config.cache.dir if config.cache.enabled and config.cache.persist_yaml else None
     try:
-        return yaml.safe_load(path.read_text()) or {}
+        return load_yaml(path, cache_dir) or {}
     except Exception:
         return {}
 
@@ -0,0 +1,241 @@
+"""Deterministic synthetic story-content trees for offline benchmarks and scale tests."""
+from __future__ import annotations
+
+import random
+import struct
+import zlib
+from dataclasses import dataclass, replace
+from pathlib import Path
+from typing import List
+
+import yaml
+
+WORDS = (
+    "lantern ash compass ember stone river oath ward shadow thread harbor spire frost "
+    "signal ledger bridge vigil cinder hollow banner whisper forge tide gate relic "
+    "drift quiet bright broken distant careful sudden heavy silver narrow ancient"
+).split()
+
+# Shape of the real manuscript; ``CorpusSpec.scaled`` multiplies the entity counts.
+BASE_CHAPTERS = 45
+BASE_CHARACTERS = 58
+BASE_LOCATIONS = 33
+
+
+@dataclass
+class CorpusSpec:
+    chapters: int = BASE_CHAPTERS
+    scenes_per_chapter: int = 6
+    paragraphs_per_scene: int = 22
+    words_per_paragraph: int = 32
+    characters: int = BASE_CHARACTERS
+    locations: int = BASE_LOCATIONS
+    characters_per_scene: int = 3
+    zones_per_location: int = 3
+    images_per_scene: int = 1
+    images_per_character: int = 2
+    images_per_location: int = 2
+    image_bytes: int = 2048
+    missing_image_rate: float = 0.0
+    seed: int = 0
+
+    @classmethod
+    def scaled(cls, factor: float, **overrides) -> "CorpusSpec":
+        """The real corpus shape with chapter, character and location counts multiplied by ``factor``."""
+        spec = cls(
+            chapters=max(1, round(BASE_CHAPTERS * factor)),
+            characters=max(1, round(BASE_CHARACTERS * factor)),
+            locations=max(1, round(BASE_LOCATIONS * factor)),
+        )
+        return replace(spec, **overrides)
+
+
+@dataclass
+class CorpusStats:
+    root: Path
+    chapters: int = 0
+    scenes: int = 0
+    characters: int = 0
+    locations: int = 0
+    imagery_files: int = 0
+    images: int = 0
+    missing_images: int = 0
+    bytes_written: int = 0
+
+
+def generate_corpus(root: Path, spec: CorpusSpec) -> CorpusStats:
+    """Write chapters/, characters/ and locations/ under ``root``; the same spec gives the same tree.
+
+    Every folder gets the files the tooling looks for: ``content.md`` with SCENE-START/END
+    fences, ``profile.md``/``overview.md``, ``imagery.yaml`` with ``generated_images`` and
+    placeholder PNGs under ``images/``. With ``missing_image_rate`` that fraction of scene
+    image references point at files that are never written, so validators have work to report.
+    """
+    rng = random.Random(spec.seed)
+    stats = CorpusStats(root=root)
+    placeholder = placeholder_png(spec.image_bytes)
+    characters = [_slug(rng, "char", idx) for idx in range(spec.characters)]
+    locations = {_slug(rng, "loc", idx): _zones(rng, spec.zones_per_location) for idx in range(spec.locations)}
+
+    for slug in characters:
+        folder = root / "characters" / slug
+        _write(stats, folder / "profile.md", f"# {_title(slug)}\n\n{_paragraph(rng, 60)}\n")
+        images = _write_images(stats, folder, slug, spec.images_per_character, placeholder)
+        _write_yaml(stats, folder / "imagery.yaml", _character_imagery(slug, images))
+        stats.characters += 1
+
+    for slug, zones in locations.items():
+        folder = root / "locations" / slug
+        _write(stats, folder / "overview.md", f"# {_title(slug)}\n\n{_paragraph(rng, 60)}\n")
+        images = _write_images(stats, folder, slug, spec.images_per_location, placeholder)
+        _write_yaml(stats, folder / "imagery.yaml", _location_imagery(slug, zones, images))
+        stats.locations += 1
+
+    width = max(2, len(str(spec.chapters)))  # keeps chapter folders in reading order when sorted by name
+    for number in range(1, spec.chapters + 1):
+        chapter_slug = f"ch{number:0{width}d}-{rng.choice(WORDS)}-{rng.choice(WORDS)}"
+        folder = root / "chapters" / chapter_slug
+        scenes = []
+        for scene in range(1, spec.scenes_per_chapter + 1):
+            scene_id = f"scn-{number:0{width}d}-{scene:02d}"
+            location = rng.choice(list(locations))
+            images = []
+            for idx in range(1, spec.images_per_scene + 1):
+                name = f"{chapter_slug}-img-{scene:02d}-{idx:02d}.png"
+                if rng.random() < spec.missing_image_rate:
+                    stats.missing_images += 1
+                else:
+                    _write_bytes(stats, folder / "images" / name, placeholder)
+                images.append(name)
+            scenes.append(
+                {
+                    "id": scene_id,
+                    "location": location,
+                    "zones": rng.sample(locations[location], min(2, len(locations[location]))),
+                    "characters": rng.sample(characters, min(spec.characters_per_scene, len(characters))),
+                    "images": images,
+                }
+            )
+        _write(stats, folder / "content.md", _chapter(rng, spec, number, scenes))
+        _write_yaml(stats, folder / "imagery.yaml", _chapter_imagery(chapter_slug, number, scenes))
+        stats.chapters += 1
+        stats.scenes += len(scenes)
+    return stats
+
+
+def placeholder_png(size: int = 0) -> bytes:
+    """A valid 1x1 PNG, padded with a text chunk to roughly ``size`` bytes."""
+    def chunk(kind: bytes, data: bytes) -> bytes:
+        return struct.pack(">I", len(data)) + kind + data + struct.pack(">I", zlib.crc32(kind + data))
+
+    header = chunk(b"IHDR", struct.pack(">IIBBBBB", 1, 1, 8, 0, 0, 0, 0))
+    pixels = chunk(b"IDAT", zlib.compress(b"\x00\x80"))
+    end = chunk(b"IEND", b"")
+    image = b"\x89PNG\r\n\x1a\n" + header + pixels + end
+    padding = size - len(image) - 12 - len(b"Comment\x00")
+    if padding > 0:
+        image = image[: -len(end)] + chunk(b"tEXt", b"Comment\x00" + b"." * padding) + end
+    return image
+
+
+def _chapter(rng: random.Random, spec: CorpusSpec, number: int, scenes: List[dict]) -> str:
+    parts = [f"# Chapter {number}: {_title(rng.choice(WORDS))}\n", _paragraph(rng, spec.words_per_paragraph) + "\n"]
+    for scene in scenes:
+        parts.append(
+            f'<!-- SCENE-START id:{scene["id"]} title:"{_title(rng.choice(WORDS))}"\n'
+            f'        when:"{1200 + number:04d}-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}T{rng.randint(0, 23):02d}:00:00Z"\n'
+            f'        location:"{scene["location"]}"\n'
+            f'        primary_zone:"{scene["zones"][0]}"\n'
+            f"        location_zones:[{_quoted(scene['zones'])}]\n"
+            f"        characters:[{_quoted(scene['characters'])}]\n"
+            f'        tags:["{rng.choice(WORDS)}","{rng.choice(WORDS)}"]\n'
+            f"        images:[{_quoted(scene['images'])}]\n"
+            "-->\n"
+        )
+        for _ in range(spec.paragraphs_per_scene):
+            parts.append(_paragraph(rng, spec.words_per_paragraph) + "\n")
+        parts.append(f'<!-- SCENE-END id:{scene["id"]} -->\n')
+    return "\n".join(parts)
+
+
+def _chapter_imagery(slug: str, number: int, scenes: List[dict]) -> dict:
+    # ``path`` is what storylint's validate_imagery reads, ``file_path`` what rebuild_image_links reads.
+    return {
+        "metadata": {"entity_type": "chapter-imagery", "slug": slug, "chapter_number": number},
+        "scenes": [
+            {
+                "slug": scene["id"],
+                "generated_images": [
+                    {"path": path, "file_path": path}
+                    for path in (f"chapters/{slug}/images/{name}" for name in scene["images"])
+                ],
+            }
+            for scene in scenes
+        ],
+    }
+
+
+def _character_imagery(slug: str, images: List[str]) -> dict:
+    return {
+        "entity_type": "character",
+        "slug": slug,
+        "image_inventory": [{"id": name.rsplit(".", 1)[0], "path": f"images/{name}"} for name in images],
+        "generated_images": [{"path": path, "file_path": path} for path in (f"characters/{slug}/images/{name}" for name in images)],
+    }
+
+
+def _location_imagery(slug: str, zones: List[str], images: List[str]) -> dict:
+    paths = [f"locations/{slug}/images/{name}" for name in images]
+    return {
+        "metadata": {"entity_type": "location-imagery", "slug": slug, "name": _title(slug)},
+        "zones": [
+            {"slug": zone, "generated_images": [{"path": path, "file_path": path} for path in paths[idx :: len(zones)]]}
+            for idx, zone in enumerate(zones)
+        ],
+    }
+
+
+def _write_images(stats: CorpusStats, folder: Path, slug: str, count: int, data: bytes) -> List[str]:
+    names = [f"{slug}-{idx:02d}.png" for idx in range(1, count + 1)]
+    for name in names:
+        _write_bytes(stats, folder / "images" / name, data)
+    return names
+
+
+def _zones(rng: random.Random, count: int) -> List[str]:
+    return [f"{rng.choice(WORDS)}-{rng.choice(WORDS)}-{idx}" for idx in range(1, count + 1)] or ["main"]
+
+
+def _quoted(values: List[str]) -> str:
+    return ",".join(f'"{value}"' for value in values)
+
+
+def _paragraph(rng: random.Random, words: int) -> str:
+    text = " ".join(rng.choice(WORDS) for _ in range(words))
+    return text[0].upper() + text[1:] + "."
+
+
+def _slug(rng: random.Random, prefix: str, idx: int) -> str:
+    return f"{prefix}-{rng.choice(WORDS)}-{idx:03d}"
+
+
+def _title(slug: str) -> str:
+    return " ".join(part.capitalize() for part in slug.split("-") if not part.isdigit())
+
+
+def _write(stats: CorpusStats, path: Path, text: str) -> None:
+    _write_bytes(stats, path, text.encode("utf-8"))
+
+
+def _write_yaml(stats: CorpusStats, path: Path, data: dict) -> None:
+    _write(stats, path, yaml.safe_dump(data, sort_keys=False, width=120))
+    stats.imagery_files += 1
+
+
+def _write_bytes(stats: CorpusStats, path: Path, data: bytes) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(data)
+    stats.bytes_written += len(data)
+    if path.suffix == ".png":
+        stats.images += 1
+
@@ -0,0 +1,51 @@
+import httpx
+
+from storylint.llm import LLMSettings, generate_with_retries
+from storylint_adk.runtime.ratelimit import TokenUsage, configure_rate_limits, get_rate_limiter
+
+
+class _UsageClient:
+    def __init__(self) -> None:
+        self.last_usage = None
+
+    def generate(self, prompt: str) -> str:
+        self.last_usage = TokenUsage(prompt_tokens=10, output_tokens=5, total_tokens=15)
+        return "{}"
+
+
+def test_generate_with_retries_charges_shared_limiter() -> None:
+    configure_rate_limits({"gpt-test": {"tpm": 1000}})
+    try:
+        settings = LLMSettings(provider="mock", model="gpt-test")
+        assert generate_with_retries(_UsageClient(), "x" * 400, settings) == "{}"
+        assert 985 <= get_rate_limiter("gpt-test")._token_bucket.available < 990
+    finally:
+        configure_rate_limits({})
+
+
+class _FlakyClient(_UsageClient):
+    """Succeeds, then fails once without reaching the provider, then succeeds."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.calls = 0
+
+    def generate(self, prompt: str) -> str:
+        self.calls += 1
+        if self.calls == 2:
+            raise httpx.ConnectError("connection refused")
+        return super().generate(prompt)
+
+
+def test_failed_attempt_is_not_reconciled_with_previous_usage() -> None:
+    configure_rate_limits({"gpt-test": {"tpm": 1000}})
+    try:
+        settings = LLMSettings(provider="mock", model="gpt-test", backoff_sec=0.0)
+        client = _FlakyClient()
+        generate_with_retries(client, "x" * 400, settings)
+        generate_with_retries(client, "x" * 400, settings)
+        # Two reconciled calls of 15 tokens, plus the failed attempt's up-front estimate.
+        available = get_rate_limiter("gpt-test")._token_bucket.available
+        assert 870 <= available < 880
+    finally:
+        configure_rate_limits({})
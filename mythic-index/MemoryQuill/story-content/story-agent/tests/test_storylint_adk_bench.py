@@ -0,0 +1,60 @@
+import asyncio
+import random
+from types import SimpleNamespace
+
+import pytest
+
+from storylint_adk.models import ActionPlan, AdjacentReport, ArcReport, ChapterReport
+from storylint_adk.runtime.limits import is_overload_error
+from storylint_adk.runtime.ratelimit import TokenUsage
+from storylint_adk.runtime.simulated import SimulatedBackend, SimulationProfile, sample_payload
+
+
+@pytest.mark.parametrize("model_cls", [ChapterReport, AdjacentReport, ArcReport, ActionPlan])
+def test_sampled_payloads_validate(model_cls) -> None:
+    model_cls.model_validate(sample_payload(model_cls, random.Random(3)))
+
+
+def test_backend_simulates_bursts_and_reports_usage() -> None:
+    now = [0.0]
+    agent = SimpleNamespace(output_schema=ChapterReport)
+    backend = SimulatedBackend(SimulationProfile(median_sec=0, burst_rate=1.0, burst_sec=10, seed=1), clock=lambda: now[0])
+    with pytest.raises(Exception) as excinfo:
+        asyncio.run(backend.run(agent, "prompt"))
+    assert is_overload_error(excinfo.value)
+
+    backend.profile.burst_rate = 0.0
+    now[0] = 11.0
+    usage = TokenUsage()
+    raw = asyncio.run(backend.run(agent, "x" * 400, usage=usage))
+    ChapterReport.model_validate_json(raw)
+    assert (usage.prompt_tokens, backend.overloads) == (100, 1)
+
+
+def test_bench_runs_pipeline_offline(tmp_path) -> None:
+    from storylint_adk.runtime.bench import run_bench
+    from storylint_adk.tools.synthetic import CorpusSpec
+
+    results = run_bench(
+        CorpusSpec(chapters=4, scenes_per_chapter=2, paragraphs_per_scene=2),
+        SimulationProfile(median_sec=0.001, p95_sec=0.002, seed=0),
+        window=3,
+        repeat=2,
+        use_cache=True,
+        workdir=tmp_path,
+    )
+    first, second = results
+    assert first.calls == 4 + 3 + 2 + 1 and first.failed_calls == 0
+    assert second.cache_hits == second.calls
+
+
+def test_bench_reports_only_run_errors(tmp_path, monkeypatch) -> None:
+    from storylint_adk.runtime import bench
+    from storylint_adk.tools.synthetic import CorpusSpec
+
+    async def no_chapters(**kwargs):
+        raise RuntimeError("No chapters found for the requested range.")
+
+    monkeypatch.setattr(bench, "run_pipeline", no_chapters)
+    with pytest.raises(RuntimeError, match="No chapters found"):
+        bench.run_bench(CorpusSpec(chapters=1), SimulationProfile(median_sec=0), workdir=tmp_path)
@@ -0,0 +1,65 @@
+import os
+import time
+from pathlib import Path
+
+from storylint_adk.runtime.cache import ResponseCache, make_cache_key
+
+
+def test_cache_key_changes_with_inputs() -> None:
+    base = make_cache_key("prompt", "gemini-3-flash-preview", "instr", {"type": "object"})
+    assert base == make_cache_key("prompt", "gemini-3-flash-preview", "instr", {"type": "object"})
+    assert base != make_cache_key("prompt!", "gemini-3-flash-preview", "instr", {"type": "object"})
+    assert base != make_cache_key("prompt", "gemini-3-pro-preview", "instr", {"type": "object"})
+    assert base != make_cache_key("prompt", "gemini-3-flash-preview", "other", {"type": "object"})
+    assert base != make_cache_key("prompt", "gemini-3-flash-preview", "instr", {"type": "array"})
+
+
+def test_cache_roundtrip_and_age_eviction(tmp_path: Path) -> None:
+    cache = ResponseCache(tmp_path, max_bytes=0, max_age_days=1)
+    key = make_cache_key("p", "m", "i", None)
+    assert cache.get(key) is None
+    cache.put(key, {"chapter_slug": "ch01"}, model="m")
+    assert cache.get(key) == {"chapter_slug": "ch01"}
+
+    entry = next(tmp_path.glob("*/*.json"))
+    stale = time.time() - 2 * 86400
+    os.utime(entry, (stale, stale))
+    assert cache.get(key) is None
+    assert not entry.exists()
+
+
+def test_cache_prune_drops_least_recently_used(tmp_path: Path) -> None:
+    cache = ResponseCache(tmp_path, max_bytes=1, max_age_days=0)
+    old_key = make_cache_key("old", "m", "i", None)
+    new_key = make_cache_key("new", "m", "i", None)
+    cache.put(old_key, {"value": "old"}, model="m")
+    cache.put(new_key, {"value": "new"}, model="m")
+    old_entry = tmp_path / old_key[:2] / f"{old_key}.json"
+    stale = time.time() - 60
+    os.utime(old_entry, (stale, stale))
+
+    cache.max_bytes = (tmp_path / new_key[:2] / f"{new_key}.json").stat().st_size
+    assert cache.prune() == 1
+    assert cache.get(old_key) is None
+    assert cache.get(new_key) == {"value": "new"}
+
+
+def test_prune_bounds_parsed_chapter_and_yaml_entries(tmp_path: Path) -> None:
+    cache = ResponseCache(tmp_path, max_bytes=0, max_age_days=1)
+    stale = time.time() - 2 * 86400
+    for folder in ("chapters", "yaml"):
+        (tmp_path / folder).mkdir()
+        for name in ("old", "fresh"):
+            entry = tmp_path / folder / f"{name}.bin"
+            entry.write_bytes(b"x" * 10)
+            if name == "old":
+                os.utime(entry, (stale, stale))
+    (tmp_path / "canon.json").write_text("{}")
+    os.utime(tmp_path / "canon.json", (stale, stale))
+
+    assert cache.prune() == 2
+    assert sorted(path.relative_to(tmp_path).as_posix() for path in tmp_path.rglob("*.*")) == [
+        "canon.json",
+        "chapters/fresh.bin",
+        "yaml/fresh.bin",
+    ]
@@ -0,0 +1,56 @@
+import os
+from pathlib import Path
+
+from storylint_adk.tools.canon_store import CanonStore
+from storylint_adk.tools.repo_tools import load_canon_snapshot
+
+
+def _bump_mtime(path: Path) -> None:
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+def test_store_matches_loader_and_memoizes(tmp_path: Path) -> None:
+    folder = tmp_path / "alpha"
+    folder.mkdir()
+    (folder / "profile.md").write_text("# Alpha\n\n**Brave** and [kind](link).")
+    store = CanonStore(max_chars=1200)
+
+    first = store.snapshot("alpha", tmp_path)
+    assert first == load_canon_snapshot("alpha", tmp_path, 1200)
+    assert store.snapshot("alpha", tmp_path) == first
+    assert (store.loads, store.hits) == (1, 1)
+    assert store.snapshot("missing", tmp_path) == ""
+
+
+def test_store_invalidates_on_edit_and_new_file(tmp_path: Path) -> None:
+    folder = tmp_path / "alpha"
+    folder.mkdir()
+    profile = folder / "profile.md"
+    profile.write_text("Old facts.")
+    store = CanonStore(max_chars=1200)
+    assert store.snapshot("alpha", tmp_path) == "Old facts."
+
+    profile.write_text("New facts, longer.")
+    _bump_mtime(profile)
+    assert store.snapshot("alpha", tmp_path) == "New facts, longer."
+
+    (folder / "background.md").write_text("Earlier file.")
+    _bump_mtime(folder)
+    assert store.snapshot("alpha", tmp_path) == "Earlier file."
+
+
+def test_store_persists_between_runs(tmp_path: Path) -> None:
+    canon_dir = tmp_path / "characters"
+    (canon_dir / "alpha").mkdir(parents=True)
+    (canon_dir / "alpha" / "profile.md").write_text("Stable facts.")
+    persist = tmp_path / "cache" / "canon.json"
+
+    store = CanonStore(max_chars=1200, persist_path=persist)
+    store.snapshot("alpha", canon_dir)
+    store.save()
+
+    warm = CanonStore(max_chars=1200, persist_path=persist)
+    assert warm.snapshot("alpha", canon_dir) == "Stable facts."
+    assert (warm.loads, warm.hits) == (0, 1)
+    assert CanonStore(max_chars=10, persist_path=persist).snapshot("alpha", canon_dir) == "Stable fac"
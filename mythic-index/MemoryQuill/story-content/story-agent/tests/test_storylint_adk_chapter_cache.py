@@ -0,0 +1,105 @@
+import os
+from pathlib import Path
+
+from storylint import parser as legacy_parser
+from storylint.config import StoryLintConfig
+from storylint_adk.config import StorylintConfig
+from storylint_adk.parser.chapter_cache import ChapterCache
+from storylint_adk.parser.scene_parser import CHAPTER_TYPES, load_chapter, parse_chapter
+
+CONTENT = """# Chapter 1
+
+<!-- SCENE-START id:scn-01-01 title:"Gate"
+        location:"north-gate"
+        characters:["alpha","beta"]
+-->
+
+First paragraph.
+
+Second paragraph.
+
+<!-- SCENE-END id:scn-01-01 -->
+"""
+
+
+def _chapter(tmp_path: Path, text: str = CONTENT) -> Path:
+    path = tmp_path / "chapters" / "ch01-gate" / "content.md"
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text)
+    return path
+
+
+def _load(cache: ChapterCache, path: Path, cfg: StorylintConfig):
+    return cache.load(path, (cfg.scene_start, cfg.scene_end), lambda source: parse_chapter(source, cfg), CHAPTER_TYPES)
+
+
+def _config(tmp_path: Path, **overrides) -> StorylintConfig:
+    return StorylintConfig(
+        project_root=tmp_path, chapters_dir=Path("chapters"), characters_dir=Path("c"), locations_dir=Path("l"), **overrides
+    )
+
+
+def test_warm_load_skips_parsing(tmp_path) -> None:
+    cfg = _config(tmp_path)
+    path = _chapter(tmp_path)
+    cold = ChapterCache(tmp_path / "cache")
+    assert _load(cold, path, cfg) == parse_chapter(path, cfg)
+
+    warm = ChapterCache(tmp_path / "cache")
+    assert _load(warm, path, cfg) == parse_chapter(path, cfg)
+    assert (cold.stats.misses, warm.stats.hits, warm.stats.misses) == (1, 1, 0)
+
+
+def test_touched_file_is_rehashed_and_edited_file_reparsed(tmp_path) -> None:
+    cfg = _config(tmp_path)
+    path = _chapter(tmp_path)
+    cache = ChapterCache(tmp_path / "cache")
+    _load(cache, path, cfg)
+
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 5_000_000_000))
+    _load(cache, path, cfg)
+    _load(cache, path, cfg)
+    assert (cache.stats.rehashed, cache.stats.hits) == (1, 1)
+
+    _chapter(tmp_path, CONTENT.replace("Second paragraph.", "Second paragraph, revised."))
+    chapter = _load(cache, path, cfg)
+    assert chapter.scenes[0].paragraphs[1].text == "Second paragraph, revised."
+    assert cache.stats.misses == 2
+
+
+def test_markers_and_corrupt_entries_force_a_parse(tmp_path) -> None:
+    cfg = _config(tmp_path)
+    path = _chapter(tmp_path)
+    cache = ChapterCache(tmp_path / "cache")
+    _load(cache, path, cfg)
+    beats = _config(tmp_path, scene_start="<!-- BEAT-START", scene_end="<!-- BEAT-END")
+    assert _load(cache, path, beats).scenes == []
+
+    for entry in (tmp_path / "cache" / "chapters").glob("*.bin"):
+        entry.write_bytes(b"\x00garbage")
+    assert _load(cache, path, cfg) == parse_chapter(path, cfg)
+    assert cache.stats.misses == 3
+
+
+def test_legacy_parser_shares_entries(tmp_path) -> None:
+    cfg = _config(tmp_path)
+    path = _chapter(tmp_path)
+    load_chapter(path, cfg)
+
+    legacy_cfg = StoryLintConfig(project_root=tmp_path, chapters_dir=Path("chapters"), characters_dir=Path("c"), locations_dir=Path("l"))
+    entries = sorted((tmp_path / ".storylint-cache" / "chapters").glob("*.bin"))
+    assert len(entries) == 1
+    assert legacy_parser.load_chapter(path, legacy_cfg) == legacy_parser.parse_chapter(path, legacy_cfg)
+    assert sorted((tmp_path / ".storylint-cache" / "chapters").glob("*.bin")) == entries
+
+
+def test_compact_chapters_are_cached_as_buffer_and_spans(tmp_path) -> None:
+    cfg = _config(tmp_path)
+    path = _chapter(tmp_path, CONTENT.replace("Gate", "Gäte — north"))
+    _load(ChapterCache(tmp_path / "cache"), path, cfg)
+
+    warm = _load(ChapterCache(tmp_path / "cache"), path, cfg)
+    assert warm == parse_chapter(path, cfg)
+    assert warm.scenes[0].source_span[0] is warm.scenes[0].meta.source_span[0]
+    assert warm.scenes[0].paragraph_spans is not None
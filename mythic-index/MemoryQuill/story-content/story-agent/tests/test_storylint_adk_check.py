@@ -0,0 +1,84 @@
+import json
+from pathlib import Path
+
+from typer.testing import CliRunner
+
+from storylint_adk.cli import app
+from storylint_adk.config import StorylintConfig, write_config
+from storylint_adk.runtime.check import EXIT_ERRORS, EXIT_FINDINGS, EXIT_OK, check_json, check_sarif, run_check
+from storylint_adk.tools.repo_tools import discover_chapters
+from storylint_adk.tools.synthetic import CorpusSpec, generate_corpus
+
+SPEC = CorpusSpec(chapters=4, scenes_per_chapter=2, paragraphs_per_scene=1, characters=3, locations=2, missing_image_rate=0.5, seed=3)
+
+
+def _config(root: Path) -> StorylintConfig:
+    return StorylintConfig(
+        project_root=root,
+        chapters_dir=Path("chapters"),
+        characters_dir=Path("characters"),
+        locations_dir=Path("locations"),
+    )
+
+
+def _broken_corpus(root: Path) -> StorylintConfig:
+    generate_corpus(root, SPEC)
+    cfg = _config(root)
+    first = discover_chapters(cfg)[0]
+    first.write_text(first.read_text().replace('characters:["', 'characters:["ghost","', 1))
+    broken = root / "chapters" / "ch00-broken" / "content.md"
+    broken.parent.mkdir()
+    broken.write_text("<!-- SCENE-START id:scn-00-01\n-->\nNo end fence.\n")
+    return cfg
+
+
+def test_findings_errors_and_exit_codes(tmp_path: Path) -> None:
+    cfg = _broken_corpus(tmp_path)
+    result = run_check(cfg, workers=1)
+    counts = result.counts()
+    assert [chapter.path.parent.name[:4] for chapter in result.chapters] == ["ch00", "ch01", "ch02", "ch03", "ch04"]
+    assert "Missing SCENE-END" in result.errors[0].error
+    assert counts["major"] == 1 and counts["moderate"] > 0 and counts["errors"] == 1
+    assert result.exit_code("major") == EXIT_ERRORS
+
+    clean = run_check(cfg, [path for path in discover_chapters(cfg) if "broken" not in str(path)], workers=1)
+    assert clean.exit_code("major") == EXIT_FINDINGS
+    assert clean.exit_code("never") == EXIT_OK
+
+    ghost = next(finding for finding in clean.findings if finding.issue.evidence_refs == ["ghost"])
+    assert ghost.file == discover_chapters(cfg)[1] and ghost.line == 5
+    imagery = [finding for finding in clean.findings if finding.issue.severity == "minor"]
+    assert imagery and all(finding.file.name == "imagery.yaml" for finding in imagery)
+
+
+def test_json_and_sarif_reports(tmp_path: Path) -> None:
+    result = run_check(_broken_corpus(tmp_path), workers=1)
+    data = check_json(result)
+    assert data["summary"] == result.counts()
+    assert data["errors"] == [{"file": "chapters/ch00-broken/content.md", "message": result.errors[0].error}]
+    assert {"file", "line", "severity", "type", "location"} <= set(data["findings"][0])
+
+    sarif = check_sarif(result)
+    run = sarif["runs"][0]
+    assert sarif["version"] == "2.1.0"
+    assert [rule["id"] for rule in run["tool"]["driver"]["rules"]] == ["imagery", "parse", "slug"]
+    slug = next(entry for entry in run["results"] if entry["ruleId"] == "slug")
+    assert slug["level"] == "error"
+    assert slug["locations"][0]["physicalLocation"]["region"] == {"startLine": 5}
+    assert {entry["level"] for entry in run["results"] if entry["ruleId"] == "imagery"} == {"warning", "note"}
+
+
+def test_cli_writes_the_report_and_exits_with_its_code(tmp_path: Path) -> None:
+    cfg = _broken_corpus(tmp_path / "content")
+    config_path = tmp_path / "storylint.yaml"
+    write_config(cfg, config_path)
+    report = tmp_path / "out" / "storylint.sarif"
+
+    outcome = CliRunner().invoke(app, ["check", "--config", str(config_path), "--format", "sarif", "-o", str(report)])
+    assert outcome.exit_code == EXIT_ERRORS
+    assert json.loads(report.read_text())["runs"][0]["results"]
+
+    chapter = str(discover_chapters(cfg)[2])
+    outcome = CliRunner().invoke(app, ["check", chapter, "--config", str(config_path), "--fail-on", "never"])
+    assert outcome.exit_code == EXIT_OK
+    assert outcome.stdout.rstrip().splitlines()[-1].startswith("1 chapter(s)")
@@ -0,0 +1,72 @@
+import pickle
+from pathlib import Path
+
+from storylint_adk.config import StorylintConfig
+from storylint_adk.parser.linewise import parse_chapter_linewise
+from storylint_adk.parser.scene_parser import Paragraph, parse_chapter
+
+CONTENT = """# Chapter 1
+
+<!-- SCENE-START id:scn-01-01 title:"Gate — north"
+        characters:["alpha","beta"]
+-->
+
+Fírst paragraph,
+still first.
+
+Second — paragraph.
+
+<!-- SCENE-END id:scn-01-01 -->
+<!-- SCENE-START id:scn-01-02
+-->
+<!-- SCENE-END id:scn-01-02 -->
+"""
+
+
+def _parse(tmp_path: Path, parser=parse_chapter):
+    path = tmp_path / "ch01-gate" / "content.md"
+    path.parent.mkdir(exist_ok=True)
+    path.write_text(CONTENT)
+    cfg = StorylintConfig(project_root=tmp_path, chapters_dir=tmp_path, characters_dir=tmp_path, locations_dir=tmp_path)
+    return parser(path, cfg)
+
+
+def test_records_share_one_utf8_buffer(tmp_path: Path) -> None:
+    chapter = _parse(tmp_path)
+    first, empty = chapter.scenes
+    buffer = first.source_span[0]
+
+    assert buffer == CONTENT.encode("utf-8")
+    assert first.meta.source_span[0] is buffer and empty.source_span[0] is buffer
+    assert all(paragraph.source_span[0] is buffer for paragraph in first.paragraphs)
+    assert [paragraph.text for paragraph in first.paragraphs] == ["Fírst paragraph,\nstill first.", "Second — paragraph."]
+    assert first.text == "Fírst paragraph,\nstill first.\n\nSecond — paragraph."
+    assert first.meta.raw_text.startswith("<!-- SCENE-START") and first.meta.raw_text.endswith("-->")
+    assert (empty.text, empty.paragraphs) == ("", [])
+    assert not hasattr(first, "__dict__") and not hasattr(first.paragraphs[0], "__dict__")
+
+
+def test_compact_records_compare_and_pickle_like_plain_ones(tmp_path: Path) -> None:
+    chapter = _parse(tmp_path)
+    plain = _parse(tmp_path, parse_chapter_linewise)
+    assert chapter == plain
+    assert pickle.loads(pickle.dumps(chapter)) == chapter
+
+    scene = chapter.scenes[0]
+    assert scene.paragraph_spans is not None and plain.scenes[0].paragraph_spans is None
+    scene.paragraphs = [Paragraph(1, "replaced", 9, 9)]
+    assert scene.paragraphs[0].text == "replaced" and scene != plain.scenes[0]
+    assert "Paragraph(idx=1, text='replaced', start_line=9, end_line=9)" in repr(scene)
+
+
+def test_paragraph_edits_persist_and_counts_read_the_spans(tmp_path: Path) -> None:
+    scene = _parse(tmp_path).scenes[0]
+    plain = _parse(tmp_path, parse_chapter_linewise).scenes[0]
+    assert (scene.paragraph_count, scene.paragraph_lines()) == (2, [(1, 7, 8), (2, 10, 10)])
+    assert scene.paragraph_lines() == plain.paragraph_lines()
+    assert scene.paragraph_spans is not None
+
+    scene.paragraphs.append(Paragraph(3, "Third.", 12, 12))
+    scene.paragraphs[0].idx = 9
+    assert scene.paragraph_spans is None and scene.paragraph_count == 3
+    assert [paragraph.idx for paragraph in scene.paragraphs] == [9, 2, 3]
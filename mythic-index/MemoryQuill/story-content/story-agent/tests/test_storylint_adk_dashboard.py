@@ -0,0 +1,48 @@
+import json
+from pathlib import Path
+
+from storylint_adk.runtime.dashboard import DashboardAggregator
+
+
+def _issue(severity: str, issue_type: str) -> dict:
+    return {"severity": severity, "type": issue_type}
+
+
+def _aggregator(tmp_path: Path, interval: float = 30.0) -> DashboardAggregator:
+    return DashboardAggregator(
+        tmp_path, "r1", "full", 3, totals={"chapter": 2, "adjacent": 1, "arc": 0}, interval_sec=interval
+    )
+
+
+def test_counts_accumulate_and_replacements_do_not_double_count(tmp_path: Path) -> None:
+    dash = _aggregator(tmp_path)
+    dash.add_report("chapter", "chapter:ch01", {"chapter_slug": "ch01", "issues": [_issue("major", "pacing")]})
+    dash.add_report(
+        "chapter",
+        "chapter:ch02",
+        {"chapter_slug": "ch02", "issues": [_issue("minor", "pacing")], "integrity_findings": [_issue("major", "slug")]},
+    )
+    dash.add_report("adjacent", "adjacent:ch01->ch02", {"findings": [_issue("minor", "continuity")]})
+    dash.add_report("chapter", "chapter:ch01", {"chapter_slug": "ch01", "issues": []})
+
+    summary = dash.summary(error_count=0, recent_errors=[])
+    assert summary.counts["chapters_completed"] == 2
+    assert summary.counts["adjacent_completed"] == 1
+    assert summary.issues == {
+        "total": 3,
+        "by_severity": {"minor": 2, "major": 1},
+        "by_type": {"pacing": 1, "slug": 1, "continuity": 1},
+    }
+    assert summary.top_chapters == [{"chapter": "ch02", "issue_count": 2}]
+
+
+def test_live_snapshots_respect_interval(tmp_path: Path) -> None:
+    dash = _aggregator(tmp_path, interval=3600)
+    assert dash.maybe_write(0, [])
+    assert not dash.maybe_write(0, [])
+    dash.add_report("chapter", "chapter:ch01", {"chapter_slug": "ch01", "issues": [_issue("major", "pacing")]})
+    dash.write(1, ["chapter:ch02: boom"])
+    written = json.loads((tmp_path / "final" / "dashboard.json").read_text())
+    assert written["issues"]["total"] == 1
+    assert written["errors"] == ["chapter:ch02: boom"]
+    assert (tmp_path / "final" / "dashboard.md").exists()
@@ -0,0 +1,77 @@
+from pathlib import Path
+from types import SimpleNamespace
+
+from storylint_adk.config import StorylintConfig
+from storylint_adk.models import AdjacentReport, ChapterReport
+from storylint_adk.parser.scene_parser import parse_chapter
+from storylint_adk.runtime.incremental import build_manifest, copy_forward, stage_fingerprint, write_manifest
+
+CHAPTER = """# {title}\n\n<!-- SCENE-START id:scn-{num}-01 title:\"Scene\"\n        location:\"test-hall\"\n        characters:[\"alpha\"]\n-->\n\n{body}\n\n<!-- SCENE-END id:scn-{num}-01 -->\n"""
+MODELS = {"chapter_audit": "flash", "adjacent_flow": "flash", "arc_window": "pro"}
+
+
+def _write_chapter(root: Path, slug: str, body: str) -> Path:
+    chapter_dir = root / "chapters" / slug
+    chapter_dir.mkdir(parents=True, exist_ok=True)
+    path = chapter_dir / "content.md"
+    path.write_text(CHAPTER.format(title=slug, num=slug[2:4], body=body))
+    return path
+
+
+def _manifest(paths: list[Path], cfg: StorylintConfig):
+    chapters = [parse_chapter(path, cfg) for path in paths]
+    pairs = list(zip(chapters[:-1], chapters[1:]))
+    return build_manifest(chapters, pairs, [chapters], cfg, MODELS)
+
+
+def test_copy_forward_only_reuses_unchanged_inputs(tmp_path: Path) -> None:
+    for name in ["characters/alpha", "locations/test-hall"]:
+        (tmp_path / name).mkdir(parents=True)
+        (tmp_path / name / "profile.md").write_text("# Canon\n\nStable facts.")
+    cfg = StorylintConfig(
+        project_root=tmp_path,
+        chapters_dir=tmp_path / "chapters",
+        characters_dir=tmp_path / "characters",
+        locations_dir=tmp_path / "locations",
+        runs_dir=tmp_path / "runs",
+    )
+    paths = [
+        _write_chapter(tmp_path, "ch01-one", "First."),
+        _write_chapter(tmp_path, "ch02-two", "Second."),
+        _write_chapter(tmp_path, "ch03-three", "Third."),
+    ]
+
+    previous_dir = tmp_path / "runs" / "previous"
+    previous = _manifest(paths, cfg)
+    write_manifest(previous_dir, previous)
+    for folder, keys in [("chapter", previous.chapters), ("adjacent", previous.adjacent), ("arc", previous.arc)]:
+        (previous_dir / folder).mkdir(parents=True, exist_ok=True)
+        for key in keys:
+            (previous_dir / folder / f"{key}.report.json").write_text("{}")
+            (previous_dir / folder / f"{key}.report.md").write_text("")
+
+    _write_chapter(tmp_path, "ch03-three", "Third, revised.")
+    current = _manifest(paths, cfg)
+    run_dir = tmp_path / "runs" / "current"
+    result = copy_forward(previous_dir, run_dir, current)
+
+    assert result.chapters == ["ch01-one", "ch02-two"]
+    assert result.adjacent == ["ch01-one_ch02-two"]
+    assert result.arc == []
+    assert (run_dir / "chapter" / "ch01-one.report.md").exists()
+    assert not (run_dir / "chapter" / "ch03-three.report.json").exists()
+
+
+def test_stage_fingerprint_covers_instruction_schema_and_templates(tmp_path: Path) -> None:
+    agent = SimpleNamespace(model="flash", instruction="Audit.", output_schema=ChapterReport)
+    base = stage_fingerprint(agent, "chapter_audit.j2", "chapter_report.md.j2")
+    assert stage_fingerprint(agent, "chapter_audit.j2", "chapter_report.md.j2") == base
+    assert stage_fingerprint(SimpleNamespace(**{**vars(agent), "instruction": "Audit!"}), "chapter_audit.j2", "chapter_report.md.j2") != base
+    assert stage_fingerprint(SimpleNamespace(**{**vars(agent), "output_schema": AdjacentReport}), "chapter_audit.j2", "chapter_report.md.j2") != base
+    assert stage_fingerprint(agent, "chapter_audit.j2") != base
+
+    cfg = StorylintConfig(project_root=tmp_path, chapters_dir=tmp_path / "chapters", characters_dir=tmp_path, locations_dir=tmp_path)
+    chapters = [parse_chapter(_write_chapter(tmp_path, "ch01-one", "First."), cfg)]
+    before = build_manifest(chapters, [], [], cfg, MODELS, stages={"chapter_audit": base})
+    after = build_manifest(chapters, [], [], cfg, MODELS, stages={"chapter_audit": stage_fingerprint(agent, "chapter_audit.j2")})
+    assert before.chapters["ch01-one"] != after.chapters["ch01-one"]
@@ -0,0 +1,97 @@
+import os
+from pathlib import Path
+
+from storylint_adk.config import StorylintConfig
+from storylint_adk.parser.scene_parser import parse_chapter
+from storylint_adk.tools import inventory as inventory_module
+from storylint_adk.tools.inventory import RepoInventory
+from storylint_adk.tools.repo_tools import discover_chapters, validate_imagery, validate_slugs
+from storylint_adk.tools.synthetic import CorpusSpec, generate_corpus
+
+SPEC = CorpusSpec(chapters=5, scenes_per_chapter=2, paragraphs_per_scene=1, characters=4, locations=2, missing_image_rate=0.4, seed=9)
+
+
+def _config(root: Path) -> StorylintConfig:
+    return StorylintConfig(
+        project_root=root,
+        chapters_dir=Path("chapters"),
+        characters_dir=Path("characters"),
+        locations_dir=Path("locations"),
+        images_dir=Path("chapters"),
+    )
+
+
+def test_validators_report_the_same_findings_from_the_inventory(tmp_path: Path) -> None:
+    stats = generate_corpus(tmp_path, SPEC)
+    # Unknown and doc-less slugs, so every validator branch has something to report.
+    (tmp_path / "characters" / "no-docs").mkdir()
+    first = discover_chapters(_config(tmp_path))[0]
+    first.write_text(first.read_text().replace('characters:["', 'characters:["no-docs","ghost","', 1))
+    cfg = _config(tmp_path)
+    inventory = RepoInventory.from_config(cfg)
+    assert inventory.roots == [tmp_path / "chapters", tmp_path / "characters", tmp_path / "locations"]
+
+    for path in discover_chapters(cfg):
+        chapter = parse_chapter(path, cfg)
+        assert validate_slugs(chapter, cfg, inventory) == validate_slugs(chapter, cfg)
+        assert validate_imagery(chapter, cfg, inventory) == validate_imagery(chapter, cfg)
+    assert stats.missing_images
+
+
+def test_lookups_stay_in_memory_under_scanned_roots(tmp_path: Path, monkeypatch) -> None:
+    generate_corpus(tmp_path, SPEC)
+    cfg = _config(tmp_path)
+    chapter_dir = discover_chapters(cfg)[0].parent
+    (tmp_path / "outside.png").write_bytes(b"")
+    (chapter_dir / ".drafts").mkdir()
+    (chapter_dir / ".drafts" / "a.png").write_bytes(b"")
+    (chapter_dir / "linked").symlink_to(tmp_path / "characters")
+    inventory = RepoInventory.from_config(cfg)
+
+    def no_disk(path):
+        raise AssertionError(f"stat on {path}")
+
+    monkeypatch.setattr(inventory_module.os.path, "exists", no_disk)
+    assert inventory.exists(chapter_dir / "content.md")
+    assert inventory.exists(tmp_path / "characters")
+    assert not inventory.exists(chapter_dir / "images" / "missing.png")
+    assert not inventory.exists(chapter_dir / "no-such-dir" / "deeper" / "x.png")
+    assert inventory.exists(chapter_dir / "linked" / sorted(os.listdir(tmp_path / "characters"))[0])
+    assert inventory.has_markdown(tmp_path / "locations" / sorted(os.listdir(tmp_path / "locations"))[0])
+    assert not inventory.has_markdown(chapter_dir / "images")
+
+    monkeypatch.undo()
+    assert inventory.exists(tmp_path / "outside.png")
+    # Skipped directories are not listed, so the disk answers.
+    assert inventory.exists(chapter_dir / ".drafts" / "a.png")
+
+
+def test_inventory_is_rebuilt_only_for_changed_folders(tmp_path: Path) -> None:
+    generate_corpus(tmp_path, SPEC)
+    cfg = _config(tmp_path)
+    before = RepoInventory.from_config(cfg)
+    (tmp_path / "characters" / "newcomer").mkdir()
+    (tmp_path / "characters" / "newcomer" / "profile.md").write_text("# Newcomer\n")
+
+    # An inventory is a snapshot; the next one lists the changed folders again.
+    assert not before.exists(tmp_path / "characters" / "newcomer")
+    after = RepoInventory.from_config(cfg)
+    assert after.exists(tmp_path / "characters" / "newcomer" / "profile.md")
+    assert after.has_markdown(tmp_path / "characters" / "newcomer")
+
+
+def test_dangling_symlinks_are_checked_on_disk(tmp_path: Path) -> None:
+    generate_corpus(tmp_path, SPEC)
+    cfg = _config(tmp_path)
+    chapter_path = discover_chapters(cfg)[0]
+    image = sorted((chapter_path.parent / "images").glob("*.png"))[0]
+    image.unlink()
+    image.symlink_to(tmp_path / "gone.png")
+    inventory = RepoInventory.from_config(cfg)
+
+    assert not inventory.exists(image)
+    chapter = parse_chapter(chapter_path, cfg)
+    assert validate_imagery(chapter, cfg, inventory) == validate_imagery(chapter, cfg)
+    # The listing records the link, not a file, so a target created later is seen.
+    (tmp_path / "gone.png").write_bytes(b"")
+    assert inventory.exists(image)
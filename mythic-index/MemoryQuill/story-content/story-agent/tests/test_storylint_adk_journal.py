@@ -0,0 +1,89 @@
+import asyncio
+import json
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+from storylint_adk.models import ChapterReport
+from storylint_adk.runtime import runner
+from storylint_adk.runtime.journal import RunJournal, RunSpec, load_journal
+from storylint_adk.runtime.scheduler import TaskGraph
+
+
+def _spec() -> RunSpec:
+    return RunSpec(
+        run_id="r1",
+        mode="full",
+        window=3,
+        force=False,
+        chapters=["chapters/ch01/content.md"],
+        models={"chapter_audit": "flash"},
+        synthesis_fan_in=8,
+    )
+
+
+def test_replay_tracks_latest_state_and_survives_torn_line(tmp_path: Path) -> None:
+    journal = RunJournal.for_run(tmp_path)
+    journal.plan(_spec())
+    for key in ["chapter:ch01", "chapter:ch02", "synthesis"]:
+        journal.queued(key, key.split(":")[0])
+    journal.started("chapter:ch01", "chapter")
+    journal.finished("chapter:ch01", "chapter")
+    journal.started("chapter:ch02", "chapter")
+    journal.retry("chapter:ch02", 1, RuntimeError("429"))
+    journal.finished("chapter:ch02", "chapter", ValueError("bad json"))
+    journal.close()
+    with journal.path.open("a") as handle:
+        handle.write('{"ts": 1, "event": "succ')
+
+    state = load_journal(journal.path)
+    assert state.spec == _spec()
+    assert state.succeeded == {"chapter:ch01"}
+    assert state.unfinished == {"chapter:ch02", "synthesis"}
+    assert state.errors["chapter:ch02"] == "ValueError: bad json"
+
+    journal.record("resumed")
+    journal.close()
+    assert load_journal(journal.path).succeeded == {"chapter:ch01"}
+
+
+def test_skip_completed_tasks_and_their_edges() -> None:
+    ran: list[str] = []
+
+    def _task(key: str):
+        async def _run() -> None:
+            ran.append(key)
+
+        return _run
+
+    graph = TaskGraph(limits={})
+    graph.add("chapter:a", "chapter", _task("chapter:a"))
+    graph.add("chapter:b", "chapter", _task("chapter:b"))
+    graph.add("synthesis", "synthesis", _task("synthesis"), deps=["chapter:a", "chapter:b"])
+    graph.skip({"chapter:a"})
+    asyncio.run(graph.run())
+    assert ran == ["chapter:b", "synthesis"]
+
+
+def test_final_failed_attempt_is_not_journaled_as_retry(tmp_path: Path, monkeypatch) -> None:
+    class FailingBackend:
+        async def run(self, agent, prompt, usage=None):
+            raise RuntimeError("boom")
+
+    sleeps: list[float] = []
+
+    async def _sleep(seconds: float) -> None:
+        sleeps.append(seconds)
+
+    monkeypatch.setattr(runner.asyncio, "sleep", _sleep)
+    journal = RunJournal.for_run(tmp_path)
+    ctx = SimpleNamespace(cache=None, limiters={}, telemetry=None, journal=journal, runners=None, backend=FailingBackend())
+    agent = SimpleNamespace(model="flash")
+    with pytest.raises(RuntimeError, match="boom"):
+        asyncio.run(runner._generate_report(agent, "prompt", ChapterReport, retries=2, ctx=ctx, task="chapter:ch01"))
+    journal.close()
+
+    events = [json.loads(line) for line in journal.path.read_text().splitlines()]
+    assert [event["attempt"] for event in events if event["event"] == "retry"] == [1, 2]
+    assert sleeps == [1, 2]
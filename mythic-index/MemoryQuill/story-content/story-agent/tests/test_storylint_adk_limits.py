@@ -0,0 +1,58 @@
+import asyncio
+
+from storylint_adk.runtime.limits import AdaptiveLimiter, is_overload_error
+
+
+class _QuotaError(Exception):
+    code = 429
+
+
+def test_overload_error_detection() -> None:
+    assert is_overload_error(_QuotaError("slow down"))
+    assert is_overload_error(RuntimeError("429 RESOURCE_EXHAUSTED: quota exceeded"))
+    assert is_overload_error(RuntimeError("The model is overloaded. Please try again later."))
+    assert not is_overload_error(ValueError("No JSON object found in model output."))
+
+
+def test_window_grows_additively_and_cuts_multiplicatively() -> None:
+    limiter = AdaptiveLimiter("chapter", initial=4, maximum=16, cooldown_sec=0)
+    for _ in range(4):
+        limiter.record(None)
+    assert limiter.window == 4
+    for _ in range(8):
+        limiter.record(None)
+    assert limiter.window >= 6
+
+    limiter.record(_QuotaError())
+    assert limiter.window == 3
+    limiter.record(ValueError("bad json"))
+    assert limiter.window == 3
+
+
+def test_overload_cuts_respect_cooldown_and_minimum() -> None:
+    limiter = AdaptiveLimiter("arc", initial=8, cooldown_sec=60)
+    limiter.on_overload()
+    limiter.on_overload()
+    assert limiter.window == 4
+
+    floor = AdaptiveLimiter("arc", initial=1, cooldown_sec=0)
+    floor.on_overload()
+    assert floor.window == 1
+
+
+def test_limiter_caps_in_flight_calls() -> None:
+    limiter = AdaptiveLimiter("adjacent", initial=2)
+    peak = 0
+
+    async def _call() -> None:
+        nonlocal peak
+        async with limiter:
+            peak = max(peak, limiter.in_flight)
+            await asyncio.sleep(0.01)
+
+    async def _main() -> None:
+        await asyncio.gather(*[_call() for _ in range(6)])
+
+    asyncio.run(_main())
+    assert peak == 2
+    assert limiter.in_flight == 0
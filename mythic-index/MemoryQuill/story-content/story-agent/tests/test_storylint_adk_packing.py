@@ -0,0 +1,56 @@
+from storylint_adk.runtime.packing import pack_prompt
+from storylint_adk.runtime.prompting import JsonFragment, render_prompt, to_json
+
+
+def _chapter(slug: str, paragraphs: int) -> dict:
+    return {
+        "slug": slug,
+        "title": slug,
+        "path": f"{slug}/content.md",
+        "scenes": [
+            {
+                "id": f"scn-{slug}-{scene}",
+                "title": "Scene",
+                "paragraphs": [
+                    {"idx": idx, "location": f"{slug}:p{idx}", "text": "word " * 80}
+                    for idx in range(1, paragraphs + 1)
+                ],
+            }
+            for scene in (1, 2)
+        ],
+    }
+
+
+def _context() -> dict:
+    return {
+        "schema": {"type": "object"},
+        "chapter": JsonFragment(to_json(_chapter("ch01", 10))),
+        "canon": {"characters": {"alpha": "canon " * 200, "beta": "canon " * 100}, "locations": {}},
+    }
+
+
+def test_within_budget_renders_unchanged() -> None:
+    context = _context()
+    packed = pack_prompt("chapter_audit.j2", context, budget=100_000, chapter_keys=["chapter"])
+    assert packed.prompt == render_prompt("chapter_audit.j2", context)
+    assert not packed.trimmed
+
+
+def test_canon_tail_is_cut_before_paragraphs() -> None:
+    context = _context()
+    full = pack_prompt("chapter_audit.j2", context, budget=None).tokens
+    packed = pack_prompt("chapter_audit.j2", context, budget=full - 100, chapter_keys=["chapter"])
+    assert packed.tokens <= full - 100
+    assert packed.canon_chars_removed > 0
+    assert packed.paragraphs_dropped == {}
+
+
+def test_late_paragraphs_dropped_once_canon_is_gone() -> None:
+    context = _context()
+    full = pack_prompt("chapter_audit.j2", context, budget=None).tokens
+    packed = pack_prompt("chapter_audit.j2", context, budget=full - 1500, chapter_keys=["chapter"])
+    assert packed.tokens <= full - 1500
+    assert not packed.over_budget
+    assert "ch01:scn-ch01-2" in packed.paragraphs_dropped
+    assert "ch01:scn-ch01-1" not in packed.paragraphs_dropped
+    assert packed.summary()["tokens_before"] == full
@@ -0,0 +1,66 @@
+from pathlib import Path
+
+import pytest
+
+from storylint_adk.config import StorylintConfig
+from storylint_adk.parser.linewise import parse_chapter_linewise, parse_scene_meta_linewise
+from storylint_adk.parser.scene_parser import parse_chapter, parse_scene_meta
+from storylint_adk.tools.synthetic import CorpusSpec
+
+STORY_CONTENT = Path(__file__).resolve().parents[2]
+REAL_CHAPTERS = sorted(STORY_CONTENT.glob("chapters/*/content.md"))
+
+EDGE_CASES = {
+    "single-line-meta": '<!-- SCENE-START id:a -->\nswallowed\n-->\nbody\n<!-- SCENE-END id:a -->\n',
+    "no-body": '<!-- SCENE-START id:a\n-->\n<!-- SCENE-END id:a -->\nafter\n',
+    "blank-lines-with-spaces": "<!-- SCENE-START id:a\n-->\n  \n\tone\n two \n \t \nthree\n\n<!-- SCENE-END id:a -->",
+    "nested-and-broken-values": '<!-- SCENE-START id:a tags:["x",["y"]] title:"open bare:v\n[1, 2 -->\nx\n<!-- SCENE-END -->',
+    "keys-without-colons": "<!-- SCENE-START id:a stray word k: v -k:1 9z:2 _z:3\n-->\ntext\n<!-- SCENE-END -->",
+    "form-feed-breaks": "# T\x0c<!-- SCENE-START id:a\x0c-->\x0cone two\x0c\x0cthree\x0c<!-- SCENE-END id:a -->",
+    "start-inside-body": "<!-- SCENE-START id:a\n-->\n<!-- SCENE-START id:b\n<!-- SCENE-END id:a -->\n<!-- SCENE-START id:c\n-->\n<!-- SCENE-END -->",
+    "non-ascii-and-unicode-spaces": '<!-- SCENE-START id:a title:"Café — Ø"\n-->\n\u2003Ænd — “quoted”\u00a0\n\n\u00a0\n日本 語\n<!-- SCENE-END -->',
+    "missing-end": "<!-- SCENE-START id:a\n-->\ntext\n",
+    "missing-close": "text\n<!-- SCENE-START id:a",
+}
+
+
+def _config(root: Path) -> StorylintConfig:
+    return StorylintConfig(project_root=root, chapters_dir=root, characters_dir=root, locations_dir=root)
+
+
+def _parse_both(path: Path, cfg: StorylintConfig):
+    results = []
+    for parser in (parse_chapter_linewise, parse_chapter):
+        try:
+            results.append(parser(path, cfg))
+        except ValueError as exc:
+            results.append(str(exc))
+    return results
+
+
+@pytest.mark.skipif(not REAL_CHAPTERS, reason="manuscript chapters are not part of this checkout")
+@pytest.mark.parametrize("path", REAL_CHAPTERS, ids=lambda path: path.parent.name)
+def test_matches_line_parser_on_real_chapter(path: Path) -> None:
+    reference, parsed = _parse_both(path, _config(STORY_CONTENT))
+    assert parsed == reference
+
+
+@pytest.mark.parametrize("name", sorted(EDGE_CASES))
+def test_matches_line_parser_on_edge_case(tmp_path: Path, name: str) -> None:
+    path = tmp_path / "ch00-edge" / "content.md"
+    path.parent.mkdir()
+    path.write_text(EDGE_CASES[name])
+    reference, parsed = _parse_both(path, _config(tmp_path))
+    assert parsed == reference
+
+
+def test_matches_line_parser_on_synthetic_corpus(synthetic_corpus) -> None:
+    root = synthetic_corpus(CorpusSpec(chapters=30, characters=20, locations=10, seed=11)).root
+    for path in sorted(root.glob("chapters/*/content.md")):
+        reference, parsed = _parse_both(path, _config(root))
+        assert parsed == reference
+
+
+def test_long_metadata_matches() -> None:
+    meta = "<!-- SCENE-START id:x\n" + "".join(f' k{i}:"v {i}" l{i}:[{i},"{i}"]\n' for i in range(500)) + "-->"
+    assert parse_scene_meta(meta) == parse_scene_meta_linewise(meta)
@@ -0,0 +1,53 @@
+from pathlib import Path
+
+from storylint_adk.config import StorylintConfig
+from storylint_adk.parser.scene_parser import parse_chapter
+from storylint_adk.runtime.payloads import PayloadCache, chapter_payload, chapter_summary_payload
+from storylint_adk.runtime.prompting import render_prompt
+
+CHAPTER = """# Title\n\n<!-- SCENE-START id:scn-01-01 title:\"Scene \\u00e9\"\n        location:\"test-hall\"\n        characters:[\"alpha\"]\n-->\n\nCaf\u00e9 \"quoted\" text.\n\nSecond paragraph.\n\n<!-- SCENE-END id:scn-01-01 -->\n"""
+
+
+def _chapter(tmp_path: Path, slug: str):
+    path = tmp_path / slug / "content.md"
+    path.parent.mkdir(parents=True)
+    path.write_text(CHAPTER)
+    cfg = StorylintConfig(
+        project_root=tmp_path,
+        chapters_dir=tmp_path,
+        characters_dir=tmp_path / "characters",
+        locations_dir=tmp_path / "locations",
+        runs_dir=tmp_path / "runs",
+    )
+    return parse_chapter(path, cfg), cfg
+
+
+def test_cached_fragments_render_identical_prompts(tmp_path: Path) -> None:
+    left, cfg = _chapter(tmp_path, "ch01-one")
+    right, _ = _chapter(tmp_path, "ch02-two")
+    cache = PayloadCache(cfg)
+
+    plain = render_prompt(
+        "adjacent_flow.j2",
+        {"schema": {}, "left": chapter_payload(left, cfg), "right": chapter_payload(right, cfg), "canon": {}},
+    )
+    cached = render_prompt(
+        "adjacent_flow.j2",
+        {"schema": {}, "left": cache.chapter_json(left), "right": cache.chapter_json(right), "canon": {}},
+    )
+    assert cached == plain
+
+    summaries = [chapter_summary_payload(chapter, cfg) for chapter in (left, right)]
+    fragments = [cache.summary_json(chapter) for chapter in (left, right)]
+    context = {"schema": {}, "canon": {}}
+    assert render_prompt("arc_window.j2", {**context, "window": fragments}) == render_prompt(
+        "arc_window.j2", {**context, "window": summaries}
+    )
+
+
+def test_payloads_are_built_once(tmp_path: Path) -> None:
+    chapter, cfg = _chapter(tmp_path, "ch01-one")
+    cache = PayloadCache(cfg)
+    assert cache.chapter(chapter) is cache.chapter(chapter)
+    assert cache.chapter_json(chapter) is cache.chapter_json(chapter)
+    assert cache.summary_json(chapter) is cache.summary_json(chapter)
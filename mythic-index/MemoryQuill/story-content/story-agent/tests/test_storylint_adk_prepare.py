@@ -0,0 +1,97 @@
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import pytest
+
+from storylint_adk.config import StorylintConfig
+from storylint_adk.runtime import prepare
+from storylint_adk.runtime.prepare import integrity_index, prepare_chapters, resolve_workers
+from storylint_adk.tools.inventory import RepoInventory
+from storylint_adk.tools.synthetic import CorpusSpec
+
+SPEC = CorpusSpec(chapters=24, scenes_per_chapter=2, paragraphs_per_scene=2, characters=5, locations=3, missing_image_rate=0.3, seed=4)
+
+
+def _config(root: Path, workers: int = 0) -> StorylintConfig:
+    cfg = StorylintConfig(
+        project_root=root,
+        chapters_dir=Path("chapters"),
+        characters_dir=Path("characters"),
+        locations_dir=Path("locations"),
+    )
+    cfg.cache.persist_chapters = False
+    cfg.concurrency.parse_workers = workers
+    return cfg
+
+
+def _paths(root: Path) -> list[Path]:
+    return sorted(root.glob("chapters/*/content.md"))
+
+
+def test_pool_matches_serial_in_order(synthetic_corpus, monkeypatch) -> None:
+    stats = synthetic_corpus(SPEC)
+    root = stats.root
+    monkeypatch.setattr(prepare, "MIN_CHAPTERS_PER_WORKER", 2)
+    # Reversed input shows results follow the caller's order, not discovery order.
+    paths = _paths(root)[::-1]
+    serial = prepare_chapters(paths, _config(root), workers=1)
+    parallel = prepare_chapters(paths, _config(root), workers=3)
+
+    assert [item.chapter.path for item in parallel] == paths
+    assert [item.chapter for item in parallel] == [item.chapter for item in serial]
+    assert [item.findings for item in parallel] == [item.findings for item in serial]
+    # Each missing scene image is reported from the scene metadata and from imagery.yaml.
+    assert stats.missing_images
+    assert sum(len(findings) for findings in integrity_index(parallel).values()) == 2 * stats.missing_images
+
+
+def test_worker_count_is_capped_by_corpus_size(tmp_path: Path, monkeypatch) -> None:
+    monkeypatch.setattr(prepare, "_available_cpus", lambda: 16)
+    assert resolve_workers(_config(tmp_path), chapters=45) == 5
+    assert resolve_workers(_config(tmp_path), chapters=5) == 1
+    assert resolve_workers(_config(tmp_path, workers=2), chapters=400) == 2
+    assert resolve_workers(_config(tmp_path, workers=1), chapters=400) == 1
+
+
+def test_falls_back_to_serial_without_a_pool(synthetic_corpus, monkeypatch) -> None:
+    root = synthetic_corpus(SPEC).root
+
+    def no_pool(*args, **kwargs):
+        raise OSError("no semaphores")
+
+    monkeypatch.setattr(prepare, "ProcessPoolExecutor", no_pool)
+    monkeypatch.setattr(prepare, "MIN_CHAPTERS_PER_WORKER", 2)
+    prepared = prepare_chapters(_paths(root), _config(root), workers=4)
+    assert [item.chapter.path for item in prepared] == _paths(root)
+
+
+def test_parse_errors_surface_from_workers(tmp_path: Path, monkeypatch) -> None:
+    for number in range(4):
+        path = tmp_path / "chapters" / f"ch{number:02d}" / "content.md"
+        path.parent.mkdir(parents=True)
+        path.write_text("<!-- SCENE-START id:scn-01\n-->\ntext\n" + ("<!-- SCENE-END id:scn-01 -->\n" if number else ""))
+    monkeypatch.setattr(prepare, "MIN_CHAPTERS_PER_WORKER", 1)
+    with pytest.raises(ValueError, match="Missing SCENE-END"):
+        prepare_chapters(_paths(tmp_path), _config(tmp_path), workers=2)
+
+
+def test_workers_get_the_config_and_inventory_once(synthetic_corpus, monkeypatch) -> None:
+    root = synthetic_corpus(SPEC).root
+    pools, mapped = [], []
+
+    class RecordingPool(ProcessPoolExecutor):
+        def __init__(self, *args, **kwargs):
+            pools.append(kwargs)
+            super().__init__(*args, **kwargs)
+
+        def map(self, fn, *iterables, **kwargs):
+            mapped.extend(item for iterable in iterables for item in iterable)
+            return super().map(fn, *iterables, **kwargs)
+
+    monkeypatch.setattr(prepare, "ProcessPoolExecutor", RecordingPool)
+    monkeypatch.setattr(prepare, "MIN_CHAPTERS_PER_WORKER", 2)
+    prepared = prepare_chapters(_paths(root), _config(root), workers=2)
+
+    assert [item.chapter.path for item in prepared] == _paths(root)
+    assert [type(arg) for arg in pools[0]["initargs"]] == [StorylintConfig, RepoInventory]
+    assert not any(isinstance(item, (StorylintConfig, RepoInventory)) for item in mapped)
@@ -0,0 +1,54 @@
+from storylint_adk.runtime.ratelimit import (
+    ModelRateLimiter,
+    TokenBucket,
+    configure_rate_limits,
+    estimate_tokens,
+    get_rate_limiter,
+)
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_bucket_reservations_queue_and_refill() -> None:
+    clock = _Clock()
+    bucket = TokenBucket(60, clock)
+    assert bucket.reserve(60) == 0.0
+    assert bucket.reserve(1) == 1.0
+    assert bucket.reserve(1) == 2.0
+    clock.now = 10.0
+    assert bucket.available == 8.0
+
+
+def test_rpm_and_tpm_with_reconcile() -> None:
+    clock = _Clock()
+    limiter = ModelRateLimiter("flash", rpm=2, tpm=1000, clock=clock)
+    assert limiter.reserve(400) == 0.0
+    assert limiter.reserve(400) == 0.0
+    assert limiter.reserve(100) == 30.0
+
+    limiter = ModelRateLimiter("flash", rpm=None, tpm=1000, clock=clock)
+    assert limiter.reserve(900) == 0.0
+    limiter.reconcile(900, 300)
+    assert limiter.reserve(600) == 0.0
+
+
+def test_registry_shares_limiter_per_model() -> None:
+    configure_rate_limits({"default": {"rpm": 10}, "pro": {"rpm": 5, "tpm": 1000}})
+    try:
+        assert get_rate_limiter("pro") is get_rate_limiter("pro")
+        assert get_rate_limiter("pro").tpm == 1000
+        assert get_rate_limiter("flash").rpm == 10
+    finally:
+        configure_rate_limits({})
+    assert get_rate_limiter("flash") is None
+
+
+def test_estimate_tokens() -> None:
+    assert estimate_tokens("") == 1
+    assert estimate_tokens("x" * 400) == 100
@@ -0,0 +1,108 @@
+from pathlib import Path
+
+from typer.testing import CliRunner
+
+from storylint_adk.cli import app
+from storylint_adk.config import CacheConfig, StorylintConfig, load_config
+from storylint_adk.tools import repo_scan
+from storylint_adk.tools.repo_scan import scan_tree
+from storylint_adk.tools.repo_tools import discover_chapters, discover_repo_map
+from storylint_adk.tools.synthetic import CorpusSpec, generate_corpus
+
+SPEC = CorpusSpec(chapters=6, scenes_per_chapter=2, paragraphs_per_scene=2, characters=4, locations=3, seed=2)
+
+
+def test_snapshot_is_reused_until_a_directory_changes(tmp_path: Path) -> None:
+    stats = generate_corpus(tmp_path / "content", SPEC)
+    cache = tmp_path / "cache"
+    first = discover_repo_map(stats.root, cache_dir=cache)
+    assert first.chapters_dir == stats.root / "chapters"
+    assert first.characters_dir == stats.root / "characters"
+    assert first.locations_dir == stats.root / "locations"
+    assert first == discover_repo_map(stats.root)
+
+    warm = scan_tree(stats.root, "SCENE-START", cache)
+    assert warm.rescanned == 0
+    assert len(warm.marked_files()) == stats.chapters
+
+    folder = stats.root / "chapters" / "ch99-new"
+    folder.mkdir()
+    (folder / "content.md").write_text("<!-- SCENE-START id:scn-99-01 -->\n")
+    changed = scan_tree(stats.root, "SCENE-START", cache)
+    # The new folder and the chapters folder whose listing it changed.
+    assert changed.rescanned == 2
+    assert folder / "content.md" in changed.marked_files()
+    assert scan_tree(stats.root, "SCENE-START", cache, refresh=True).rescanned == len(changed.dirs)
+
+
+def test_marker_past_the_prefix_and_skipped_directories(tmp_path: Path, monkeypatch) -> None:
+    monkeypatch.setattr(repo_scan, "MARKER_PREFIX_BYTES", 64)
+    (tmp_path / "late.md").write_text("x" * 500 + "\n<!-- SCENE-START id:a -->\n")
+    (tmp_path / "none.md").write_text("y" * 500)
+    (tmp_path / "notes.txt").write_text("<!-- SCENE-START id:b -->")
+    for hidden in (".git", "node_modules"):
+        (tmp_path / hidden / "images").mkdir(parents=True)
+        (tmp_path / hidden / "content.md").write_text("<!-- SCENE-START id:c -->")
+
+    scan = scan_tree(tmp_path, "SCENE-START")
+    assert scan.marked_files() == [tmp_path / "late.md"]
+    assert scan.dirs_named("images") == []
+
+
+def test_discover_chapters_follows_added_and_removed_folders(tmp_path: Path) -> None:
+    stats = generate_corpus(tmp_path, SPEC)
+    cfg = StorylintConfig(
+        project_root=tmp_path,
+        chapters_dir=Path("chapters"),
+        characters_dir=Path("characters"),
+        locations_dir=Path("locations"),
+        cache=CacheConfig(dir=Path(".storylint-cache")),
+    )
+    paths = discover_chapters(cfg)
+    assert len(paths) == stats.chapters
+    assert list((tmp_path / ".storylint-cache").glob("repo-scan-*.json"))
+
+    paths[0].unlink()
+    drafted = tmp_path / "chapters" / "drafts" / "ch00-draft" / "content.md"
+    drafted.parent.mkdir(parents=True)
+    drafted.write_text("# Draft\n")
+    assert discover_chapters(cfg) == sorted(paths[1:] + [drafted], key=lambda p: p.parent.name)
+
+    # A damaged snapshot is ignored rather than trusted.
+    for snapshot in (tmp_path / ".storylint-cache").glob("repo-scan-*.json"):
+        snapshot.write_text("{not json")
+    assert len(discover_chapters(cfg)) == stats.chapters
+
+
+def test_symlinked_folders_are_followed_once_and_dot_dirs_skipped(tmp_path: Path) -> None:
+    stats = generate_corpus(tmp_path, SPEC)
+    cfg = StorylintConfig(
+        project_root=tmp_path,
+        chapters_dir=Path("chapters"),
+        characters_dir=Path("characters"),
+        locations_dir=Path("locations"),
+    )
+    outside = tmp_path / "shared" / "ch50-linked"
+    outside.mkdir(parents=True)
+    (outside / "content.md").write_text("# Linked\n")
+    (tmp_path / "chapters" / "ch50-linked").symlink_to(outside)
+    (tmp_path / "chapters" / "loop").symlink_to(tmp_path / "chapters")
+    (tmp_path / "chapters" / ".drafts" / "ch60-draft").mkdir(parents=True)
+    (tmp_path / "chapters" / ".drafts" / "ch60-draft" / "content.md").write_text("# Draft\n")
+
+    paths = discover_chapters(cfg)
+    assert len(paths) == stats.chapters + 1
+    assert tmp_path / "chapters" / "ch50-linked" / "content.md" in paths
+    assert not any("loop" in path.parts or ".drafts" in path.parts for path in paths)
+
+
+def test_init_saves_its_scan_in_the_written_configs_cache(tmp_path: Path) -> None:
+    generate_corpus(tmp_path / "content", SPEC)
+    output = tmp_path / "config" / "storylint.yaml"
+    output.parent.mkdir()
+    for _ in range(2):
+        outcome = CliRunner().invoke(app, ["init", "--root", str(tmp_path / "content"), "--output", str(output)])
+        assert outcome.exit_code == 0, outcome.output
+    assert load_config(output).cache.dir == tmp_path / "config" / ".storylint-cache"
+    assert list((tmp_path / "config" / ".storylint-cache").glob("repo-scan-*.json"))
+    assert not list((tmp_path / "content").rglob("repo-scan-*.json"))
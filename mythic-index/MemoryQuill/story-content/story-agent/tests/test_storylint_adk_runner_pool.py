@@ -0,0 +1,17 @@
+import pytest
+
+pytest.importorskip("google.adk")
+
+from storylint_adk.agents.arc_analyst import build_arc_agent  # noqa: E402
+from storylint_adk.agents.chapter_auditor import build_chapter_audit_agent  # noqa: E402
+from storylint_adk.runtime.adk_client import AgentRunnerPool  # noqa: E402
+
+
+def test_pool_reuses_agent_and_runner_per_builder_and_model() -> None:
+    pool = AgentRunnerPool()
+    first = pool.agent(build_chapter_audit_agent, "gemini-3-flash-preview")
+    assert pool.agent(build_chapter_audit_agent, "gemini-3-flash-preview") is first
+    assert pool.agent(build_chapter_audit_agent, "gemini-3-pro-preview") is not first
+    assert pool.agent(build_arc_agent, "gemini-3-flash-preview") is not first
+    assert pool.runner_for(first).agent is first
+    assert pool.runner_for(build_chapter_audit_agent("gemini-3-flash-preview")) is None
@@ -0,0 +1,117 @@
+import importlib.util
+import os
+import sys
+from pathlib import Path
+
+from storylint_adk.config import StorylintConfig
+from storylint_adk.store.scene_index import SceneIndex
+from storylint_adk.tools.synthetic import CorpusSpec
+
+SMALL = CorpusSpec(chapters=8, scenes_per_chapter=3, paragraphs_per_scene=3, characters=6, locations=3, seed=11)
+MIGRATE_ZONES = Path(__file__).resolve().parents[4] / "tools" / "migrate_zones.py"
+
+CHAPTER = """---
+title: "Gate"
+key_characters:
+  - alpha
+  - gamma
+key_locations:
+  - harbor
+---
+
+# Chapter 1
+
+<!-- SCENE-START id:scn-01-01 title:"Gate"
+        location:"north-gate"
+        primary_zone:"arch"
+        location_zones:["arch","tower"]
+        characters:["alpha","beta"]
+        images:["gate.png"]
+-->
+
+First paragraph.
+
+Second paragraph.
+
+<!-- SCENE-END id:scn-01-01 -->
+"""
+
+
+def _config(root: Path) -> StorylintConfig:
+    return StorylintConfig(project_root=root, chapters_dir=Path("chapters"), characters_dir=Path("c"), locations_dir=Path("l"))
+
+
+def _write(root: Path, folder: str, text: str = CHAPTER) -> Path:
+    path = root / "chapters" / folder / "content.md"
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text)
+    return path
+
+
+def test_queries_cover_scenes_zones_frontmatter_and_anchors(tmp_path: Path) -> None:
+    _write(tmp_path, "ch01-gate")
+    _write(tmp_path, "drafts/ch99-draft", CHAPTER.replace("alpha", "delta"))
+    with SceneIndex.for_story_content(tmp_path) as index:
+        (scene,) = index.scenes_with_character("alpha")
+        assert (scene.anchor, scene.title, scene.location, scene.primary_zone) == ("ch01-gate:scn-01-01", "Gate", "north-gate", "arch")
+        assert (scene.characters, scene.images, scene.paragraphs) == (("alpha", "beta"), ("gate.png",), 2)
+
+        assert [s.chapter for s in index.scenes_at_location("north-gate")] == ["ch01-gate", "ch99-draft"]
+        assert [s.chapter for s in index.scenes_at_location("north-gate", top_level=True)] == ["ch01-gate"]
+        assert index.scenes_at_location("north-gate", zone="tower", top_level=True)[0].scene_id == "scn-01-01"
+        assert index.location_zones("north-gate", top_level=True) == {"arch": ["ch01-gate"], "tower": ["ch01-gate"]}
+        assert index.scenes_with_image("gate.png")[0].chapter == "ch01-gate"
+
+        assert index.chapters_referencing_location("harbor") == ["ch01-gate", "ch99-draft"]
+        assert index.chapters_referencing_location("harbor", frontmatter=False) == []
+        assert index.chapters_with_character("gamma", top_level=True) == ["ch01-gate"]
+        assert index.frontmatter_refs("character", top_level=True) == {"alpha": ["ch01-gate"], "gamma": ["ch01-gate"]}
+
+        anchor = index.resolve_anchor("ch01-gate:scn-01-01:p2")
+        first_line = CHAPTER.splitlines().index("Second paragraph.") + 1
+        assert (anchor.paragraph, anchor.start_line, anchor.end_line) == (2, first_line, first_line)
+        assert index.resolve_anchor("ch01-gate:scn-01-01:p9") is None
+
+
+def test_refresh_reparses_only_changed_chapters(tmp_path: Path) -> None:
+    first = _write(tmp_path, "ch01-gate")
+    _write(tmp_path, "ch02-road", CHAPTER.replace("scn-01-01", "scn-02-01"))
+    index = SceneIndex.from_config(_config(tmp_path))
+    stats = index.refresh()
+    assert (stats.chapters, stats.indexed, stats.unchanged) == (2, 2, 0)
+
+    first.write_text(CHAPTER.replace('"beta"', '"beta","omega"'))
+    os.utime(first, ns=(first.stat().st_atime_ns, first.stat().st_mtime_ns + 5_000_000_000))
+    (tmp_path / "chapters" / "ch02-road" / "content.md").unlink()
+    _write(tmp_path, "ch03-broken", "<!-- SCENE-START id:x\n-->\nno end\n")
+    stats = index.refresh()
+    assert (stats.indexed, stats.unchanged, stats.removed, stats.errors) == (2, 0, 1, 1)
+    assert [s.chapter for s in index.scenes_with_character("omega")] == ["ch01-gate"]
+    assert [row.slug for row in index.chapters()] == ["ch01-gate", "ch03-broken"]
+    assert "Missing SCENE-END" in index.chapters()[1].error
+    assert index.scenes(chapter="ch02-road") == []
+    index.close()
+
+    # A damaged index file is rebuilt instead of failing the tool that opened it.
+    index.db_path.write_bytes(b"not a database" * 100)
+    for suffix in ("-wal", "-shm"):
+        Path(f"{index.db_path}{suffix}").unlink(missing_ok=True)
+    with SceneIndex.from_config(_config(tmp_path)) as reopened:
+        assert reopened.refresh().indexed == 2
+
+
+def test_migrate_zones_answers_from_the_index_like_the_scan(synthetic_corpus, monkeypatch) -> None:
+    stats = synthetic_corpus(SMALL)
+    monkeypatch.syspath_prepend(str(MIGRATE_ZONES.parent))
+    spec = importlib.util.spec_from_file_location("migrate_zones", MIGRATE_ZONES)
+    migrate_zones = importlib.util.module_from_spec(spec)
+    monkeypatch.setitem(sys.modules, "migrate_zones", migrate_zones)
+    spec.loader.exec_module(migrate_zones)
+    monkeypatch.setattr(migrate_zones, "STORY_CONTENT_DIR", stats.root)
+    monkeypatch.setattr(migrate_zones, "CHAPTERS_DIR", stats.root / "chapters")
+
+    index = migrate_zones.open_scene_index(stats.root)
+    for location in sorted(path.name for path in (stats.root / "locations").iterdir()):
+        scanned = migrate_zones.find_location_chapter_data(location)
+        assert scanned[1], location
+        assert migrate_zones.find_location_chapter_data(location, index) == scanned
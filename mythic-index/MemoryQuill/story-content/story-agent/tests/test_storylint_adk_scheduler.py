@@ -0,0 +1,66 @@
+import asyncio
+
+import pytest
+
+from storylint_adk.runtime.scheduler import TaskGraph
+
+
+def test_dependents_start_without_waiting_for_whole_stage() -> None:
+    order: list[str] = []
+
+    def _task(key: str, delay: float):
+        async def _run() -> None:
+            await asyncio.sleep(delay)
+            order.append(key)
+
+        return _run
+
+    graph = TaskGraph(limits={})
+    graph.add("chapter:fast", "chapter", _task("chapter:fast", 0.01))
+    graph.add("chapter:slow", "chapter", _task("chapter:slow", 0.2))
+    graph.add("shard:fast", "synthesis", _task("shard:fast", 0.0), deps=["chapter:fast"])
+    graph.add("final", "synthesis", _task("final", 0.0), deps=["chapter:slow", "shard:fast"])
+    asyncio.run(graph.run())
+
+    assert order == ["chapter:fast", "shard:fast", "chapter:slow", "final"]
+
+
+def test_stage_limits_and_failures() -> None:
+    active = 0
+    peak = 0
+    settled: list[str] = []
+
+    async def _work() -> None:
+        nonlocal active, peak
+        active += 1
+        peak = max(peak, active)
+        await asyncio.sleep(0.01)
+        active -= 1
+
+    async def _boom() -> None:
+        raise RuntimeError("quota")
+
+    async def _main() -> TaskGraph:
+        graph = TaskGraph(limits={"chapter": asyncio.Semaphore(2)})
+        for idx in range(6):
+            graph.add(f"chapter:{idx}", "chapter", _work)
+        graph.add("chapter:bad", "chapter", _boom)
+        graph.add("synthesis", "synthesis", _work, deps=["chapter:bad", "chapter:0"])
+        await graph.run(on_done=lambda task, error: settled.append(task.key))
+        return graph
+
+    graph = asyncio.run(_main())
+    assert peak == 2
+    assert list(graph.failed) == ["chapter:bad"]
+    assert settled[-1] == "synthesis"
+
+
+def test_cycle_detection() -> None:
+    async def _noop() -> None:
+        return None
+
+    graph = TaskGraph(limits={})
+    graph.add("a", "x", _noop, deps=["b"])
+    graph.add("b", "x", _noop, deps=["a"])
+    with pytest.raises(ValueError):
+        asyncio.run(graph.run())
@@ -0,0 +1,81 @@
+import subprocess
+import sys
+from pathlib import Path
+from typing import Dict
+
+import pytest
+
+from storylint_adk.runtime import adk_client
+
+PROJECT = Path(__file__).resolve().parents[1]
+# Cumulative `-X importtime` of storylint_adk.cli. A whole `python -c "import storylint_adk.cli"`
+# measured 460 ms (best of 7, interpreter start-up included), so the import alone stays below
+# that; 800 ms leaves headroom for slower machines. The agent stack adds more than a second,
+# so a regression still fails.
+STARTUP_BUDGET_US = 800_000
+# Only model-calling commands and interactive prompts may import these.
+DEFERRED = (
+    "google.adk",
+    "google.genai",
+    "storylint_adk.agents",
+    "storylint_adk.runtime.runner",
+    "storylint_adk.runtime.adk_client",
+    "questionary",
+    "prompt_toolkit",
+    "rich",
+    "dotenv",
+    "asyncio",
+)
+# Makes every google.adk/google.genai import fail, as if google-adk were not installed.
+WITHOUT_ADK = "import sys; sys.modules['google.adk'] = sys.modules['google.genai'] = None\n"
+
+
+def _python(code: str) -> subprocess.CompletedProcess:
+    return subprocess.run([sys.executable, "-X", "importtime", "-c", code], cwd=PROJECT, capture_output=True, text=True)
+
+
+def _import_times(stderr: str) -> Dict[str, int]:
+    """Module name -> cumulative microseconds, from ``-X importtime`` output."""
+    times = {}
+    for line in stderr.splitlines():
+        if line.startswith("import time:") and "|" in line:
+            _, cumulative, name = line.split("|")
+            if cumulative.strip().isdigit():
+                times[name.strip()] = int(cumulative)
+    return times
+
+
+def test_cli_import_defers_the_agent_stack_and_stays_in_budget() -> None:
+    times = _import_times(_python("import storylint_adk.cli").stderr)
+    loaded = sorted(name for name in times if name.startswith(DEFERRED))
+    assert loaded == []
+    assert times["storylint_adk.cli"] < STARTUP_BUDGET_US
+
+
+def test_offline_commands_work_without_google_adk() -> None:
+    code = WITHOUT_ADK + "from storylint_adk.cli import app\napp(['check', '--help'])\n"
+    outcome = _python(code)
+    assert outcome.returncode == 0, outcome.stderr[-2000:]
+    assert "--fail-on" in outcome.stdout
+
+    outcome = _python(WITHOUT_ADK + "import storylint_adk.runtime.adk_client\n")
+    assert outcome.returncode == 0, outcome.stderr[-2000:]
+
+
+def test_building_a_runner_without_google_adk_explains_the_install(monkeypatch) -> None:
+    monkeypatch.setitem(sys.modules, "google.adk.runners", None)
+    with pytest.raises(RuntimeError, match="pip install google-adk"):
+        adk_client.AgentRunnerPool().agent(lambda model: object(), "gemini-3-flash-preview")
+
+
+def test_offline_bench_works_without_google_adk(tmp_path) -> None:
+    code = WITHOUT_ADK + (
+        "from pathlib import Path\n"
+        "from storylint_adk.runtime.bench import run_bench\n"
+        "from storylint_adk.runtime.simulated import SimulationProfile\n"
+        "from storylint_adk.tools.synthetic import CorpusSpec\n"
+        f"[result] = run_bench(CorpusSpec(chapters=2, scenes_per_chapter=2, paragraphs_per_scene=2), SimulationProfile(median_sec=0, seed=0), workdir=Path({str(tmp_path)!r}))\n"
+        "assert result.calls and not result.failed_calls, result\n"
+    )
+    outcome = _python(code)
+    assert outcome.returncode == 0, outcome.stderr[-2000:]
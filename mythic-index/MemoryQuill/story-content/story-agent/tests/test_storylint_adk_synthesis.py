@@ -0,0 +1,26 @@
+from pathlib import Path
+
+from storylint_adk.runtime.synthesis import ROOT_KEY, build_synthesis_tree
+
+
+def test_small_runs_use_single_flat_synthesis() -> None:
+    nodes = build_synthesis_tree(["ch01", "ch02", "ch03"], fan_in=8)
+    assert [node.key for node in nodes] == [ROOT_KEY]
+    assert nodes[0].deps == ["chapter:ch01", "chapter:ch02", "chapter:ch03"]
+    assert build_synthesis_tree(["ch01"] * 20, fan_in=0)[0].is_root
+
+
+def test_tree_depth_is_logarithmic_and_batches_depend_on_their_chapters(tmp_path: Path) -> None:
+    slugs = [f"ch{idx:02d}" for idx in range(1, 46)]
+    nodes = build_synthesis_tree(slugs, fan_in=3)
+    by_key = {node.key: node for node in nodes}
+    root = nodes[-1]
+
+    assert root.is_root and root.level == 4  # 45 chapters -> 15 -> 5 -> 2 plans -> root
+    assert len([node for node in nodes if node.level == 1]) == 15
+    assert by_key["synthesis:l1-000"].deps == ["chapter:ch01", "chapter:ch02", "chapter:ch03"]
+    assert by_key["synthesis:l2-000"].deps == ["synthesis:l1-000", "synthesis:l1-001", "synthesis:l1-002"]
+    assert len(root.inputs) <= 3
+    assert all(dep in by_key for node in nodes for dep in node.deps if dep.startswith("synthesis"))
+    assert by_key["synthesis:l2-000"].input_paths(tmp_path)[0] == tmp_path / "synthesis" / "l1-000.plan.json"
+    assert root.output_path(tmp_path) == tmp_path / "final" / "action-plan.json"
@@ -0,0 +1,84 @@
+import importlib.util
+import sys
+from pathlib import Path
+
+import pytest
+
+from storylint_adk.config import StorylintConfig
+from storylint_adk.parser.scene_parser import parse_chapter
+from storylint_adk.tools.repo_tools import discover_chapters, discover_repo_map, validate_imagery, validate_slugs
+from storylint_adk.tools.synthetic import CorpusSpec, generate_corpus, placeholder_png
+
+SMALL = CorpusSpec(chapters=12, scenes_per_chapter=3, paragraphs_per_scene=4, characters=8, locations=4, seed=7)
+
+
+def corpus_config(root: Path) -> StorylintConfig:
+    return StorylintConfig(
+        project_root=root,
+        chapters_dir=Path("chapters"),
+        characters_dir=Path("characters"),
+        locations_dir=Path("locations"),
+    )
+
+
+def test_generated_tree_is_valid_for_the_tooling(synthetic_corpus) -> None:
+    stats = synthetic_corpus(SMALL)
+    cfg = corpus_config(stats.root)
+    paths = discover_chapters(cfg)
+    assert [path.parent.name[:4] for path in paths] == [f"ch{n:02d}" for n in range(1, 13)]
+
+    for path in paths:
+        chapter = parse_chapter(path, cfg)
+        assert len(chapter.scenes) == 3
+        assert all(len(scene.paragraphs) == 4 and scene.meta.images for scene in chapter.scenes)
+        assert validate_slugs(chapter, cfg) == []
+        assert validate_imagery(chapter, cfg) == []
+
+    repo_map = discover_repo_map(stats.root)
+    assert repo_map.chapters_dir == stats.root / "chapters"
+    assert repo_map.characters_dir == stats.root / "characters"
+    assert (stats.chapters, stats.characters, stats.locations) == (12, 8, 4)
+
+
+def test_same_spec_gives_same_tree(tmp_path) -> None:
+    spec = CorpusSpec(chapters=3, scenes_per_chapter=2, paragraphs_per_scene=2, characters=3, locations=2, seed=5)
+    first = generate_corpus(tmp_path / "a", spec)
+    second = generate_corpus(tmp_path / "b", spec)
+    files = sorted(path.relative_to(first.root) for path in first.root.rglob("*") if path.is_file())
+    assert files == sorted(path.relative_to(second.root) for path in second.root.rglob("*") if path.is_file())
+    assert all((first.root / name).read_bytes() == (second.root / name).read_bytes() for name in files)
+
+
+def test_missing_images_are_reported(tmp_path) -> None:
+    stats = generate_corpus(tmp_path, CorpusSpec(chapters=2, paragraphs_per_scene=1, missing_image_rate=1.0, seed=1))
+    cfg = corpus_config(tmp_path)
+    issues = [issue for path in discover_chapters(cfg) for issue in validate_imagery(parse_chapter(path, cfg), cfg)]
+    assert stats.missing_images == 12
+    assert sum(issue.severity == "moderate" for issue in issues) == 12
+
+
+def test_scaled_spec_and_placeholder_size() -> None:
+    spec = CorpusSpec.scaled(10, scenes_per_chapter=2)
+    assert (spec.chapters, spec.characters, spec.locations, spec.scenes_per_chapter) == (450, 580, 330, 2)
+    image = placeholder_png(4096)
+    assert image.startswith(b"\x89PNG") and len(image) == 4096
+
+
+def test_rebuild_image_links_reads_generated_imagery(synthetic_corpus) -> None:
+    script = Path(__file__).resolve().parents[4] / "tools" / "rebuild_image_links.py"
+    if not script.exists():
+        pytest.skip("rebuild_image_links.py is not part of this checkout")
+    spec = importlib.util.spec_from_file_location("rebuild_image_links", script)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = module  # dataclass resolution looks the module up by name
+    try:
+        spec.loader.exec_module(module)
+    finally:
+        sys.modules.pop(spec.name, None)
+
+    root = synthetic_corpus(SMALL).root
+    imagery = sorted((root / "chapters").glob("*/imagery.yaml"))[0]
+    kind, slug, entries = module.parse_imagery_yaml_minimal(imagery)
+    assert (kind, slug) == ("chapter", imagery.parent.name)
+    assert [entry.scene_slug for entry in entries] == ["scn-01-01", "scn-01-02", "scn-01-03"]
+    assert all((root / entry.storage_path).exists() for entry in entries)
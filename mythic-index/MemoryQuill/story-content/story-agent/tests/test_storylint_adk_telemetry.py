@@ -0,0 +1,40 @@
+from pathlib import Path
+
+from storylint_adk.runtime.telemetry import CallRecord, TelemetryLedger, load_records, percentile, summarize
+
+
+def _call(stage: str, latency: float, start: float, **fields) -> CallRecord:
+    record = CallRecord(stage=stage, task=f"{stage}:x", model="flash", prompt_chars=400, prompt_tokens_est=100)
+    record.started_at = start
+    record.latency_sec = record.wall_sec = latency
+    record.attempts = fields.pop("attempts", 1)
+    record.ok = fields.pop("ok", True)
+    for key, value in fields.items():
+        setattr(record, key, value)
+    return record
+
+
+def test_percentile_nearest_rank() -> None:
+    values = [float(value) for value in range(1, 101)]
+    assert percentile(values, 50) == 50.0
+    assert percentile(values, 95) == 95.0
+    assert percentile([], 95) == 0.0
+
+
+def test_ledger_round_trip_and_stage_summary(tmp_path: Path) -> None:
+    ledger = TelemetryLedger.for_run(tmp_path)
+    ledger.record(_call("chapter", 1.0, 0.0, output_tokens=300))
+    ledger.record(_call("chapter", 3.0, 10.0, attempts=2, output_tokens=300))
+    ledger.record(_call("chapter", 0.0, 20.0, cached=True))
+    ledger.record(_call("chapter", 2.0, 55.0, ok=False, attempts=3, error_class="ValueError"))
+    ledger.record(_call("arc", 5.0, 0.0))
+    ledger.close()
+
+    records = load_records(tmp_path / "final" / "telemetry.jsonl")
+    assert len(records) == 5
+    summaries = {item.stage: item for item in summarize(records)}
+    chapter = summaries["chapter"]
+    assert (chapter.calls, chapter.cached, chapter.failed, chapter.retries) == (4, 1, 1, 3)
+    assert (chapter.p50_sec, chapter.p95_sec) == (1.0, 3.0)
+    assert chapter.calls_per_min == 4.2  # 4 calls over 57 seconds
+    assert summaries["arc"].p95_sec == 5.0
@@ -0,0 +1,82 @@
+import os
+from pathlib import Path
+
+import pytest
+import yaml
+
+from storylint_adk.config import StorylintConfig
+from storylint_adk.parser.scene_parser import parse_chapter
+from storylint_adk.parser.yaml_cache import YamlCache, safe_load
+from storylint_adk.tools.repo_tools import discover_chapters, validate_imagery
+from storylint_adk.tools.synthetic import CorpusSpec, generate_corpus
+
+IMAGERY = """entity_type: chapter
+generated_images:
+  - custom_id: ch01-gate-01
+    file_path: chapters/ch01-gate/images/gate.png
+    provider_metadata: {seed: 7, tags: [gate, dawn]}
+"""
+
+
+def _imagery(tmp_path: Path, text: str = IMAGERY) -> Path:
+    path = tmp_path / "imagery.yaml"
+    path.write_text(text)
+    return path
+
+
+def test_warm_load_skips_parsing_and_returns_fresh_documents(tmp_path: Path) -> None:
+    path = _imagery(tmp_path)
+    cold = YamlCache(tmp_path / "cache")
+    assert cold.load(path) == yaml.safe_load(IMAGERY) == safe_load(IMAGERY)
+
+    warm = YamlCache(tmp_path / "cache")
+    document = warm.load(path)
+    document["generated_images"].clear()
+    assert warm.load(path) == yaml.safe_load(IMAGERY)
+    assert (cold.stats.misses, warm.stats.hits, warm.stats.misses) == (1, 2, 0)
+
+
+def test_touched_file_is_rehashed_and_edited_file_reparsed(tmp_path: Path) -> None:
+    path = _imagery(tmp_path)
+    cache = YamlCache(tmp_path / "cache")
+    cache.load(path)
+
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 5_000_000_000))
+    cache.load(path)
+    cache.load(path)
+    assert (cache.stats.rehashed, cache.stats.hits) == (1, 1)
+
+    _imagery(tmp_path, IMAGERY.replace("seed: 7", "seed: 8"))
+    assert cache.load(path)["generated_images"][0]["provider_metadata"]["seed"] == 8
+    assert cache.stats.misses == 2
+
+
+def test_parse_errors_are_cached_and_unmarshallable_documents_are_not(tmp_path: Path) -> None:
+    broken = _imagery(tmp_path, "slug: a\ngenerated_images: [unclosed\n")
+    cache = YamlCache(tmp_path / "cache")
+    for _ in range(2):
+        with pytest.raises(yaml.YAMLError):
+            cache.load(broken)
+    assert (cache.stats.misses, cache.stats.hits) == (1, 1)
+
+    dated = _imagery(tmp_path, "generated_at: 2025-01-02T03:04:05Z\n")
+    assert cache.load(dated) == cache.load(dated) == yaml.safe_load(dated.read_text())
+    assert cache.stats.misses == 3 and cache.stats.writes == 1
+
+
+@pytest.mark.parametrize("persist", [True, False])
+def test_validate_imagery_reads_through_the_cache(tmp_path: Path, persist: bool) -> None:
+    generate_corpus(tmp_path, CorpusSpec(chapters=3, scenes_per_chapter=1, characters=2, locations=1, missing_image_rate=0.5, seed=5))
+    cfg = StorylintConfig(
+        project_root=tmp_path,
+        chapters_dir=Path("chapters"),
+        characters_dir=Path("characters"),
+        locations_dir=Path("locations"),
+    )
+    cfg.cache.persist_yaml = persist
+    chapters = [parse_chapter(path, cfg) for path in discover_chapters(cfg)]
+    cold = [validate_imagery(chapter, cfg) for chapter in chapters]
+    assert [validate_imagery(chapter, cfg) for chapter in chapters] == cold
+    entries = list((cfg.cache.dir / "yaml").glob("*.bin"))
+    assert len(entries) == (sum(1 for _ in tmp_path.glob("chapters/*/imagery.yaml")) if persist else 0)
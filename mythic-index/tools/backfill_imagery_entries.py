@@ -5,6 +5,8 @@ from typing import Dict, List, Set
 
 import yaml
 
+from storylint_helpers import open_yaml_loader
+
 
 STORY_ROOT = Path("mythic-index/MemoryQuill/story-content/characters")
 IMAGE_EXTS = {".png", ".jpg", ".jpeg", ".webp", ".gif"}
@@ -19,8 +21,7 @@ class ImageryFileSet:
 def load_imagery_yaml(yaml_path: Path) -> Dict:
 	if not yaml_path.exists():
 		return {}
-	with yaml_path.open("r", encoding="utf-8") as fh:
-		return yaml.safe_load(fh) or {}
+	return open_yaml_loader(STORY_ROOT.parent)(yaml_path) or {}
 
 
 def collect_file_sets(character_dir: Path) -> ImageryFileSet:
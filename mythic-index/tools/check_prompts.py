@@ -1,9 +1,14 @@
-import yaml
 from pathlib import Path
 
-chars_dir = Path("MemoryQuill/story-content/characters")
+from storylint_helpers import open_yaml_loader
+
+story_content = Path("MemoryQuill/story-content")
+chars_dir = story_content / "characters"
+# storylint's shared YAML cache when story-agent is importable, else libyaml if available
+load_yaml = open_yaml_loader(story_content)
+
 for f in sorted(chars_dir.glob("*/imagery.yaml")):
-    data = yaml.safe_load(f.read_text())
+    data = load_yaml(f)
     prompts = data.get("prompts", [])
     appearance = data.get("appearance", "")
     if prompts:
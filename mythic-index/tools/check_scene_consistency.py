@@ -11,11 +11,11 @@ Checks:
 4. Character and location references are valid
 """
 
-import re
 import sys
 from pathlib import Path
 from typing import Dict, List, Set, Tuple
-import yaml
+
+from storylint_helpers import open_scene_index, open_yaml_loader, plain_yaml
 
 
 class SceneFence:
@@ -50,79 +50,55 @@ class ImageryEntry:
         return f"ImageryEntry({self.slug}, scene={self.scene})"
 
 
-def parse_scene_fences(content_path: Path) -> List[SceneFence]:
-    """Parse SCENE-START/END fences from content.md"""
-    if not content_path.exists():
-        return []
-
-    fences = []
-    content = content_path.read_text(encoding='utf-8')
-    lines = content.split('\n')
-
-    # Pattern: <!-- SCENE-START id:scn-XX-YY title:"..." location:"..." characters:["..."] ... -->
-    start_pattern = re.compile(
-        r'<!--\s*SCENE-START\s+'
-        r'id:(?P<id>[\w-]+)\s+'
-        r'title:"(?P<title>[^"]+)"\s*'
-        r'.*?'
-        r'location:"(?P<location>[\w-]+)"\s*'
-        r'.*?'
-        r'characters:\[(?P<characters>[^\]]*)\]'
-    , re.DOTALL)
-
-    end_pattern = re.compile(r'<!--\s*SCENE-END\s+id:([\w-]+)\s*-->')
-
-    current_fence = None
-
-    for line_num, line in enumerate(lines, start=1):
-        # Check for SCENE-START
-        start_match = start_pattern.search(line)
-        if start_match:
-            scene_id = start_match.group('id')
-            title = start_match.group('title')
-            location = start_match.group('location')
-            characters_str = start_match.group('characters')
-
-            # Parse character array
-            characters = []
-            if characters_str.strip():
-                characters = [c.strip(' "\'') for c in characters_str.split(',')]
-
-            current_fence = {
-                'scene_id': scene_id,
-                'title': title,
-                'location': location,
-                'characters': characters,
-                'line_start': line_num
-            }
-            continue
-
-        # Check for SCENE-END
-        end_match = end_pattern.search(line)
-        if end_match and current_fence:
-            scene_id = end_match.group(1)
-
-            if scene_id == current_fence['scene_id']:
-                fences.append(SceneFence(
-                    scene_id=current_fence['scene_id'],
-                    title=current_fence['title'],
-                    location=current_fence['location'],
-                    characters=current_fence['characters'],
-                    line_start=current_fence['line_start'],
-                    line_end=line_num
-                ))
-                current_fence = None
-
-    return fences
-
-
-def parse_imagery_entries(imagery_path: Path) -> List[ImageryEntry]:
-    """Parse imagery entries from imagery.yaml"""
+def scene_fences_from_index(index, chapter_slug: str) -> List[SceneFence]:
+    """Scene fences of one chapter as recorded in the scene index (no file reads)."""
+    return [
+        SceneFence(
+            scene_id=scene.scene_id,
+            title=scene.title,
+            location=scene.location or "",
+            characters=list(scene.characters),
+            line_start=scene.meta_start_line,
+            line_end=scene.end_line,
+        )
+        for scene in index.scenes(chapter=chapter_slug, top_level=True)
+    ]
+
+
+def parse_imagery_entries(imagery_path: Path, load_yaml=plain_yaml) -> List[ImageryEntry]:
+    """Parse imagery entries from imagery.yaml
+
+    Chapter imagery files are mappings whose `moments` and `images` lists
+    reference scenes by `scene_id`; a flat list of entries with a `scene`
+    key is still accepted.
+    """
     if not imagery_path.exists():
         return []
 
-    with open(imagery_path, 'r', encoding='utf-8') as f:
-        data = yaml.safe_load(f)
+    data = load_yaml(imagery_path)
+
+    if isinstance(data, dict):
+        chapter = (data.get('metadata') or {}).get('slug', '')
+        entries = []
+        for moment in data.get('moments') or []:
+            entries.append(ImageryEntry(
+                slug=moment.get('id', ''),
+                title=moment.get('title', ''),
+                scene=moment.get('scene_id', ''),
+                chapter=chapter,
+                characters=moment.get('characters_present') or [],
+                location=moment.get('location_zone', '')
+            ))
+        for image in data.get('images') or []:
+            entries.append(ImageryEntry(
+                slug=image.get('custom_id', ''),
+                title=image.get('title', ''),
+                scene=image.get('scene_id', ''),
+                chapter=chapter,
+                characters=image.get('depicts_characters') or [],
+                location=image.get('location', '')
+            ))
+        return entries
 
     if not data or not isinstance(data, list):
         return []
@@ -141,15 +117,14 @@ def parse_imagery_entries(imagery_path: Path) -> List[ImageryEntry]:
     return entries
 
 
-def check_chapter_consistency(chapter_dir: Path) -> Dict[str, any]:
-    """Check consistency for a single chapter"""
+def check_chapter_consistency(chapter_dir: Path, index, load_yaml=plain_yaml) -> Dict[str, any]:
+    """Check consistency for a single chapter, reading its fences from the scene index"""
     chapter_name = chapter_dir.name
-    content_path = chapter_dir / "content.md"
     imagery_path = chapter_dir / "imagery.yaml"
 
-    # Parse both files
-    fences = parse_scene_fences(content_path)
-    entries = parse_imagery_entries(imagery_path)
+    # Fences as storylint parses them (multi-line SCENE-START comments included)
+    fences = scene_fences_from_index(index, chapter_name)
+    entries = parse_imagery_entries(imagery_path, load_yaml)
 
     # Build scene ID sets
     fence_ids = {f.scene_id for f in fences}
@@ -198,6 +173,13 @@ def main():
     print("=" * 80)
     print()
 
+    # Scene fences come only from storylint's parser, so results never depend on which reader ran
+    index = open_scene_index(story_content)
+    if index is None:
+        print(f"❌ Cannot import storylint_adk from {story_content / 'story-agent'}; install its requirements")
+        return 1
+    load_yaml = open_yaml_loader(story_content)
+
     all_results = []
     chapters_with_issues = []
 
@@ -209,7 +191,7 @@ def main():
         if not (chapter_dir / "content.md").exists():
             continue
 
-        result = check_chapter_consistency(chapter_dir)
+        result = check_chapter_consistency(chapter_dir, index, load_yaml)
         all_results.append(result)
 
         if result['has_issues']:
@@ -3,7 +3,7 @@
 Consolidate imagery.yaml scene slugs to match database scn-XX-YY format.
 
 This script:
-1. Extracts scenes from content.md files (SCENE-START comments with id:scn-XX-YY title:"...")
+1. Reads scenes (id:scn-XX-YY title:"...") from storylint's scene index of content.md files
 2. Extracts scene references from imagery.yaml files (slug: ch1-xxx, title: "...")
 3. Matches by title using fuzzy string matching
 4. Outputs a mapping file and optionally updates imagery.yaml files
@@ -17,6 +17,8 @@ from difflib import SequenceMatcher
 from dataclasses import dataclass, field
 from typing import Optional
 
+from storylint_helpers import open_scene_index
+
 # Try to import yaml, fall back to basic parsing if unavailable
 try:
     import yaml
@@ -64,30 +66,17 @@ def similarity_ratio(s1: str, s2: str) -> float:
     return SequenceMatcher(None, normalize_title(s1), normalize_title(s2)).ratio()
 
 
-def extract_scenes_from_content_md(content_path: Path) -> list[DBScene]:
-    """Extract scenes from content.md SCENE-START comments"""
-    scenes = []
-    content_slug = content_path.parent.name
-
-    try:
-        text = content_path.read_text(encoding='utf-8')
-    except Exception as e:
-        print(f"  Error reading {content_path}: {e}")
-        return scenes
-
-    # Pattern: <!-- SCENE-START id:scn-XX-YY title:"Title Here"
-    pattern = r'<!--\s*SCENE-START\s+id:(scn-\d+-\d+)\s+title:"([^"]+)"'
-
-    for match in re.finditer(pattern, text):
-        scene_id = match.group(1)
-        title = match.group(2)
-        scenes.append(DBScene(
-            content_slug=content_slug,
-            scene_id=scene_id,
-            title=title
-        ))
-
-    return scenes
+def db_scenes_from_index(index) -> dict[str, list[DBScene]]:
+    """Titled scn-XX-YY scenes of every top-level chapter, keyed by chapter slug, from the scene index"""
+    db_scenes: dict[str, list[DBScene]] = {}
+    for scene in index.scenes(top_level=True):
+        if re.fullmatch(r'scn-\d+-\d+', scene.scene_id) and scene.title:
+            db_scenes.setdefault(scene.chapter, []).append(DBScene(
+                content_slug=scene.chapter,
+                scene_id=scene.scene_id,
+                title=scene.title
+            ))
+    return db_scenes
 
 
 def extract_scenes_from_imagery_yaml(yaml_path: Path) -> list[ImageryScene]:
@@ -254,18 +243,16 @@ def main():
         print(f"Error: chapters directory not found: {chapters_dir}")
         sys.exit(1)
 
-    # Collect DB scenes from content.md files
-    print("Extracting scenes from content.md files...")
-    db_scenes: dict[str, list[DBScene]] = {}
-    for chapter_dir in sorted(chapters_dir.iterdir()):
-        if not chapter_dir.is_dir():
-            continue
-        content_md = chapter_dir / 'content.md'
-        if content_md.exists():
-            scenes = extract_scenes_from_content_md(content_md)
-            if scenes:
-                db_scenes[chapter_dir.name] = scenes
-                print(f"  {chapter_dir.name}: {len(scenes)} scenes")
+    # Collect DB scenes from the scene index only: --remove-unmatched deletes imagery
+    # references, so the scene list must not depend on which reader ran
+    index = open_scene_index(story_content)
+    if index is None:
+        print(f"Error: cannot import storylint_adk from {story_content / 'story-agent'}; install its requirements")
+        sys.exit(1)
+    print("Reading scenes from the storylint scene index...")
+    db_scenes = db_scenes_from_index(index)
+    for content_slug, scenes in db_scenes.items():
+        print(f"  {content_slug}: {len(scenes)} scenes")
 
     # Collect imagery scenes from imagery.yaml files
     print("\nExtracting scenes from imagery.yaml files...")
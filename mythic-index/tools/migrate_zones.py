@@ -23,6 +23,8 @@ from pathlib import Path
 from datetime import datetime
 from typing import Dict, List, Tuple, Any, Set
 
+from storylint_helpers import open_scene_index
+
 # Paths
 STORY_CONTENT_DIR = Path("MemoryQuill/story-content")
 LOCATIONS_DIR = STORY_CONTENT_DIR / "locations"
@@ -260,13 +262,17 @@ def get_location_name(location_dir: Path, location_slug: str) -> str:
 # ============================================================================
 
 
-def find_location_chapter_data(location_slug: str) -> Tuple[Set[str], List[str], Dict[str, List[str]]]:
+def find_location_chapter_data(location_slug: str, index=None) -> Tuple[Set[str], List[str], Dict[str, List[str]]]:
     """
     Scan all chapter content.md files for scenes referencing this location.
     Extract zone slugs, track which chapters feature this location, and map zones to chapters.
 
+    With a scene index (see open_scene_index) the same data comes from two indexed
+    queries instead of a scan of every chapter.
+
     Args:
         location_slug: The location to search for
+        index: Optional SceneIndex to query instead of scanning files
 
     Returns:
         Tuple of:
@@ -274,6 +280,11 @@ def find_location_chapter_data(location_slug: str) -> Tuple[Set[str], List[str],
         - List of chapter slugs that reference this location (in chapter order)
         - Dict mapping zone slug → list of chapter slugs that feature that zone
     """
+    if index is not None:
+        zone_to_chapters = index.location_zones(location_slug, top_level=True)
+        chapter_slugs = index.chapters_referencing_location(location_slug, frontmatter=False, top_level=True)
+        return set(zone_to_chapters), chapter_slugs, zone_to_chapters
+
     zone_slugs = set()
     chapter_slugs = []
     zone_to_chapters: Dict[str, List[str]] = {}  # Maps zone slug to chapters that use it
@@ -336,7 +347,7 @@ def find_location_chapter_data(location_slug: str) -> Tuple[Set[str], List[str],
 # ============================================================================
 
 
-def consolidate_zones(location_dir: Path, location_slug: str, location_name: str) -> Dict[str, Any]:
+def consolidate_zones(location_dir: Path, location_slug: str, location_name: str, index=None) -> Dict[str, Any]:
     """
     Consolidate zones from all three sources.
 
@@ -349,6 +360,7 @@ def consolidate_zones(location_dir: Path, location_slug: str, location_name: str
         location_dir: Path to location directory
         location_slug: The location's slug
         location_name: Human-readable location name
+        index: Optional SceneIndex for the chapter scene markers
 
     Returns:
         Dictionary with metadata and zones for zones.yaml
@@ -356,7 +368,7 @@ def consolidate_zones(location_dir: Path, location_slug: str, location_name: str
     # 1. Parse all sources
     analysis_zones = parse_location_analysis_zones(location_dir)
     imagery_zones = parse_imagery_zones(location_dir)
-    chapter_zone_slugs, chapter_list, zone_to_chapters = find_location_chapter_data(location_slug)
+    chapter_zone_slugs, chapter_list, zone_to_chapters = find_location_chapter_data(location_slug, index)
 
     # 2. Collect all unique zone slugs
     zone_slugs: Set[str] = set()
@@ -455,6 +467,11 @@ def migrate_all_locations(story_content_dir: Path, dry_run: bool = False, specif
     else:
         location_dirs = sorted([d for d in locations_dir.iterdir() if d.is_dir()])
 
+    # One index for all locations instead of a chapter scan per location
+    index = open_scene_index(STORY_CONTENT_DIR)
+    if index is None:
+        print("storylint_adk not importable; scanning chapter files for each location")
+
     # Process each location
     processed = 0
     created = 0
@@ -468,7 +485,7 @@ def migrate_all_locations(story_content_dir: Path, dry_run: bool = False, specif
             location_name = get_location_name(location_dir, location_slug)
 
             # Consolidate zones from all sources
-            zones_data = consolidate_zones(location_dir, location_slug, location_name)
+            zones_data = consolidate_zones(location_dir, location_slug, location_name, index)
 
             # Skip if no zones found
             if zones_data['metadata']['zone_count'] == 0:
@@ -0,0 +1,58 @@
+"""
+Shared access to storylint_adk for the maintenance scripts.
+
+storylint lives in MemoryQuill/story-content/story-agent and is not installed as a
+package, so every script that uses it goes through import_storylint, which puts that
+directory on sys.path once.
+"""
+
+import sys
+from functools import lru_cache
+from pathlib import Path
+
+
+def import_storylint(story_content: Path) -> bool:
+    """Make storylint_adk (story_content/story-agent) importable; False if it still can't be imported."""
+    agent_dir = str((story_content / 'story-agent').resolve())
+    if agent_dir not in sys.path:
+        sys.path.insert(0, agent_dir)
+    try:
+        import storylint_adk  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def open_scene_index(story_content: Path):
+    """storylint's refreshed SQLite scene index for story_content, or None if storylint_adk can't be imported."""
+    if not import_storylint(story_content):
+        return None
+    try:
+        from storylint_adk.store.scene_index import SceneIndex
+    except ImportError:
+        return None
+    return SceneIndex.for_story_content(story_content.resolve())
+
+
+def plain_yaml(path: Path):
+    """Parse a YAML file with libyaml when PyYAML was built with it."""
+    import yaml
+
+    return yaml.load(path.read_bytes(), Loader=getattr(yaml, 'CSafeLoader', yaml.SafeLoader))
+
+
+@lru_cache(maxsize=None)
+def open_yaml_loader(story_content: Path):
+    """
+    A path -> document YAML loader for the files under story_content.
+
+    It reads through storylint's parsed-YAML cache in story_content/.storylint-cache, or is
+    plain_yaml if storylint_adk can't be imported. Both return a fresh document on every
+    call, so callers may modify it before writing it back.
+    """
+    if not import_storylint(story_content):
+        return plain_yaml
+    from storylint_adk.parser.yaml_cache import load_yaml
+
+    cache_dir = (story_content / '.storylint-cache').resolve()
+    return lambda path: load_yaml(path, cache_dir)
@@ -1,16 +1,19 @@
 import os
-import yaml
+import sys
 import re
 from pathlib import Path
 
 BASE_DIR = Path("mythic-index/MemoryQuill/story-content")
 
+# Shared helpers of the mythic-index maintenance scripts (storylint's YAML cache)
+sys.path.insert(0, str(Path("mythic-index/tools").resolve()))
+from storylint_helpers import open_yaml_loader
+
 def load_yaml(path):
     if not path.exists():
         return None
     try:
-        with open(path, 'r', encoding='utf-8') as f:
-            return yaml.safe_load(f)
+        return open_yaml_loader(BASE_DIR)(path)
     except Exception as e:
         # print(f"Error reading {path}: {e}") # Suppress error for cleaner output, we'll try regex
         return None